@@ -1,13 +1,26 @@
 # /app.py
 
+# Imported first so its clock covers the imports below
+from utils import startup_report
+
+import importlib
+
 import customtkinter as ctk
-from gui.error_frame import ErrorFrame
-from gui.linear_systems_frame import LinearSystemsFrame
-from gui.zeros_frames import ZerosFrame
-# Importando os novos módulos
-from gui.interpolation_frame import InterpolationFrame
-from gui.least_squares_frame import LeastSquaresFrame
-from gui.integration_frame import IntegrationFrame
+
+from utils.jobs import get_executor
+
+startup_report.mark("imports")
+
+# Frames are imported and built on first use, so tabs that are never opened
+# never load matplotlib, sympy or scipy
+FRAME_CLASSES = {
+    "errors": ("gui.error_frame", "ErrorFrame"),
+    "zeros": ("gui.zeros_frames", "ZerosFrame"),
+    "linear": ("gui.linear_systems_frame", "LinearSystemsFrame"),
+    "interp": ("gui.interpolation_frame", "InterpolationFrame"),
+    "least_sq": ("gui.least_squares_frame", "LeastSquaresFrame"),
+    "integration": ("gui.integration_frame", "IntegrationFrame"),
+}
 
 class App(ctk.CTk):
     def __init__(self):
@@ -49,20 +62,39 @@ class App(ctk.CTk):
             self.sidebar_buttons[name] = btn
 
         # --- CONTENT FRAMES ---
+        # Filled lazily by get_frame
         self.frames = {}
-        # Create an instance of each frame
-        self.frames["errors"] = ErrorFrame(self)
-        self.frames["zeros"] = ZerosFrame(self)
-        self.frames["linear"] = LinearSystemsFrame(self)
-        self.frames["interp"] = InterpolationFrame(self)
-        self.frames["least_sq"] = LeastSquaresFrame(self)
-        self.frames["integration"] = IntegrationFrame(self)
 
         # --- SET INITIAL FRAME ---
         self.select_frame_by_name("errors")
         
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Frames run their computations on the shared executor; results come back through after()
+        get_executor().attach(self)
+
+        startup_report.mark("window built")
+        self.after(0, self._on_first_paint)
+
+    def _on_first_paint(self):
+        self.update_idletasks()
+        startup_report.mark("first paint")
+        if startup_report.enabled():
+            print(startup_report.report())
+
+    def get_frame(self, name):
+        """Returns the frame called name, importing and building it on first use."""
+        frame = self.frames.get(name)
+        if frame is None:
+            module_name, class_name = FRAME_CLASSES[name]
+            frame_class = getattr(importlib.import_module(module_name), class_name)
+            frame = frame_class(self)
+            self.frames[name] = frame
+            startup_report.mark(f"frame '{name}' built")
+            if startup_report.enabled() and name != "errors":
+                print(startup_report.report())
+        return frame
+
     def select_frame_by_name(self, name):
         # Reset button styles
         for btn_name, btn in self.sidebar_buttons.items():
@@ -77,10 +109,11 @@ class App(ctk.CTk):
                 frame.grid_forget()
 
         # Show the selected frame
-        selected_frame = self.frames[name]
+        selected_frame = self.get_frame(name)
         selected_frame.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
 
     def on_closing(self):
+        get_executor().shutdown()
         self.quit()
 
 if __name__ == "__main__":
@@ -1,11 +1,19 @@
 # /gui/error_frame.py
 
+from tkinter import filedialog
+
 import customtkinter as ctk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
 import math
-from utils.ieee754_converter import get_float_details
+from numcalc.errors import analyze_float, analyze_file, CLASSES
+from numcalc.matrix_io import SUPPORTED_EXTENSIONS
+from utils.jobs import run_for_textbox
+
+FORMAT_TITLES = {
+    "half": "HALF PRECISION (16-bit)",
+    "bfloat16": "BFLOAT16 (16-bit)",
+    "single": "SINGLE PRECISION (32-bit)",
+    "double": "DOUBLE PRECISION (64-bit)",
+}
 
 class ErrorFrame(ctk.CTkFrame):
     def __init__(self, master):
@@ -45,6 +53,18 @@ class ErrorFrame(ctk.CTkFrame):
         self.fp_results_box = ctk.CTkTextbox(self.scrollable_frame, height=200, state="disabled", font=("Courier", 12))
         self.fp_results_box.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
 
+        # --- ARRAY AUDIT SECTION ---
+        audit_frame = ctk.CTkFrame(self.scrollable_frame)
+        audit_frame.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
+        audit_frame.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkLabel(audit_frame, text="2. Auditoria de Precisão (arquivo de valores)", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, columnspan=2, pady=5, padx=10, sticky="w")
+        audit_button = ctk.CTkButton(audit_frame, text="Carregar e Analisar", command=self.analyze_values_file)
+        audit_button.grid(row=1, column=0, padx=10, pady=5, sticky="w")
+
+        self.audit_results_box = ctk.CTkTextbox(self.scrollable_frame, height=300, font=("Courier", 12))
+        self.audit_results_box.grid(row=3, column=0, padx=10, pady=10, sticky="nsew")
+
     #     # --- TRUNCATION ERROR SECTION ---
     #     trunc_frame = ctk.CTkFrame(self.scrollable_frame)
     #     trunc_frame.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
@@ -101,34 +121,58 @@ class ErrorFrame(ctk.CTkFrame):
     #     self.canvas.draw()
         
     def analyze_float(self):
-        details = get_float_details(self.fp_entry.get())
+        details = analyze_float(self.fp_entry.get())
         if not details:
             result_text = "Entrada inválida. Por favor, insira um número."
         else:
-            s32 = details["single"]
-            s64 = details["double"]
-            
-            result_text = (
-                f"Entrada: {self.fp_entry.get()}\n"
-                f"{'-'*50}\n"
-                f"SINGLE PRECISION (32-bit)\n"
-                f"{'-'*50}\n"
-                f"Sinal: {s32['sign']} | Expoente: {s32['exponent']} | Mantissa: {s32['mantissa']}\n"
-                f"Valor Real Armazenado: {s32['reconstructed']:.50f}\n"
-                f"Erro de Representação: {float(self.fp_entry.get()) - s32['reconstructed']}\n\n"
-                f"{'-'*50}\n"
-                f"DOUBLE PRECISION (64-bit)\n"
-                f"{'-'*50}\n"
-                f"Sinal: {s64['sign']} | Expoente: {s64['exponent']} | Mantissa: {s64['mantissa']}\n"
-                f"Valor Real Armazenado: {s64['reconstructed']:.50f}\n"
-                f"Erro de Representação: {float(self.fp_entry.get()) - s64['reconstructed']}\n"
-            )
+            result_text = f"Entrada: {self.fp_entry.get()}\n"
+            for precision, d in details.items():
+                result_text += (
+                    f"{'-'*50}\n"
+                    f"{FORMAT_TITLES[precision]}\n"
+                    f"{'-'*50}\n"
+                    f"Sinal: {d['sign']} | Expoente: {d['exponent']} | Mantissa: {d['mantissa']}\n"
+                    f"Valor Real Armazenado: {d['reconstructed']:.50f}\n"
+                    f"Erro de Representação: {d['error']}\n\n"
+                )
 
         self.fp_results_box.configure(state="normal")
         self.fp_results_box.delete("1.0", "end")
         self.fp_results_box.insert("1.0", result_text)
         self.fp_results_box.configure(state="disabled")
 
+    def analyze_values_file(self):
+        filetypes = [("Valores", " ".join(f"*{ext}" for ext in SUPPORTED_EXTENSIONS)), ("Todos", "*")]
+        path = filedialog.askopenfilename(title="Arquivo de valores", filetypes=filetypes)
+        if not path:
+            return
+
+        def compute():
+            analyses = analyze_file(path)
+            text = f"Arquivo: {path}\n"
+            for precision, analysis in analyses.items():
+                h = analysis.histograms()
+                counts, edges = h["ulp_error"]
+                rel_counts, rel_edges = h["log10_relative_error"]
+                text += f"{'-'*50}\n{FORMAT_TITLES[precision]} - {len(analysis.stored)} valores\n{'-'*50}\n"
+                text += " | ".join(f"{name}: {h['classes'][name]}" for name in CLASSES)
+                text += f" | overflow: {h['overflow']}\n"
+                text += f"Erro máximo: {h['max_ulp_error']:.3f} ULP, médio: {h['mean_ulp_error']:.3f} ULP\n"
+                text += "Erro em ULP:\n"
+                for c, lo, hi in zip(counts, edges[:-1], edges[1:]):
+                    text += f"  [{lo:.2f}, {hi:.2f}) {c}\n"
+                text += "log10 do erro relativo:\n"
+                for c, lo in zip(rel_counts, rel_edges[:-1]):
+                    if c:
+                        text += f"  {lo:6.0f} {c}\n"
+            return text
+
+        def show(text):
+            self.audit_results_box.delete("1.0", "end")
+            self.audit_results_box.insert("1.0", text)
+
+        run_for_textbox("errors.audit", self.audit_results_box, compute, show)
+
     # def calculate_truncation(self):
     #     try:
     #         func_name = self.func_selector.get()
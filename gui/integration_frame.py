@@ -1,10 +1,15 @@
 import customtkinter as ctk
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-import sympy
 from matplotlib.patches import Polygon
 
+from numcalc.expressions import compile_function
+from numcalc.integration import (INTEGRATION_LOCALS, newton_cotes, gauss_legendre, reference_integral,
+                                 adaptive_simpson, gauss_kronrod)
+from utils.jobs import get_executor, run_for_textbox
+from gui.plotting import PlotRenderer
+
 class IntegrationFrame(ctk.CTkFrame):
     def __init__(self, master):
         super().__init__(master)
@@ -15,9 +20,11 @@ class IntegrationFrame(ctk.CTkFrame):
         self.tab_view.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.tab_view.add("Newton-Cotes")
         self.tab_view.add("Quadratura de Gauss")
+        self.tab_view.add("Quadratura Adaptativa")
 
         self._create_newton_cotes_tab(self.tab_view.tab("Newton-Cotes"))
         self._create_gauss_tab(self.tab_view.tab("Quadratura de Gauss"))
+        self._create_adaptive_tab(self.tab_view.tab("Quadratura Adaptativa"))
 
         # Plot area shared or recreated per tab? Let's put it below the tabs
         self.plot_frame = ctk.CTkFrame(self)
@@ -26,30 +33,42 @@ class IntegrationFrame(ctk.CTkFrame):
         self.plot_frame.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=3)
 
-        self.fig, self.ax = plt.subplots()
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-        self._setup_plot_style()
-
-    def _setup_plot_style(self):
-        self.fig.patch.set_facecolor("#2B2B2B")
-        self.ax.set_facecolor("#242424")
-        self.ax.tick_params(axis='x', colors='white')
-        self.ax.tick_params(axis='y', colors='white')
-        for spine in self.ax.spines.values():
-            spine.set_edgecolor('white')
-        self.ax.grid(True, linestyle='--', alpha=0.3)
-        self.canvas.draw()
+        self.plot = PlotRenderer(self.canvas)
 
     def _safe_eval(self, func_str):
-        x = sympy.symbols('x')
         try:
-            expr = sympy.sympify(func_str, locals={'e': sympy.E, 'pi': sympy.pi, 'sin': sympy.sin, 'cos': sympy.cos, 'exp': sympy.exp, 'log': sympy.log})
-            f_lamb = sympy.lambdify(x, expr, 'numpy')
-            return f_lamb, expr
-        except:
+            return compile_function(func_str, INTEGRATION_LOCALS)
+        except ValueError:
             return None, None
 
+    def _show_error(self, key, textbox, e):
+        get_executor().cancel(key + ".reference")
+        textbox.delete("1.0", "end")
+        textbox.insert("1.0", f"Erro: {e}")
+
+    def _show_with_reference(self, key, textbox, head, value, expr, a, b, exact_label, error_label, digits=8):
+        """Shows head at once; the reference value and the error are filled in when they arrive."""
+        textbox.delete("1.0", "end")
+        textbox.insert("1.0", head + f"{exact_label}calculando...\n")
+
+        def show(ref):
+            note = " (numérico)" if ref.method == "numérico" else ""
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", head + f"{exact_label}{ref.value:.{digits}f}{note}\n"
+                                  + f"{error_label}{abs(ref.value - value):.8e}\n")
+
+        def show_error(e):
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", head + f"{exact_label}indisponível ({e})\n")
+
+        # Runs on its own key so that it survives the main job but not a newer calculation
+        get_executor().submit(key + ".reference", reference_integral, expr, a, b,
+                              on_done=show, on_error=show_error)
+
     # --- NEWTON-COTES ---
     def _create_newton_cotes_tab(self, tab):
         tab.grid_columnconfigure(1, weight=1)
@@ -83,6 +102,7 @@ class IntegrationFrame(ctk.CTkFrame):
         self.nc_result.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
 
     def calc_newton_cotes(self):
+        key = "integration.newton_cotes"
         try:
             f, expr = self._safe_eval(self.nc_func.get())
             a = float(self.nc_a.get())
@@ -91,64 +111,38 @@ class IntegrationFrame(ctk.CTkFrame):
             method = self.nc_method.get()
 
             if f is None: raise ValueError("Função inválida")
+        except Exception as e:
+            self._show_error(key, self.nc_result, e)
+            return
 
-            # Exact integral for comparison
-            x_sym = sympy.symbols('x')
-            exact_val = float(sympy.integrate(expr, (x_sym, a, b)))
-            
-            h = (b - a) / N
-            x_vals = np.linspace(a, b, N + 1)
-            y_vals = f(x_vals)
-            
-            result = 0
-            formula_str = ""
+        def compute():
+            res = newton_cotes(f, a, b, N, method)
 
-            if method == "Trapézio":
-                result = (h/2) * (y_vals[0] + 2*np.sum(y_vals[1:-1]) + y_vals[-1])
-                formula_str = "I ≈ (h/2) * [f(x0) + 2∑f(xi) + f(xn)]"
-            
-            elif method == "Simpson 1/3":
-                if N % 2 != 0: raise ValueError("Para Simpson 1/3, N deve ser par.")
-                result = (h/3) * (y_vals[0] + 4*np.sum(y_vals[1:-1:2]) + 2*np.sum(y_vals[2:-1:2]) + y_vals[-1])
-                formula_str = "I ≈ (h/3) * [f(x0) + 4∑ímpar + 2∑par + f(xn)]"
-
-            elif method == "Simpson 3/8":
-                if N % 3 != 0: raise ValueError("Para Simpson 3/8, N deve ser múltiplo de 3.")
-                result = (3*h/8) * (y_vals[0] + 3*np.sum(y_vals[1:-1]) - np.sum(y_vals[3:-1:3]) + y_vals[-1]) # Simplified logic needed but standard formula used
-                # Standard generic loop is safer for 3/8
-                s = y_vals[0] + y_vals[-1]
-                for i in range(1, N):
-                    if i % 3 == 0: s += 2 * y_vals[i]
-                    else: s += 3 * y_vals[i]
-                result = (3 * h / 8) * s
-                formula_str = "I ≈ (3h/8) * [f(x0) + 3*f(x1) + 3*f(x2) + 2*f(x3) + ...]"
-
-            error = abs(exact_val - result)
-            
             out = f"Método: {method} (N={N})\n"
-            out += f"Passo h = {h:.6f}\n"
-            out += f"Fórmula: {formula_str}\n"
+            out += f"Passo h = {res.h:.6f}\n"
+            out += f"Fórmula: {res.formula}\n"
             out += "-"*40 + "\n"
-            out += f"Valor Calculado: {result:.8f}\n"
-            out += f"Valor Exato:     {exact_val:.8f}\n"
-            out += f"Erro Absoluto:   {error:.8e}\n"
+            out += f"Valor Calculado: {res.value:.8f}\n"
+            return res, out
 
-            self.nc_result.delete("1.0", "end")
-            self.nc_result.insert("1.0", out)
+        def show(output):
+            res, out = output
+            x_vals, y_vals = res.x, res.y
+
+            # Exact integral for comparison
+            self._show_with_reference(key, self.nc_result, out, res.value, expr, a, b,
+                                      "Valor Exato:     ", "Erro Absoluto:   ")
             
             # Visualizing
-            self.ax.clear()
+            self.plot.begin()
             x_plot = np.linspace(a - 0.5, b + 0.5, 200)
-            self.ax.plot(x_plot, f(x_plot), color="#007ACC", label="f(x)")
-            self.ax.fill_between(x_vals, y_vals, alpha=0.3, color="#FFD700", label="Área Aproximada")
-            self.ax.scatter(x_vals, y_vals, color="red", s=10)
-            self.ax.set_title(f"Integração Numérica - {method}")
-            self.ax.legend(facecolor="#2B2B2B", edgecolor="white", labelcolor="white")
-            self._setup_plot_style()
+            self.plot.line("f", x_plot, f(x_plot), color="#007ACC", label="f(x)")
+            self.plot.area("area", x_vals, y_vals, alpha=0.3, color="#FFD700", label="Área Aproximada")
+            self.plot.points("nodes", x_vals, y_vals, color="red", markersize=3)
+            self.plot.finish(f"Integração Numérica - {method}")
 
-        except Exception as e:
-            self.nc_result.delete("1.0", "end")
-            self.nc_result.insert("1.0", f"Erro: {e}")
+        get_executor().cancel(key + ".reference")
+        run_for_textbox(key, self.nc_result, compute, show)
 
     # --- GAUSS QUADRATURE ---
     def _create_gauss_tab(self, tab):
@@ -170,79 +164,156 @@ class IntegrationFrame(ctk.CTkFrame):
         self.gq_b.pack(side="left", padx=2)
 
         ctk.CTkLabel(input_frame, text="Pontos de Gauss (n):").pack(pady=2)
-        self.gq_n = ctk.CTkOptionMenu(input_frame, values=["2", "3", "4"])
+        self.gq_n = ctk.CTkComboBox(input_frame, values=["2", "3", "4", "5", "8", "16", "32"])
         self.gq_n.pack(pady=2)
 
+        ctk.CTkLabel(input_frame, text="Painéis (m):").pack(pady=2)
+        self.gq_panels = ctk.CTkEntry(input_frame, placeholder_text="1")
+        self.gq_panels.pack(pady=2)
+
         ctk.CTkButton(input_frame, text="Calcular", command=self.calc_gauss).pack(pady=10)
 
         self.gq_result = ctk.CTkTextbox(tab, font=("Courier", 12))
         self.gq_result.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
 
     def calc_gauss(self):
+        key = "integration.gauss"
         try:
             f, expr = self._safe_eval(self.gq_func.get())
             a = float(self.gq_a.get())
             b = float(self.gq_b.get())
             n = int(self.gq_n.get())
+            panels = int(self.gq_panels.get() or 1)
 
             if f is None: raise ValueError("Função inválida")
+        except Exception as e:
+            self._show_error(key, self.gq_result, e)
+            return
 
-            # Weights and Roots for [-1, 1]
-            if n == 2:
-                t = np.array([-1/np.sqrt(3), 1/np.sqrt(3)])
-                w = np.array([1, 1])
-            elif n == 3:
-                t = np.array([-np.sqrt(3/5), 0, np.sqrt(3/5)])
-                w = np.array([5/9, 8/9, 5/9])
-            elif n == 4:
-                t = np.array([-np.sqrt(3/7 + 2/7*np.sqrt(6/5)), -np.sqrt(3/7 - 2/7*np.sqrt(6/5)),
-                              np.sqrt(3/7 - 2/7*np.sqrt(6/5)), np.sqrt(3/7 + 2/7*np.sqrt(6/5))])
-                w = np.array([(18-np.sqrt(30))/36, (18+np.sqrt(30))/36,
-                              (18+np.sqrt(30))/36, (18-np.sqrt(30))/36])
-
-            # Change of variables
-            # x = ((b-a)*t + (b+a))/2
-            # dx = ((b-a)/2) dt
-            
-            x_mapped = ((b - a) * t + (b + a)) / 2
-            factor = (b - a) / 2
-            
-            result = factor * np.sum(w * f(x_mapped))
-
-            # Verification
-            x_sym = sympy.symbols('x')
-            exact_val = float(sympy.integrate(expr, (x_sym, a, b)))
-            error = abs(exact_val - result)
+        def compute():
+            res = gauss_legendre(f, a, b, n, panels)
+            t, w, x_mapped, fx = res.t, res.w, res.x, res.fx
 
-            out = f"Quadratura de Gauss (n={n} pontos)\n"
-            out += f"Mudança de variável: [-1, 1] -> [{a}, {b}]\n"
+            out = f"Quadratura de Gauss (n={n} pontos, m={panels} painéis)\n"
+            out += f"Mudança de variável: [-1, 1] -> [{a}, {b}]"
+            out += f" ({panels} painéis de largura {(b - a) / panels:.6f})\n" if panels > 1 else "\n"
             out += "-"*40 + "\n"
             out += "Pontos t_i (Normaliz) | Pesos w_i | x_i (Mapeado) | f(x_i)\n"
-            for i in range(n):
-                out += f"{t[i]:.6f}          | {w[i]:.6f}  | {x_mapped[i]:.6f}    | {f(x_mapped[i]):.6f}\n"
+            shown = min(n * panels, 40)
+            for i in range(shown):
+                out += f"{t[i % n]:.6f}          | {w[i % n]:.6f}  | {x_mapped[i]:.6f}    | {fx[i]:.6f}\n"
+            if n * panels > shown:
+                out += f"... ({n * panels - shown} pontos omitidos)\n"
             
             out += "-"*40 + "\n"
-            out += f"Integral Calculado: {result:.8f}\n"
-            out += f"Integral Exato:     {exact_val:.8f}\n"
-            out += f"Erro:               {error:.8e}"
+            out += f"Integral Calculado: {res.value:.8f}\n"
+            return res, out
 
-            self.gq_result.delete("1.0", "end")
-            self.gq_result.insert("1.0", out)
+        def show(output):
+            res, out = output
+            x_mapped, fx = res.x, res.fx
+
+            # Verification
+            self._show_with_reference(key, self.gq_result, out, res.value, expr, a, b,
+                                      "Integral Exato:     ", "Erro:               ")
 
             # Plot
-            self.ax.clear()
+            self.plot.begin()
             x_plot = np.linspace(a - 0.5, b + 0.5, 200)
-            self.ax.plot(x_plot, f(x_plot), color="#007ACC", label="f(x)")
+            y_plot = f(x_plot) * np.ones_like(x_plot)
+            self.plot.line("f", x_plot, y_plot, color="#007ACC", label="f(x)")
             # Show rectangles for Gauss points (conceptual)
-            for i in range(n):
-                self.ax.plot([x_mapped[i], x_mapped[i]], [0, f(x_mapped[i])], 'r--', alpha=0.5)
-                self.ax.plot(x_mapped[i], f(x_mapped[i]), 'ro')
-            
-            self.ax.fill_between(x_plot, 0, f(x_plot), where=(x_plot>=a) & (x_plot<=b), color="#FFD700", alpha=0.2, label="Área")
-            self.ax.set_title(f"Quadratura de Gauss (n={n})")
-            self.ax.legend(facecolor="#2B2B2B", edgecolor="white", labelcolor="white")
-            self._setup_plot_style()
+            self.plot.stems("stems", x_mapped, fx, linestyle='--', color='r', alpha=0.5)
+            self.plot.points("nodes", x_mapped, fx, color='r', markersize=4 if n * panels > 20 else 6)
+
+            inside = (x_plot >= a) & (x_plot <= b)
+            self.plot.area("area", x_plot[inside], y_plot[inside], color="#FFD700", alpha=0.2, label="Área")
+            self.plot.finish(f"Quadratura de Gauss (n={n}, m={panels})")
+
+        get_executor().cancel(key + ".reference")
+        run_for_textbox(key, self.gq_result, compute, show)
+
+    # --- ADAPTIVE QUADRATURE ---
+    def _create_adaptive_tab(self, tab):
+        tab.grid_columnconfigure(1, weight=1)
+
+        input_frame = ctk.CTkFrame(tab)
+        input_frame.grid(row=0, column=0, sticky="ns", padx=5, pady=5)
+
+        ctk.CTkLabel(input_frame, text="Função f(x):").pack(pady=2)
+        self.ad_func = ctk.CTkEntry(input_frame, placeholder_text="Ex: 1/(0.001 + (x-0.3)**2)")
+        self.ad_func.pack(pady=2)
+
+        ctk.CTkLabel(input_frame, text="Intervalo [a, b]:").pack(pady=2)
+        frame_ab = ctk.CTkFrame(input_frame, fg_color="transparent")
+        frame_ab.pack()
+        self.ad_a = ctk.CTkEntry(frame_ab, width=50, placeholder_text="a")
+        self.ad_a.pack(side="left", padx=2)
+        self.ad_b = ctk.CTkEntry(frame_ab, width=50, placeholder_text="b")
+        self.ad_b.pack(side="left", padx=2)
+
+        ctk.CTkLabel(input_frame, text="Tolerância (abs, rel):").pack(pady=2)
+        frame_tol = ctk.CTkFrame(input_frame, fg_color="transparent")
+        frame_tol.pack()
+        self.ad_abs_tol = ctk.CTkEntry(frame_tol, width=70, placeholder_text="1e-8")
+        self.ad_abs_tol.pack(side="left", padx=2)
+        self.ad_rel_tol = ctk.CTkEntry(frame_tol, width=70, placeholder_text="1e-8")
+        self.ad_rel_tol.pack(side="left", padx=2)
+
+        ctk.CTkLabel(input_frame, text="Regra:").pack(pady=2)
+        self.ad_method = ctk.CTkOptionMenu(input_frame, values=["Gauss-Kronrod G7K15", "Simpson adaptativo"])
+        self.ad_method.pack(pady=2)
+
+        ctk.CTkButton(input_frame, text="Calcular", command=self.calc_adaptive).pack(pady=10)
 
+        self.ad_result = ctk.CTkTextbox(tab, font=("Courier", 12))
+        self.ad_result.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
+
+    def calc_adaptive(self):
+        key = "integration.adaptive"
+        try:
+            f, expr = self._safe_eval(self.ad_func.get())
+            a = float(self.ad_a.get())
+            b = float(self.ad_b.get())
+            abs_tol = float(self.ad_abs_tol.get() or 1e-8)
+            rel_tol = float(self.ad_rel_tol.get() or 1e-8)
+            method = self.ad_method.get()
+
+            if f is None: raise ValueError("Função inválida")
         except Exception as e:
-            self.gq_result.delete("1.0", "end")
-            self.gq_result.insert("1.0", f"Erro: {e}")
\ No newline at end of file
+            self._show_error(key, self.ad_result, e)
+            return
+
+        def compute():
+            integrate = gauss_kronrod if method == "Gauss-Kronrod G7K15" else adaptive_simpson
+            res = integrate(f, a, b, abs_tol, rel_tol)
+
+            out = f"Método: {res.rule}\n"
+            out += f"Tolerância: abs = {abs_tol:.1e}, rel = {rel_tol:.1e}\n"
+            out += f"Subintervalos: {len(res.intervals)}\n"
+            out += f"Avaliações de f: {res.evaluations}\n"
+            if not res.converged:
+                out += "Aviso: limite de subdivisões atingido.\n"
+            out += "-"*40 + "\n"
+            out += f"Valor Calculado: {res.value:.12f}\n"
+            out += f"Erro Estimado:   {res.error:.8e}\n"
+            return res, out
+
+        def show(output):
+            res, out = output
+            self._show_with_reference(key, self.ad_result, out, res.value, expr, a, b,
+                                      "Valor Exato:     ", "Erro Absoluto:   ", digits=12)
+
+            # Plot with the subinterval boundaries chosen by the method
+            self.plot.begin()
+            x_plot = np.linspace(a, b, 1000)
+            y_plot = f(x_plot) * np.ones_like(x_plot)
+            self.plot.line("f", x_plot, y_plot, color="#007ACC", label="f(x)")
+            self.plot.area("area", x_plot, y_plot, alpha=0.2, color="#FFD700", label="Área")
+            edges = np.append(res.intervals[:, 0], res.intervals[-1, 1])
+            self.plot.stems("stems", edges, f(edges), color="red", alpha=0.4, linewidth=0.8,
+                            label="Subintervalos")
+            self.plot.finish(f"Quadratura Adaptativa - {res.rule}")
+
+        get_executor().cancel(key + ".reference")
+        run_for_textbox(key, self.ad_result, compute, show)
\ No newline at end of file
@@ -1,10 +1,27 @@
+from tkinter import filedialog
+
 import customtkinter as ctk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
-from scipy.interpolate import lagrange
+
+from numcalc.interpolation import lagrange_interpolation, spline_interpolation
+from numcalc.matrix_io import SUPPORTED_EXTENSIONS, load_matrix
+from utils.jobs import run_for_textbox
+from gui.plotting import PlotRenderer
 
 class InterpolationFrame(ctk.CTkFrame):
+    # Menu label -> spline kind; None is the global Lagrange polynomial
+    METHODS = {
+        "Lagrange": None,
+        "Spline Natural": "natural",
+        "Spline Fixada": "clamped",
+        "Spline Not-a-knot": "not-a-knot",
+        "PCHIP (monótona)": "pchip",
+    }
+    # Points listed in the results textbox
+    MAX_POINTS_SHOWN = 50
+
     def __init__(self, master):
         super().__init__(master)
         self.grid_columnconfigure(0, weight=1)
@@ -23,8 +40,21 @@ class InterpolationFrame(ctk.CTkFrame):
         self.estimate_entry = ctk.CTkEntry(input_frame, placeholder_text="Opcional")
         self.estimate_entry.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
 
-        calc_btn = ctk.CTkButton(input_frame, text="Calcular Polinómio de Lagrange", command=self.calculate_lagrange)
-        calc_btn.grid(row=2, column=0, columnspan=2, pady=10)
+        load_btn = ctk.CTkButton(input_frame, text="Carregar Arquivo", command=self.load_points_file)
+        load_btn.grid(row=0, column=2, padx=10, pady=5)
+        # Points read from a file, used while the points entry is empty
+        self.loaded_points = None
+
+        ctk.CTkLabel(input_frame, text="Método:").grid(row=2, column=0, padx=10, pady=5)
+        self.method_menu = ctk.CTkOptionMenu(input_frame, values=list(self.METHODS))
+        self.method_menu.grid(row=2, column=1, padx=10, pady=5, sticky="w")
+
+        ctk.CTkLabel(input_frame, text="f'(a), f'(b):").grid(row=3, column=0, padx=10, pady=5)
+        self.fprime_entry = ctk.CTkEntry(input_frame, placeholder_text="Só para spline fixada. Ex: 0, 0")
+        self.fprime_entry.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+
+        calc_btn = ctk.CTkButton(input_frame, text="Calcular Interpolação", command=self.calculate_lagrange)
+        calc_btn.grid(row=4, column=0, columnspan=2, pady=10)
 
         # --- Output Area ---
         self.result_box = ctk.CTkTextbox(self, height=150, font=("Courier", 12))
@@ -37,77 +67,110 @@ class InterpolationFrame(ctk.CTkFrame):
         self.plot_frame.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=2)
 
-        self.fig, self.ax = plt.subplots()
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-        self._setup_plot_style()
-
-    def _setup_plot_style(self):
-        self.fig.patch.set_facecolor("#2B2B2B")
-        self.ax.set_facecolor("#242424")
-        self.ax.tick_params(axis='x', colors='white')
-        self.ax.tick_params(axis='y', colors='white')
-        for spine in self.ax.spines.values():
-            spine.set_edgecolor('white')
-        self.ax.xaxis.label.set_color('white')
-        self.ax.yaxis.label.set_color('white')
-        self.ax.title.set_color('white')
-        self.ax.grid(True, linestyle='--', alpha=0.3)
-        self.canvas.draw()
+        # Zoom and pan; large datasets are re-decimated for the new view
+        toolbar = NavigationToolbar2Tk(self.canvas, self.plot_frame, pack_toolbar=False)
+        toolbar.grid(row=1, column=0, sticky="ew")
+        self.plot = PlotRenderer(self.canvas)
+
+    def load_points_file(self):
+        """Reads x and y from the first two columns of a file (CSV, .npy, ...)."""
+        filetypes = [("Dados", " ".join(f"*{ext}" for ext in SUPPORTED_EXTENSIONS)), ("Todos", "*")]
+        path = filedialog.askopenfilename(title="Pontos (colunas x, y)", filetypes=filetypes)
+        if not path:
+            return
+
+        def compute():
+            data = np.asarray(load_matrix(path), dtype=float)
+            if data.ndim != 2 or data.shape[1] < 2:
+                raise ValueError("O arquivo deve ter as colunas x e y.")
+            return data[:, 0].copy(), data[:, 1].copy()
+
+        def show(points):
+            self.loaded_points = points
+            self.points_entry.delete(0, "end")
+            self.points_entry.configure(placeholder_text=f"Arquivo: {path} ({len(points[0])} pontos)")
+            self.result_box.delete("1.0", "end")
+            self.result_box.insert("1.0", f"{len(points[0])} pontos carregados de {path}.")
+
+        run_for_textbox("interp.load", self.result_box, compute, show, busy_text="Carregando arquivo...")
 
     def calculate_lagrange(self):
         try:
-            points_str = self.points_entry.get().split(';')
-            points = []
-            for p in points_str:
-                x, y = map(float, p.split(','))
-                points.append((x, y))
-            
-            points.sort() # Sort by x
-            X = np.array([p[0] for p in points])
-            Y = np.array([p[1] for p in points])
-
-            # Calculate Lagrange Polynomial
-            poly = lagrange(X, Y)
-            
-            # Formatting polynomial string
-            coeffs = poly.coef
-            degree = len(coeffs) - 1
-            poly_str = "Pn(x) = "
-            for i, c in enumerate(coeffs):
-                power = degree - i
-                if abs(c) > 1e-10: # Ignore close to zero
-                    sign = "+ " if c >= 0 and i > 0 else "- " if c < 0 else ""
-                    poly_str += f"{sign}{abs(c):.4f}*x^{power} "
-
-            result_text = f"Pontos Inseridos: {points}\n\n"
-            result_text += f"Polinómio Interpolador (Lagrange):\n{poly_str}\n"
+            points_text = self.points_entry.get().strip()
+            if not points_text and self.loaded_points is not None:
+                X, Y = self.loaded_points
+                order = np.argsort(X, kind="stable") # Sort by x
+                X, Y = X[order], Y[order]
+                points = None # too many to list
+            else:
+                points = []
+                for p in points_text.split(';'):
+                    x, y = map(float, p.split(','))
+                    points.append((x, y))
+
+                points.sort() # Sort by x
+                X = np.array([p[0] for p in points])
+                Y = np.array([p[1] for p in points])
+
+            kind = self.METHODS[self.method_menu.get()]
+            fprime = (0.0, 0.0)
+            if kind == "clamped" and self.fprime_entry.get().strip():
+                fprime = tuple(map(float, self.fprime_entry.get().split(',')))
+                if len(fprime) != 2:
+                    raise ValueError("Informe f'(a) e f'(b) separados por vírgula.")
 
-            # Estimate specific value
             est_x_str = self.estimate_entry.get()
-            if est_x_str:
-                est_x = float(est_x_str)
+            est_x = float(est_x_str) if est_x_str else None
+        except Exception as e:
+            self.result_box.delete("1.0", "end")
+            self.result_box.insert("1.0", f"Erro: {e}\nVerifique o formato: x1,y1; x2,y2")
+            return
+
+        method = self.method_menu.get()
+
+        def compute():
+            if points is not None and len(points) <= self.MAX_POINTS_SHOWN:
+                result_text = f"Pontos Inseridos: {points}\n\n"
+            else:
+                result_text = f"Pontos Inseridos: {len(X)} (x de {X[0]:g} a {X[-1]:g})\n\n"
+
+            if kind is None:
+                # Calculate Lagrange Polynomial
+                poly = lagrange_interpolation(X, Y)
+                result_text += f"Polinómio Interpolador (Lagrange):\n{poly.format()}\n"
+            else:
+                poly = spline_interpolation(X, Y, kind, fprime)
+                result_text += f"Interpolação por {method}: {len(X) - 1} polinómios cúbicos\n"
+
+            # Estimate specific value
+            est_y = None
+            if est_x is not None:
                 est_y = poly(est_x)
                 result_text += f"\nEstimativa: P({est_x}) = {est_y:.6f}"
 
+            # Enough samples to show every piece of a spline over many knots
+            margin = 1 if kind is None else 0.05 * (X[-1] - X[0])
+            x_plot = np.linspace(X[0] - margin, X[-1] + margin, min(max(200, 4 * len(X)), 20000))
+            return result_text, x_plot, poly(x_plot), est_y
+
+        def show(output):
+            result_text, x_plot, y_plot, est_y = output
             self.result_box.delete("1.0", "end")
             self.result_box.insert("1.0", result_text)
 
             # Plotting
-            self.ax.clear()
-            x_plot = np.linspace(min(X)-1, max(X)+1, 200)
-            y_plot = poly(x_plot)
-            
-            self.ax.plot(x_plot, y_plot, label='Polinómio Pn(x)', color='#007ACC')
-            self.ax.scatter(X, Y, color='#FFD700', zorder=5, label='Pontos')
-            
-            if est_x_str:
-                 self.ax.plot(est_x, est_y, 'rx', markersize=10, label=f'Estimativa x={est_x}')
-
-            self.ax.legend(facecolor="#2B2B2B", edgecolor="white", labelcolor="white")
-            self.ax.set_title("Interpolação de Lagrange")
-            self._setup_plot_style()
+            self.plot.begin()
+            self.plot.line("curve", x_plot, y_plot, decimate=True, label='Polinómio Pn(x)' if kind is None else method, color='#007ACC')
+            self.plot.points("nodes", X, Y, decimate=True, color='#FFD700', zorder=5, label='Pontos')
 
-        except Exception as e:
-            self.result_box.delete("1.0", "end")
-            self.result_box.insert("1.0", f"Erro: {e}\nVerifique o formato: x1,y1; x2,y2")
\ No newline at end of file
+            if est_x is not None:
+                self.plot.points("estimate", [est_x], [est_y], marker='x', color='r', markersize=10,
+                                 label=f'Estimativa x={est_x}')
+
+            self.plot.finish("Interpolação de Lagrange" if kind is None else f"Interpolação: {method}")
+
+        run_for_textbox("interp.lagrange", self.result_box, compute, show)
\ No newline at end of file
@@ -1,9 +1,21 @@
+from tkinter import filedialog
+
 import customtkinter as ctk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
 
+from numcalc.least_squares import fit, fit_stream
+from numcalc.matrix_io import iter_xy_chunks
+from utils.jobs import run_for_textbox
+from gui.plotting import PlotRenderer
+
 class LeastSquaresFrame(ctk.CTkFrame):
+    # Largest design matrix printed in the results
+    MAX_ROWS_SHOWN = 20
+    # Points of a streamed file kept for the scatter plot, which decimates them for the screen
+    MAX_PLOT_POINTS = 1_000_000
+
     def __init__(self, master):
         super().__init__(master)
         self.grid_columnconfigure(0, weight=1)
@@ -17,6 +29,11 @@ class LeastSquaresFrame(ctk.CTkFrame):
         self.data_entry = ctk.CTkEntry(settings_frame, width=300, placeholder_text="Ex: 0,1; 1,2.5; 2,3.8; 3,7")
         self.data_entry.grid(row=0, column=1, padx=5, pady=5)
 
+        load_btn = ctk.CTkButton(settings_frame, text="Carregar Arquivo", command=self.load_data_file)
+        load_btn.grid(row=0, column=2, columnspan=2, padx=5, pady=5)
+        # File streamed in chunks while the data entry is empty
+        self.data_path = None
+
         ctk.CTkLabel(settings_frame, text="Método:").grid(row=1, column=0, padx=5)
         self.method_var = ctk.StringVar(value="Linear")
         self.method_menu = ctk.CTkOptionMenu(settings_frame, variable=self.method_var, 
@@ -27,6 +44,8 @@ class LeastSquaresFrame(ctk.CTkFrame):
         # Input extra (grau do polinómio ou n de termos)
         self.extra_param_label = ctk.CTkLabel(settings_frame, text="Grau:")
         self.extra_param_entry = ctk.CTkEntry(settings_frame, width=50)
+        self.period_label = ctk.CTkLabel(settings_frame, text="Período:")
+        self.period_entry = ctk.CTkEntry(settings_frame, width=70, placeholder_text="2*pi")
         # Default hidden/shown based on logic
         
         btn_calc = ctk.CTkButton(settings_frame, text="Ajustar Curva", command=self.calculate_mmq)
@@ -44,10 +63,14 @@ class LeastSquaresFrame(ctk.CTkFrame):
         plot_container.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=2)
 
-        self.fig, self.ax = plt.subplots()
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_container)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-        self._setup_plot_style()
+        # Zoom and pan; large datasets are re-decimated for the new view
+        toolbar = NavigationToolbar2Tk(self.canvas, plot_container, pack_toolbar=False)
+        toolbar.grid(row=1, column=0, sticky="ew")
+        self.plot = PlotRenderer(self.canvas)
 
     def update_inputs(self, choice):
         if "Polinomial" in choice or "Fourier" in choice:
@@ -57,130 +80,121 @@ class LeastSquaresFrame(ctk.CTkFrame):
         else:
             self.extra_param_label.grid_forget()
             self.extra_param_entry.grid_forget()
-
-    def _setup_plot_style(self):
-        self.fig.patch.set_facecolor("#2B2B2B")
-        self.ax.set_facecolor("#242424")
-        self.ax.tick_params(axis='x', colors='white')
-        self.ax.tick_params(axis='y', colors='white')
-        for spine in self.ax.spines.values():
-            spine.set_edgecolor('white')
-        self.ax.grid(True, linestyle='--', alpha=0.3)
-        self.canvas.draw()
+        if "Fourier" in choice:
+            self.period_label.grid(row=1, column=4, padx=5)
+            self.period_entry.grid(row=1, column=5, padx=5)
+        else:
+            self.period_label.grid_forget()
+            self.period_entry.grid_forget()
+
+    def load_data_file(self):
+        path = filedialog.askopenfilename(title="Dados (colunas x, y)",
+                                          filetypes=[("Dados", "*.csv *.txt *.npy"), ("Todos", "*")])
+        if not path:
+            return
+        self.data_path = path
+        self.data_entry.delete(0, "end")
+        self.data_entry.configure(placeholder_text=f"Arquivo: {path}")
+        self.results_box.delete("1.0", "end")
+        self.results_box.insert("1.0", f"Os dados serão lidos em blocos de {path}.")
 
     def calculate_mmq(self):
         try:
             # Parse Data
-            raw_data = self.data_entry.get().split(';')
-            X = np.array([float(p.split(',')[0]) for p in raw_data])
-            Y = np.array([float(p.split(',')[1]) for p in raw_data])
-            
+            data_text = self.data_entry.get().strip()
+            path = self.data_path if not data_text else None
+            if path is None:
+                raw_data = data_text.split(';')
+                X = np.array([float(p.split(',')[0]) for p in raw_data])
+                Y = np.array([float(p.split(',')[1]) for p in raw_data])
+                steps_text = f"Dados inseridos: {len(X)} pontos.\n"
+            else:
+                steps_text = f"Dados lidos em blocos de {path}.\n"
+
             method = self.method_var.get()
-            A = None # Design Matrix
-            y_vec = Y
-            coeffs = []
-            fit_func = None
-            model_str = ""
-            
-            steps_text = f"Dados inseridos: {len(X)} pontos.\n"
+            period = 2 * np.pi
 
             if "Linear" in method:
-                # y = ax + b -> y = b + ax (Matriz [1, x])
-                A = np.vstack([np.ones(len(X)), X]).T
+                kind, param = "linear", 0
                 steps_text += "Modelo: y = a0 + a1*x\n"
-            
             elif "Polinomial" in method:
-                degree = int(self.extra_param_entry.get() or 2)
-                # y = a0 + a1x + ... + anx^n
-                A = np.vander(X, degree + 1, increasing=True)
-                steps_text += f"Modelo Polinomial de grau {degree}\n"
-
+                kind, param = "polynomial", int(self.extra_param_entry.get() or 2)
+                steps_text += f"Modelo Polinomial de grau {param}\n"
             elif "Exponencial" in method:
-                # y = a * e^(bx) -> ln(y) = ln(a) + bx
-                # Linearizado: Y_lin = A0 + A1*x, onde A0=ln(a), A1=b
-                if np.any(Y <= 0):
-                    raise ValueError("Para ajuste exponencial, y deve ser > 0.")
-                y_vec = np.log(Y)
-                A = np.vstack([np.ones(len(X)), X]).T
+                kind, param = "exponential", 0
                 steps_text += "Linearização: ln(y) = ln(a) + bx\n"
-
-            elif "Fourier" in method:
-                # Aproximação: f(x) = a0 + a1 cos(x) + b1 sin(x) ...
-                # Simplificado para período fixo ou assumindo dados em radianos
-                terms = int(self.extra_param_entry.get() or 1)
-                cols = [np.ones(len(X))]
-                for k in range(1, terms + 1):
-                    cols.append(np.cos(k * X))
-                    cols.append(np.sin(k * X))
-                A = np.column_stack(cols)
-                steps_text += f"Série de Fourier com {terms} harmónicas\n"
-
-            # Solve Normal Equations: (A^T * A) * c = A^T * y
-            At = A.T
-            AtA = At @ A
-            Aty = At @ y_vec
-            
-            # Use numpy solve
-            coeffs = np.linalg.solve(AtA, Aty)
-            
-            # Didactic Output
-            steps_text += f"\nMatriz de Design A ({A.shape}):\n{np.array2string(A, precision=2)}\n"
-            steps_text += f"\nMatriz Normal (A^T * A):\n{np.array2string(AtA, precision=2)}\n"
-            steps_text += f"\nVetor (A^T * y):\n{np.array2string(Aty, precision=2)}\n"
-            steps_text += f"\nCoeficientes encontrados:\n{coeffs}\n"
-
-            # Construct Plotting Function and Equation String
-            x_plot = np.linspace(min(X), max(X), 200)
-            y_plot = []
-
-            if "Exponencial" in method:
-                a = np.exp(coeffs[0])
-                b = coeffs[1]
-                model_str = f"y = {a:.4f} * e^({b:.4f}x)"
-                y_plot = a * np.exp(b * x_plot)
-                # Recalculate error on original scale
-                y_est = a * np.exp(b * X)
-                total_sq_error = np.sum((Y - y_est)**2)
-            
             elif "Fourier" in method:
-                y_plot = np.zeros_like(x_plot) + coeffs[0]
-                y_est = np.zeros_like(X) + coeffs[0]
-                model_str = f"y = {coeffs[0]:.3f}"
-                idx = 1
-                for k in range(1, int(self.extra_param_entry.get() or 1) + 1):
-                    a_k = coeffs[idx]
-                    b_k = coeffs[idx+1]
-                    term_str = f" + {a_k:.3f}cos({k}x) + {b_k:.3f}sin({k}x)"
-                    model_str += term_str
-                    y_plot += a_k * np.cos(k * x_plot) + b_k * np.sin(k * x_plot)
-                    y_est += a_k * np.cos(k * X) + b_k * np.sin(k * X)
-                    idx += 2
-                total_sq_error = np.sum((Y - y_est)**2)
-
-            else: # Linear or Polynomial
-                # Coeffs are [a0, a1, a2...] (increasing power due to vander logic used)
-                # Note: polyval expects decreasing, so we flip for calculation if using polyval,
-                # or just dot product
-                y_plot = np.dot(np.vander(x_plot, len(coeffs), increasing=True), coeffs)
-                y_est = np.dot(A, coeffs)
-                total_sq_error = np.sum((Y - y_est)**2)
-                
-                model_str = "y = " + " + ".join([f"{c:.3f}x^{i}" for i, c in enumerate(coeffs)])
-
-            steps_text += f"\nEquação Final: {model_str}\n"
-            steps_text += f"Erro Quadrático Total: {total_sq_error:.6f}"
+                kind, param = "fourier", int(self.extra_param_entry.get() or 1)
+                if self.period_entry.get().strip():
+                    period = float(self.period_entry.get())
+                    if period <= 0:
+                        raise ValueError("O período deve ser positivo.")
+                steps_text += f"Série de Fourier com {param} harmónicas, período {period:.6g}\n"
+        except Exception as e:
+            self.results_box.delete("1.0", "end")
+            self.results_box.insert("1.0", f"Erro: {e}\nVerifique os dados.")
+            return
+
+        def compute(job):
+            if path is None:
+                fit_result = fit(X, Y, kind, param, period)
+                plot_x, plot_y, x_range = X, Y, (min(X), max(X))
+            else:
+                # Constant memory: only the QR factor and a thinned sample for the plot are kept
+                sample_x, sample_y, stride = [], [], 1
+
+                def chunks():
+                    nonlocal sample_x, sample_y, stride
+                    for x, y, fraction in iter_xy_chunks(path):
+                        sample_x.append(x[::stride].copy())
+                        sample_y.append(y[::stride].copy())
+                        while sum(map(len, sample_x)) > 2 * self.MAX_PLOT_POINTS:
+                            sample_x = [np.concatenate(sample_x)[::2]]
+                            sample_y = [np.concatenate(sample_y)[::2]]
+                            stride *= 2
+                        yield x, y, fraction
+
+                stream = fit_stream(chunks(), kind, param, progress=job.report_progress, period=period)
+                fit_result = stream.result()
+                plot_x, plot_y = np.concatenate(sample_x), np.concatenate(sample_y)
+                x_range = (stream.x_min, stream.x_max)
+            A, AtA, Aty, coeffs = fit_result.A, fit_result.AtA, fit_result.Aty, fit_result.coeffs
 
+            # Didactic Output
+            text = steps_text
+            if path is not None:
+                text += f"Pontos lidos: {stream.n}\n"
+            elif A is None:
+                text += "\nAmostragem uniforme sobre períodos inteiros: coeficientes obtidos pela FFT.\n"
+            elif len(A) <= self.MAX_ROWS_SHOWN:
+                text += f"\nMatriz de Design A ({A.shape}):\n{np.array2string(A, precision=2)}\n"
+            else:
+                text += f"\nMatriz de Design A: {A.shape} (omitida)\n"
+            text += f"\nMatriz Normal (A^T * A):\n{np.array2string(AtA, precision=2)}\n"
+            text += f"\nVetor (A^T * y):\n{np.array2string(Aty, precision=2)}\n"
+            text += f"\nCoeficientes encontrados:\n{coeffs}\n"
+
+            x_plot = np.linspace(x_range[0], x_range[1], 200)
+            y_plot = fit_result(x_plot)
+
+            text += f"\nEquação Final: {fit_result.model_string()}\n"
+            if path is None:
+                text += f"Erro Quadrático Total: {fit_result.total_squared_error(X, Y):.6f}"
+            elif kind == "exponential":
+                text += f"Erro Quadrático Total (em ln y): {stream.residual_sum_of_squares:.6f}"
+            else:
+                text += f"Erro Quadrático Total: {stream.residual_sum_of_squares:.6f}"
+            return text, x_plot, y_plot, plot_x, plot_y
+
+        def show(output):
+            text, x_plot, y_plot, X, Y = output
             self.results_box.delete("1.0", "end")
-            self.results_box.insert("1.0", steps_text)
+            self.results_box.insert("1.0", text)
 
             # Plot
-            self.ax.clear()
-            self.ax.scatter(X, Y, color='#FFD700', label='Dados Experimentais', s=50, zorder=5)
-            self.ax.plot(x_plot, y_plot, color='#007ACC', linewidth=2, label=f'Ajuste ({method.split()[0]})')
-            self.ax.legend(facecolor="#2B2B2B", edgecolor="white", labelcolor="white")
-            self.ax.set_title(f"Mínimos Quadrados: {method}")
-            self._setup_plot_style()
+            self.plot.begin()
+            self.plot.points("data", X, Y, decimate=True, color='#FFD700', label='Dados Experimentais', markersize=7, zorder=5)
+            self.plot.line("fit", x_plot, y_plot, color='#007ACC', linewidth=2, label=f'Ajuste ({method.split()[0]})')
+            self.plot.finish(f"Mínimos Quadrados: {method}")
 
-        except Exception as e:
-            self.results_box.delete("1.0", "end")
-            self.results_box.insert("1.0", f"Erro: {e}\nVerifique os dados.")
\ No newline at end of file
+        run_for_textbox("least_sq", self.results_box, compute, show, with_progress=True)
\ No newline at end of file
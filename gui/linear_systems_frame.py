@@ -1,8 +1,22 @@
+from tkinter import filedialog
+
 import customtkinter as ctk
 import numpy as np
-from scipy.linalg import hilbert
+
+from numcalc.linear_systems import GaussEliminationResult, gauss_elimination
+from numcalc.matrix_io import SUPPORTED_EXTENSIONS, load_system, load_vector, save_system
+from numcalc.sparse_systems import (jacobi, gauss_seidel, sor, conjugate_gradient, thomas,
+                                    tridiagonal_diagonals, solve_banded, bandwidth)
+from utils.jobs import run_for_textbox
+from gui.trace_view import TraceView
 
 class LinearSystemsFrame(ctk.CTkFrame):
+    # Row operations rendered per page of the steps view
+    MAX_STEPS_SHOWN = 200
+    # Loaded systems above this order start with "Mostrar Passos" unchecked
+    MAX_TRACED_ORDER = 100
+    ITERATIVE_METHODS = ["Jacobi", "Gauss-Seidel", "SOR", "Gradientes Conjugados", "Thomas (tridiagonal)", "Banda (direto)"]
+
     def __init__(self, master):
         super().__init__(master)
         self.grid_columnconfigure(0, weight=1)
@@ -11,10 +25,16 @@ class LinearSystemsFrame(ctk.CTkFrame):
         self.tab_view = ctk.CTkTabview(self, anchor="w")
         self.tab_view.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.tab_view.add("Eliminação de Gauss")
+        self.tab_view.add("Métodos Iterativos")
 
         self.matrix_entries = []
+        # (A, pivoting, GaussEliminationResult) of the last elimination, reused while only b changes
+        self.gauss_factorization = None
+        # Systems loaded from files, by tab name; they replace the entry grid of that tab
+        self.loaded_systems = {}
         
         self._create_gauss_tab(self.tab_view.tab("Eliminação de Gauss"))
+        self._create_iterative_tab(self.tab_view.tab("Métodos Iterativos"))
 
     def _create_matrix_grid(self, parent, size, grid_row, grid_col, has_b=True, has_x0=False):
         """Dynamically creates a grid of CTkEntry widgets for a matrix."""
@@ -75,12 +95,73 @@ class LinearSystemsFrame(ctk.CTkFrame):
             
             if entries['x0']:
                 for r in range(size):
-                    x0[r] = float(entries['x0'][r].get())
+                    x0[r] = float(entries['x0'][r].get() or 0) # blank x0 means zero
                     
             return A, b, x0
         except (ValueError, IndexError):
             return None, None, None
 
+    def _load_system_file(self, tab_name, textbox):
+        """Asks for a system file (and for b if the file lacks it) and loads it in the background."""
+        filetypes = [("Matrizes", " ".join(f"*{ext}" for ext in SUPPORTED_EXTENSIONS)), ("Todos", "*")]
+        path = filedialog.askopenfilename(title="Matriz A ou sistema aumentado [A | b]", filetypes=filetypes)
+        if not path:
+            return
+
+        def show(system):
+            A, b, x0 = system
+            if b is None:
+                b_path = filedialog.askopenfilename(title="Vetor b", filetypes=filetypes)
+                if not b_path:
+                    raise ValueError("Vetor b não informado.")
+                b = load_vector(b_path, A.shape[0])
+
+            parent = self.tab_view.tab(tab_name)
+            if hasattr(self, f'{parent}_grid_frame'):
+                getattr(self, f'{parent}_grid_frame').destroy()
+            grid_frame = ctk.CTkFrame(parent)
+            grid_frame.grid(row=1, column=0, columnspan=5, pady=10, padx=10, sticky="ns")
+            setattr(self, f'{parent}_grid_frame', grid_frame)
+            kind = "esparsa" if not isinstance(A, np.ndarray) else "densa"
+            ctk.CTkLabel(grid_frame, text=f"Sistema carregado: {path} ({A.shape[0]}x{A.shape[1]}, {kind})").grid(
+                row=0, column=0, padx=10, pady=5)
+
+            self.loaded_systems[tab_name] = (A, b, x0)
+            if tab_name == "Eliminação de Gauss" and A.shape[0] > self.MAX_TRACED_ORDER:
+                self.gauss_trace_var.set(False)
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", f"Sistema de ordem {A.shape[0]} carregado de {path}.")
+
+        run_for_textbox(f"linear.load.{tab_name}", textbox, lambda: load_system(path), show,
+                        busy_text="Carregando arquivo...")
+
+    def _save_system_file(self, tab_name, textbox, entries, size, has_x0=False):
+        """Saves the system of the tab (loaded or typed in the grid) as .npz or augmented .mtx."""
+        loaded = self.loaded_systems.get(tab_name)
+        if loaded is not None:
+            A, b, x0 = loaded
+        else:
+            A, b, x0 = self._read_matrix_grid(entries, size)
+            if A is None:
+                textbox.delete("1.0", "end")
+                textbox.insert("1.0", "Erro: Entrada inválida. Verifique os números da matriz.")
+                return
+            if not has_x0:
+                x0 = None
+        sparse = hasattr(A, "toarray")
+        filetypes = [("Matrix Market [A | b]", "*.mtx")] if sparse else [("NumPy", "*.npz"), ("Matrix Market [A | b]", "*.mtx")]
+        path = filedialog.asksaveasfilename(title="Salvar sistema", defaultextension=".mtx" if sparse else ".npz",
+                                            filetypes=filetypes)
+        if not path:
+            return
+
+        def show(_):
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", f"Sistema de ordem {A.shape[0]} salvo em {path}.")
+
+        run_for_textbox(f"linear.save.{tab_name}", textbox, lambda: save_system(path, A, b, x0), show,
+                        busy_text="Salvando arquivo...")
+
     # --- GAUSSIAN ELIMINATION TAB ---
     def _create_gauss_tab(self, tab):
         tab.grid_columnconfigure(0, weight=1)
@@ -90,7 +171,7 @@ class LinearSystemsFrame(ctk.CTkFrame):
 
         ctk.CTkLabel(controls_frame, text="Tamanho da Matriz:").grid(row=0, column=0, padx=10)
         self.gauss_size_var = ctk.IntVar(value=3)
-        size_menu = ctk.CTkOptionMenu(controls_frame, values=["2", "3", "4", "5"], 
+        size_menu = ctk.CTkOptionMenu(controls_frame, values=[str(n) for n in range(2, 11)], 
                                       variable=self.gauss_size_var, command=self.update_gauss_grid)
         size_menu.grid(row=0, column=1, padx=10)
         
@@ -98,22 +179,40 @@ class LinearSystemsFrame(ctk.CTkFrame):
         pivot_check = ctk.CTkCheckBox(controls_frame, text="Usar Pivotamento Parcial", variable=self.gauss_pivot_var)
         pivot_check.grid(row=0, column=2, padx=10)
 
+        self.gauss_trace_var = ctk.BooleanVar(value=True)
+        trace_check = ctk.CTkCheckBox(controls_frame, text="Mostrar Passos", variable=self.gauss_trace_var)
+        trace_check.grid(row=0, column=3, padx=10)
+
+        load_button = ctk.CTkButton(controls_frame, text="Carregar Arquivo",
+                                    command=lambda: self._load_system_file("Eliminação de Gauss", self.gauss_results_box))
+        load_button.grid(row=0, column=4, padx=10)
+
         solve_button = ctk.CTkButton(controls_frame, text="Resolver Sistema", command=self.solve_gauss)
-        solve_button.grid(row=0, column=3, padx=20)
+        solve_button.grid(row=0, column=5, padx=20)
+
+        save_button = ctk.CTkButton(controls_frame, text="Salvar Sistema", command=lambda: self._save_system_file(
+            "Eliminação de Gauss", self.gauss_results_box, self.gauss_entries, self.gauss_size_var.get()))
+        save_button.grid(row=0, column=6, padx=10)
         
-        self.gauss_results_box = ctk.CTkTextbox(tab, font=("Courier", 12))
-        self.gauss_results_box.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
+        self.gauss_trace_view = TraceView(tab, page_rows=self.MAX_STEPS_SHOWN, font=("Courier", 12))
+        self.gauss_trace_view.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
+        self.gauss_results_box = self.gauss_trace_view.textbox
         tab.grid_rowconfigure(2, weight=1)
         
         self.update_gauss_grid(3) # Initial grid
 
     def update_gauss_grid(self, size_str):
         size = int(size_str)
+        self.loaded_systems.pop("Eliminação de Gauss", None)
         self.gauss_entries = self._create_matrix_grid(self.tab_view.tab("Eliminação de Gauss"), size, grid_row=1, grid_col=0)
 
     def solve_gauss(self):
-        size = self.gauss_size_var.get()
-        A, b, _ = self._read_matrix_grid(self.gauss_entries, size)
+        loaded = self.loaded_systems.get("Eliminação de Gauss")
+        if loaded is not None:
+            A, b, _ = loaded
+        else:
+            size = self.gauss_size_var.get()
+            A, b, _ = self._read_matrix_grid(self.gauss_entries, size)
         
         if A is None:
             self.gauss_results_box.delete("1.0", "end")
@@ -121,33 +220,153 @@ class LinearSystemsFrame(ctk.CTkFrame):
             return
 
         use_pivoting = self.gauss_pivot_var.get()
-        n = len(b)
-        M = np.hstack([A, b.reshape(-1, 1)])
-        
-        steps = f"Matriz Aumentada Inicial:\n{M}\n\n"
-
-        # Forward Elimination
-        for k in range(n - 1):
-            if use_pivoting:
-                # Find max in column k and swap
-                max_row = k + np.argmax(np.abs(M[k:, k]))
-                if max_row != k:
-                    M[[k, max_row]] = M[[max_row, k]]
-                    steps += f"--- Pivotamento: Troca L{k+1} <-> L{max_row+1} ---\n{M}\n\n"
-            
-            for i in range(k + 1, n):
-                factor = M[i, k] / M[k, k]
-                M[i, k:] = M[i, k:] - factor * M[k, k:]
-                steps += f"--- L{i+1} = L{i+1} - ({factor:.3f})*L{k+1} ---\n{M}\n\n"
-        
-        steps += "--- Fim da Eliminação ---\n"
-        
-        # Back Substitution
-        x = np.zeros(n)
-        for i in range(n - 1, -1, -1):
-            x[i] = (M[i, -1] - np.dot(M[i, i+1:n], x[i+1:n])) / M[i, i]
-        
-        steps += f"\nSolução (Vetor x):\n{x}\n"
-        
-        self.gauss_results_box.delete("1.0", "end")
-        self.gauss_results_box.insert("1.0", steps)
\ No newline at end of file
+        show_steps = self.gauss_trace_var.get()
+        cached = self.gauss_factorization
+
+        def reusable():
+            if cached is None or cached[1] != use_pivoting or (show_steps and cached[2].log is None):
+                return False
+            previous = cached[0]
+            if previous is A:
+                return True
+            return (isinstance(A, np.ndarray) and isinstance(previous, np.ndarray)
+                    and previous.shape == A.shape and np.array_equal(previous, A))
+
+        def compute(job):
+            if reusable():
+                # Same A: only the substitutions run for the new b
+                previous = cached[2]
+                log = previous.log.with_rhs(b) if show_steps else None
+                result = GaussEliminationResult(previous.lu.solve(b), log, previous.lu)
+                footer = "--- Fatoração LU reaproveitada: apenas substituições para o novo b ---\n"
+            else:
+                # Dense elimination: sparse and memory-mapped inputs are materialized here, off the UI thread
+                A_dense = A.toarray() if hasattr(A, "toarray") else np.asarray(A)
+                result = gauss_elimination(A_dense, b, pivoting=use_pivoting, progress=job.report_progress,
+                                           trace=show_steps)
+                footer = "--- Fim da Eliminação ---\n"
+            if result.log is not None and result.log.truncated:
+                footer += f"(Passos registrados apenas para as primeiras {result.log.limit} operações.)\n"
+            footer += f"\nSolução (Vetor x):\n{result.x}\n"
+            return result, footer
+
+        def show(output):
+            result, footer = output
+            log = result.log
+            self.gauss_factorization = (A, use_pivoting, result)
+            # Full matrices only while they stay readable
+            show_matrices = len(b) <= 10
+            self.gauss_trace_view.show(log, footer=footer,
+                                       render=lambda start, stop: log.format(start, stop, show_matrices))
+
+        run_for_textbox("linear.gauss", self.gauss_results_box, compute, show, with_progress=True)
+
+    # --- ITERATIVE METHODS TAB ---
+    def _create_iterative_tab(self, tab):
+        tab.grid_columnconfigure(0, weight=1)
+
+        controls_frame = ctk.CTkFrame(tab)
+        controls_frame.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+
+        ctk.CTkLabel(controls_frame, text="Tamanho da Matriz:").grid(row=0, column=0, padx=10)
+        self.iter_size_var = ctk.IntVar(value=3)
+        size_menu = ctk.CTkOptionMenu(controls_frame, values=[str(n) for n in range(2, 11)],
+                                      variable=self.iter_size_var, command=self.update_iterative_grid)
+        size_menu.grid(row=0, column=1, padx=10)
+
+        ctk.CTkLabel(controls_frame, text="Método:").grid(row=0, column=2, padx=10)
+        self.iter_method = ctk.CTkOptionMenu(controls_frame, values=self.ITERATIVE_METHODS)
+        self.iter_method.grid(row=0, column=3, padx=10)
+
+        load_button = ctk.CTkButton(controls_frame, text="Carregar Arquivo",
+                                    command=lambda: self._load_system_file("Métodos Iterativos", self.iter_results_box))
+        load_button.grid(row=0, column=4, padx=10)
+
+        ctk.CTkLabel(controls_frame, text="Tolerância (ε):").grid(row=1, column=0, padx=10, pady=5)
+        self.iter_tol_entry = ctk.CTkEntry(controls_frame, width=80, placeholder_text="1e-8")
+        self.iter_tol_entry.grid(row=1, column=1, padx=10, pady=5)
+
+        ctk.CTkLabel(controls_frame, text="Máx. Iterações:").grid(row=1, column=2, padx=10, pady=5)
+        self.iter_max_entry = ctk.CTkEntry(controls_frame, width=80, placeholder_text="1000")
+        self.iter_max_entry.grid(row=1, column=3, padx=10, pady=5)
+
+        ctk.CTkLabel(controls_frame, text="ω (SOR):").grid(row=1, column=4, padx=10, pady=5)
+        self.iter_omega_entry = ctk.CTkEntry(controls_frame, width=60, placeholder_text="1.25")
+        self.iter_omega_entry.grid(row=1, column=5, padx=10, pady=5)
+
+        solve_button = ctk.CTkButton(controls_frame, text="Resolver Sistema", command=self.solve_iterative)
+        solve_button.grid(row=0, column=5, padx=20)
+
+        save_button = ctk.CTkButton(controls_frame, text="Salvar Sistema", command=lambda: self._save_system_file(
+            "Métodos Iterativos", self.iter_results_box, self.iter_entries, self.iter_size_var.get(), has_x0=True))
+        save_button.grid(row=0, column=6, padx=10)
+
+        self.iter_results_box = ctk.CTkTextbox(tab, font=("Courier", 12))
+        self.iter_results_box.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
+        tab.grid_rowconfigure(2, weight=1)
+
+        self.update_iterative_grid(3) # Initial grid
+
+    def update_iterative_grid(self, size_str):
+        size = int(size_str)
+        self.loaded_systems.pop("Métodos Iterativos", None)
+        self.iter_entries = self._create_matrix_grid(self.tab_view.tab("Métodos Iterativos"), size,
+                                                     grid_row=1, grid_col=0, has_x0=True)
+
+    def solve_iterative(self):
+        try:
+            loaded = self.loaded_systems.get("Métodos Iterativos")
+            if loaded is not None:
+                A, b, x0 = loaded
+            else:
+                size = self.iter_size_var.get()
+                A, b, x0 = self._read_matrix_grid(self.iter_entries, size)
+                if A is None:
+                    raise ValueError("Entrada inválida. Verifique os números da matriz.")
+            method = self.iter_method.get()
+            tol = float(self.iter_tol_entry.get() or 1e-8)
+            max_iter = int(self.iter_max_entry.get() or 1000)
+            omega = float(self.iter_omega_entry.get() or 1.25)
+        except Exception as e:
+            self.iter_results_box.delete("1.0", "end")
+            self.iter_results_box.insert("1.0", f"Erro: {e}")
+            return
+
+        def compute():
+            if method == "Thomas (tridiagonal)":
+                x = thomas(*tridiagonal_diagonals(A), b)
+                return f"Método: Thomas (O(n))\n\nSolução (Vetor x):\n{x}\n"
+            if method == "Banda (direto)":
+                lower, upper = bandwidth(A)
+                x = solve_banded(A, b)
+                return f"Método: Banda (p={lower}, q={upper})\n\nSolução (Vetor x):\n{x}\n"
+
+            if method == "Jacobi":
+                result = jacobi(A, b, x0, tol, max_iter)
+            elif method == "Gauss-Seidel":
+                result = gauss_seidel(A, b, x0, tol, max_iter)
+            elif method == "SOR":
+                result = sor(A, b, omega, x0, tol, max_iter)
+            else:
+                result = conjugate_gradient(A, b, x0, tol, max_iter)
+
+            text = f"Método: {result.method}\n"
+            text += " k   |  ||b - Ax_k|| / ||b||\n"
+            text += "-"*30 + "\n"
+            residuals = result.residuals
+            # Long histories: first and last iterations only
+            rows = range(len(residuals)) if len(residuals) <= 60 else [*range(30), None, *range(len(residuals) - 30, len(residuals))]
+            for k in rows:
+                text += " ...\n" if k is None else f"{k:4d} | {residuals[k]:.6e}\n"
+            if result.converged:
+                text += f"\nConvergiu em {result.iterations} iterações."
+            else:
+                text += f"\nNão convergiu após {result.iterations} iterações."
+            text += f"\n\nSolução (Vetor x):\n{result.x}\n"
+            return text
+
+        def show(text):
+            self.iter_results_box.delete("1.0", "end")
+            self.iter_results_box.insert("1.0", text)
+
+        run_for_textbox("linear.iterative", self.iter_results_box, compute, show)
\ No newline at end of file
@@ -0,0 +1,203 @@
+from matplotlib.collections import LineCollection, PolyCollection
+import numpy as np
+
+from utils.decimation import decimate_line, decimate_points
+
+FIGURE_COLOR = "#2B2B2B"
+AXES_COLOR = "#242424"
+LEGEND_STYLE = {"facecolor": "#2B2B2B", "edgecolor": "white", "labelcolor": "white"}
+# Decimated artists with more points than this are reduced to what the screen can show
+DECIMATE_ABOVE = 5000
+# Delay (ms) after the last zoom or pan before the reduced data is recomputed
+REDECIMATE_DELAY = 100
+
+
+def apply_dark_style(fig, ax):
+    """Sets the dark theme of the application on fig and ax."""
+    fig.patch.set_facecolor(FIGURE_COLOR)
+    ax.set_facecolor(AXES_COLOR)
+    ax.tick_params(axis='x', colors='white')
+    ax.tick_params(axis='y', colors='white')
+    for spine in ax.spines.values():
+        spine.set_edgecolor('white')
+    ax.xaxis.label.set_color('white')
+    ax.yaxis.label.set_color('white')
+    ax.title.set_color('white')
+    ax.grid(True, linestyle='--', alpha=0.3, color='gray')
+
+
+class PlotRenderer:
+    """Draws a frame's plot through persistent, named artists.
+
+    A render is begin(), one call per artist (line, points, segments,
+    stems, spans, area, hline) and finish(). Artists are created on first use and
+    afterwards only updated in place; those not used in a render are
+    hidden. Styling is applied once, here. Data artists are animated: when
+    a render keeps the limits, title and legend of the previous one, they
+    are blitted over the cached background; otherwise a full redraw is
+    scheduled with draw_idle.
+
+    line() and points() with decimate=True keep the full data aside and
+    draw only a screen-sized reduction of it (LTTB for lines, one point
+    per pixel for scatters), recomputed shortly after the view changes.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.fig = canvas.figure
+        self.ax = self.fig.axes[0]
+        self._artists = {}
+        self._used = set()
+        self._background = None
+        self._static_key = None
+        # Full data of decimated artists: name -> (kind, x, y)
+        self._full = {}
+        self._rescaling = False
+        self._timer = canvas.new_timer(interval=REDECIMATE_DELAY)
+        self._timer.single_shot = True
+        self._timer.add_callback(self._redecimate)
+        apply_dark_style(self.fig, self.ax)
+        canvas.mpl_connect("draw_event", self._on_draw)
+        self.ax.callbacks.connect("xlim_changed", self._on_view_changed)
+        self.ax.callbacks.connect("ylim_changed", self._on_view_changed)
+        canvas.draw_idle()
+
+    def begin(self):
+        self._used = set()
+
+    def _artist(self, name, create, label, style):
+        artist = self._artists.get(name)
+        if artist is None:
+            artist = create()
+            artist.set_animated(True)
+            self._artists[name] = artist
+        artist.set(label=label if label is not None else f"_{name}", **style)
+        self._used.add(name)
+        return artist
+
+    def line(self, name, x, y, label=None, decimate=False, **style):
+        """A Line2D through (x, y), x sorted when decimate is set."""
+        line = self._artist(name, lambda: self.ax.plot([], [])[0], label, style)
+        self._set_data(name, line, "line", x, y, decimate)
+        return line
+
+    def points(self, name, x, y, label=None, decimate=False, **style):
+        """Markers at (x, y), drawn as a single line artist without segments."""
+        style.setdefault("marker", "o")
+        line = self._artist(name, lambda: self.ax.plot([], [])[0], label, dict(style, linestyle="none"))
+        self._set_data(name, line, "points", x, y, decimate)
+        return line
+
+    def _set_data(self, name, line, kind, x, y, decimate):
+        if decimate and len(x) > DECIMATE_ABOVE:
+            self._full[name] = (kind, np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+            line.set_data(*self._reduce(name))
+        else:
+            self._full.pop(name, None)
+            line.set_data(x, y)
+
+    def _reduce(self, name, xlim=None, ylim=None):
+        """Full data of a decimated artist reduced for the view xlim x ylim (default: all of it)."""
+        kind, x, y = self._full[name]
+        width, height = self.ax.bbox.width, self.ax.bbox.height
+        if kind == "line":
+            return decimate_line(x, y, xlim, n_out=max(int(2 * width), 100))
+        return decimate_points(x, y, xlim, ylim, width, height)
+
+    def hline(self, name, y, label=None, **style):
+        """Horizontal line across the axes at height y."""
+        line = self._artist(name, lambda: self.ax.axhline(y), label, style)
+        line.set_ydata([y, y])
+        return line
+
+    def segments(self, name, segments, label=None, **style):
+        """Many line segments [((x0, y0), (x1, y1)), ...] in one LineCollection."""
+        def create():
+            return self.ax.add_collection(LineCollection([]), autolim=False)
+        collection = self._artist(name, create, label, style)
+        collection.set_segments(segments)
+        return collection
+
+    def stems(self, name, x, y, label=None, **style):
+        """Vertical segments from the x axis up to (x, y), in one LineCollection."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float) * np.ones_like(x)
+        segments = np.stack([np.column_stack([x, np.zeros_like(x)]), np.column_stack([x, y])], axis=1)
+        return self.segments(name, segments, label, **style)
+
+    def spans(self, name, intervals, label=None, **style):
+        """Vertical bands [(a, b), ...] over the full height, in one PolyCollection."""
+        def create():
+            return self.ax.add_collection(PolyCollection([], transform=self.ax.get_xaxis_transform()),
+                                          autolim=False)
+        collection = self._artist(name, create, label, style)
+        collection.set_verts([[(a, 0), (a, 1), (b, 1), (b, 0)] for a, b in intervals])
+        return collection
+
+    def area(self, name, x, y, label=None, **style):
+        """Region between the x axis and the curve (x, y)."""
+        def create():
+            return self.ax.add_collection(PolyCollection([]), autolim=False)
+        collection = self._artist(name, create, label, style)
+        if len(x):
+            verts = [(x[0], 0), *zip(x, y), (x[-1], 0)]
+            collection.set_verts([verts])
+        else:
+            collection.set_verts([])
+        return collection
+
+    def finish(self, title="", legend=True):
+        """Hides unused artists, rescales the view and redraws as cheaply as possible."""
+        for name, artist in self._artists.items():
+            artist.set_visible(name in self._used)
+        for name in [n for n in self._full if n not in self._used]:
+            del self._full[name]
+        self._rescaling = True
+        try:
+            self.ax.relim(visible_only=True)
+            self.ax.autoscale_view()
+        finally:
+            self._rescaling = False
+
+        handles = [a for name, a in self._artists.items()
+                   if name in self._used and not a.get_label().startswith("_")]
+        labels = tuple(a.get_label() for a in handles)
+        key = (tuple(self.ax.get_xlim()), tuple(self.ax.get_ylim()), title, labels if legend else ())
+        if key == self._static_key and self._background is not None:
+            self._blit()
+            return
+
+        self._static_key = key
+        self.ax.set_title(title)
+        if legend and handles:
+            self.ax.legend(handles=handles, **LEGEND_STYLE)
+        elif self.ax.get_legend() is not None:
+            self.ax.get_legend().remove()
+        self.canvas.draw_idle()
+
+    def _on_view_changed(self, ax):
+        # Zoom or pan: wait for the view to settle before reducing again
+        if self._full and not self._rescaling:
+            self._timer.stop()
+            self._timer.start()
+
+    def _redecimate(self):
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        for name in self._full:
+            self._artists[name].set_data(*self._reduce(name, xlim, ylim))
+        self.canvas.draw_idle()
+
+    def _draw_animated(self):
+        for artist in sorted(self._artists.values(), key=lambda a: a.get_zorder()):
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        # Background without the data artists, which are then drawn on top
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _blit(self):
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
@@ -0,0 +1,89 @@
+from tkinter import filedialog
+
+import customtkinter as ctk
+
+from utils.jobs import get_executor
+
+
+class TraceView(ctk.CTkFrame):
+    """Textbox that shows a long iteration trace one page at a time.
+
+    show() takes any trace with len(), format(start, stop) and save(path)
+    (IterationTrace, EliminationLog); only the rows of the current page are
+    formatted into the textbox. The whole trace exports to CSV or NPZ.
+    Busy and error messages go straight to .textbox, as for a plain one.
+    """
+    PAGE_ROWS = 100
+
+    def __init__(self, master, page_rows=PAGE_ROWS, **textbox_kwargs):
+        super().__init__(master, fg_color="transparent")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        self.page_rows = page_rows
+
+        self.textbox = ctk.CTkTextbox(self, **textbox_kwargs)
+        self.textbox.grid(row=0, column=0, sticky="nsew")
+
+        controls = ctk.CTkFrame(self, fg_color="transparent")
+        controls.grid(row=1, column=0, pady=(5, 0), sticky="ew")
+        self.prev_button = ctk.CTkButton(controls, text="◀", width=30, command=lambda: self.go_to(self.page - 1))
+        self.prev_button.grid(row=0, column=0, padx=2)
+        self.page_label = ctk.CTkLabel(controls, text="")
+        self.page_label.grid(row=0, column=1, padx=5)
+        self.next_button = ctk.CTkButton(controls, text="▶", width=30, command=lambda: self.go_to(self.page + 1))
+        self.next_button.grid(row=0, column=2, padx=2)
+        self.export_button = ctk.CTkButton(controls, text="Exportar", width=80, command=self.export)
+        self.export_button.grid(row=0, column=3, padx=10)
+
+        self.trace = None
+        self.render = None
+        self.intro = ""
+        self.footer = ""
+        self.page = 0
+        self.show(None)
+
+    @property
+    def pages(self):
+        return max(-(-len(self.trace) // self.page_rows), 1) if self.trace is not None else 1
+
+    def show(self, trace, intro="", footer="", render=None):
+        """Displays the first page of trace between intro and footer (just them for trace None).
+
+        render(start, stop) replaces trace.format for the page text.
+        """
+        self.trace = trace
+        self.render = render or (trace.format if trace is not None else None)
+        self.intro = intro
+        self.footer = footer
+        self.go_to(0)
+
+    def go_to(self, page):
+        self.page = min(max(page, 0), self.pages - 1)
+        text = self.intro
+        if self.trace is not None:
+            start = self.page * self.page_rows
+            text += self.render(start, start + self.page_rows)
+        text += self.footer
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", text)
+
+        has_trace = self.trace is not None and len(self.trace) > 0
+        self.page_label.configure(text=f"Página {self.page + 1}/{self.pages}" if has_trace else "")
+        self.prev_button.configure(state="normal" if self.page > 0 else "disabled")
+        self.next_button.configure(state="normal" if self.page < self.pages - 1 else "disabled")
+        self.export_button.configure(state="normal" if has_trace else "disabled")
+
+    def export(self):
+        path = filedialog.asksaveasfilename(title="Exportar iterações", defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("NumPy", "*.npz")])
+        if not path:
+            return
+
+        def done(_):
+            self.page_label.configure(text=f"Exportado: {path}")
+
+        def failed(e):
+            self.page_label.configure(text=f"Erro: {e}")
+
+        # Large traces take a while to write; the view stays usable meanwhile
+        get_executor().submit(f"trace.export.{id(self)}", self.trace.save, path, on_done=done, on_error=failed)
@@ -1,10 +1,18 @@
 import customtkinter as ctk
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-import sympy
+
+from numcalc.expressions import compile_function, get_compiled, get_compiled_system
+from numcalc.zeros import bisection, brent, illinois, ridders, safeguarded_newton, newton, find_all_roots
+from numcalc.nonlinear_systems import newton_system
+from gui.plotting import PlotRenderer
+from gui.trace_view import TraceView
+from utils.jobs import run_for_textbox
 
 class ZerosFrame(ctk.CTkFrame):
+    BRACKETING_METHODS = ["Bissecção", "Brent", "Illinois", "Ridders", "Newton protegido"]
+
     def __init__(self, master):
         super().__init__(master)
         self.grid_columnconfigure(0, weight=1)
@@ -13,37 +21,28 @@ class ZerosFrame(ctk.CTkFrame):
         # Create Tabview for methods
         self.tab_view = ctk.CTkTabview(self, anchor="w")
         self.tab_view.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        self.tab_view.add("Método da Bissecção")
+        self.tab_view.add("Métodos de Intervalo")
         self.tab_view.add("Método de Newton-Raphson")
+        self.tab_view.add("Todas as Raízes")
+        self.tab_view.add("Sistemas Não Lineares")
 
         # Create Plot Frame
         self.plot_frame = ctk.CTkFrame(self)
         self.plot_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
         self.plot_frame.grid_rowconfigure(0, weight=1)
         self.plot_frame.grid_columnconfigure(0, weight=1)
-        self.fig, self.ax = plt.subplots()
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.grid(row=0, column=0, sticky="nsew")
-        self._setup_plot_style()
+        self.plot = PlotRenderer(self.canvas)
 
         # Populate tabs
-        self._create_bisection_tab(self.tab_view.tab("Método da Bissecção"))
+        self._create_bisection_tab(self.tab_view.tab("Métodos de Intervalo"))
         self._create_newton_tab(self.tab_view.tab("Método de Newton-Raphson"))
-
-    def _setup_plot_style(self):
-        """Sets the dark theme for the Matplotlib plot."""
-        self.fig.patch.set_facecolor("#2B2B2B")
-        self.ax.set_facecolor("#242424")
-        self.ax.tick_params(axis='x', colors='white')
-        self.ax.tick_params(axis='y', colors='white')
-        for spine in self.ax.spines.values():
-            spine.set_edgecolor('white')
-        self.ax.xaxis.label.set_color('white')
-        self.ax.yaxis.label.set_color('white')
-        self.ax.title.set_color('white')
-        self.ax.grid(True, linestyle='--', alpha=0.3, color='gray')
-        self.canvas.draw()
+        self._create_all_roots_tab(self.tab_view.tab("Todas as Raízes"))
+        self._create_system_tab(self.tab_view.tab("Sistemas Não Lineares"))
 
     def _create_bisection_tab(self, tab):
         tab.grid_columnconfigure(0, weight=1)
@@ -66,13 +65,18 @@ class ZerosFrame(ctk.CTkFrame):
         ctk.CTkLabel(input_frame, text="Tolerância (ε):").grid(row=2, column=0, padx=10, pady=5, sticky="w")
         self.bi_tol_entry = ctk.CTkEntry(input_frame, placeholder_text="Ex: 0.0001")
         self.bi_tol_entry.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(input_frame, text="Método:").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.bi_method_menu = ctk.CTkOptionMenu(input_frame, values=self.BRACKETING_METHODS)
+        self.bi_method_menu.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
         
         run_button = ctk.CTkButton(input_frame, text="Calcular", command=self.run_bisection)
-        run_button.grid(row=3, column=0, columnspan=3, pady=10)
+        run_button.grid(row=4, column=0, columnspan=3, pady=10)
 
         # --- Results ---
-        self.bi_results_box = ctk.CTkTextbox(tab, wrap="none", font=("Courier", 12))
-        self.bi_results_box.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        self.bi_trace_view = TraceView(tab, wrap="none", font=("Courier", 12))
+        self.bi_trace_view.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        self.bi_results_box = self.bi_trace_view.textbox
 
     def _create_newton_tab(self, tab):
         tab.grid_columnconfigure(0, weight=3)
@@ -98,125 +102,283 @@ class ZerosFrame(ctk.CTkFrame):
         run_button.grid(row=3, column=0, columnspan=2, pady=10)
 
         # --- Results ---
-        self.nw_results_box = ctk.CTkTextbox(tab, wrap="none", font=("Courier", 12))
-        self.nw_results_box.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        self.nw_trace_view = TraceView(tab, wrap="none", font=("Courier", 12))
+        self.nw_trace_view.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        self.nw_results_box = self.nw_trace_view.textbox
+
+    def _create_all_roots_tab(self, tab):
+        tab.grid_columnconfigure(0, weight=1)
+        tab.grid_columnconfigure(1, weight=10)
+
+        # --- Inputs ---
+        input_frame = ctk.CTkFrame(tab)
+        input_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+
+        ctk.CTkLabel(input_frame, text="Função f(x):").grid(row=0, column=0, padx=10, pady=5, sticky="w")
+        self.ar_func_entry = ctk.CTkEntry(input_frame, placeholder_text="Ex: sin(x)")
+        self.ar_func_entry.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(input_frame, text="Intervalo [a, b]:").grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        self.ar_a_entry = ctk.CTkEntry(input_frame, placeholder_text="a")
+        self.ar_a_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self.ar_b_entry = ctk.CTkEntry(input_frame, placeholder_text="b")
+        self.ar_b_entry.grid(row=1, column=2, padx=5, pady=5, sticky="ew")
+
+        ctk.CTkLabel(input_frame, text="Tolerância (ε):").grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        self.ar_tol_entry = ctk.CTkEntry(input_frame, placeholder_text="Ex: 0.0001")
+        self.ar_tol_entry.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(input_frame, text="Amostras:").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.ar_samples_entry = ctk.CTkEntry(input_frame, placeholder_text="Ex: 100000")
+        self.ar_samples_entry.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+
+        run_button = ctk.CTkButton(input_frame, text="Calcular", command=self.run_all_roots)
+        run_button.grid(row=4, column=0, columnspan=3, pady=10)
+
+        # --- Results ---
+        self.ar_results_box = ctk.CTkTextbox(tab, wrap="none", font=("Courier", 12))
+        self.ar_results_box.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+
+    def _create_system_tab(self, tab):
+        tab.grid_columnconfigure(0, weight=1)
+        tab.grid_columnconfigure(1, weight=10)
+
+        # --- Inputs ---
+        input_frame = ctk.CTkFrame(tab)
+        input_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+
+        ctk.CTkLabel(input_frame, text="Equações (uma por linha):").grid(row=0, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+        self.sys_equations_box = ctk.CTkTextbox(input_frame, height=90, width=260)
+        self.sys_equations_box.grid(row=1, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+        self.sys_equations_box.insert("1.0", "x**2 + y**2 = 4\nexp(x) + y = 1")
+
+        ctk.CTkLabel(input_frame, text="Chute inicial (x₀):").grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        self.sys_x0_entry = ctk.CTkEntry(input_frame, placeholder_text="Ex: 1, -1.7")
+        self.sys_x0_entry.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(input_frame, text="Tolerância (ε):").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.sys_tol_entry = ctk.CTkEntry(input_frame, placeholder_text="Ex: 1e-10")
+        self.sys_tol_entry.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(input_frame, text="Método:").grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        self.sys_method_menu = ctk.CTkOptionMenu(input_frame, values=["Newton", "Broyden"])
+        self.sys_method_menu.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(input_frame, text="Jacobiana:").grid(row=5, column=0, padx=10, pady=5, sticky="w")
+        self.sys_jacobian_menu = ctk.CTkOptionMenu(input_frame, values=["Simbólica", "Diferenças finitas"])
+        self.sys_jacobian_menu.grid(row=5, column=1, padx=10, pady=5, sticky="ew")
+
+        self.sys_sparse_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(input_frame, text="Jacobiana esparsa", variable=self.sys_sparse_var).grid(
+            row=6, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+
+        run_button = ctk.CTkButton(input_frame, text="Calcular", command=self.run_newton_system)
+        run_button.grid(row=7, column=0, columnspan=2, pady=10)
+
+        # --- Results ---
+        self.sys_trace_view = TraceView(tab, wrap="none", font=("Courier", 12))
+        self.sys_trace_view.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        self.sys_results_box = self.sys_trace_view.textbox
 
     def _safe_eval_func(self, func_str):
-        x = sympy.symbols('x')
         try:
-            expr = sympy.sympify(func_str, locals={'e': sympy.E, 'pi': sympy.pi})
-            return sympy.lambdify(x, expr, 'numpy')
-        except (sympy.SympifyError, SyntaxError):
+            return compile_function(func_str)[0]
+        except ValueError:
             return None
 
+    def _show_error(self, textbox, e):
+        textbox.delete("1.0", "end")
+        textbox.insert("1.0", f"Erro: {e}")
+
     def run_bisection(self):
         try:
             func_str = self.bi_func_entry.get()
             f = self._safe_eval_func(func_str)
             a, b = float(self.bi_a_entry.get()), float(self.bi_b_entry.get())
             tol = float(self.bi_tol_entry.get())
-            max_iter = 100
+            method = self.bi_method_menu.get()
 
-            if f is None or f(a) * f(b) >= 0:
-                self.bi_results_box.delete("1.0", "end")
-                self.bi_results_box.insert("end", "Erro: Função inválida ou f(a)*f(b) >= 0.")
-                return
+            if f is None:
+                raise ValueError("Função inválida")
+        except Exception as e:
+            self._show_error(self.bi_results_box, e)
+            return
 
-            results = " n  |      a      |      b      |      c      |     f(c)    |   b-a\n"
-            results += "-"*70 + "\n"
-            
-            self.ax.clear()
-            x_plot = np.linspace(min(a, b) - 1, max(a, b) + 1, 400)
-            self.ax.plot(x_plot, f(x_plot), label=f'f(x) = {func_str}', color="#007ACC")
-            self.ax.axhline(0, color='gray', linewidth=0.5)
-
-            for n in range(max_iter):
-                c = (a + b) / 2
-                f_c = f(c)
-                results += f"{n:2d}  | {a:11.6f} | {b:11.6f} | {c:11.6f} | {f_c:11.6f} | {b-a:11.6f}\n"
-
-                self.ax.axvspan(a, b, alpha=0.1, color='yellow')
-
-                if abs(f_c) < tol or (b - a) / 2 < tol:
-                    results += f"\nRaiz encontrada: c = {c}"
-                    break
-                
-                if f(a) * f_c < 0:
-                    b = c
-                else:
-                    a = c
+        def compute():
+            # The methods check the sign change themselves, so f(a) and f(b) are evaluated once
+            if method == "Bissecção":
+                result = bisection(f, a, b, tol)
+            elif method == "Brent":
+                result = brent(f, a, b, tol)
+            elif method == "Illinois":
+                result = illinois(f, a, b, tol)
+            elif method == "Ridders":
+                result = ridders(f, a, b, tol)
             else:
-                results += f"\nMáximo de iterações atingido."
-                
-            self.bi_results_box.delete("1.0", "end")
-            self.bi_results_box.insert("1.0", results)
-            
-            self.ax.plot(c, f(c), 'ro', label=f'Raiz ≈ {c:.4f}')
-            self.ax.legend(facecolor="#2B2B2B", edgecolor="white", labelcolor="white")
-            self._setup_plot_style()
-        except Exception as e:
-            self.bi_results_box.delete("1.0", "end")
-            self.bi_results_box.insert("1.0", f"Erro: {e}")
+                f_prime, _ = get_compiled(func_str).derivative(1)
+                result = safeguarded_newton(f, f_prime, a, b, tol)
+
+            footer = f"\nMétodo: {method} | Avaliações de f: {result.function_evals}"
+            if method == "Newton protegido":
+                footer += f" | Avaliações de f': {result.derivative_evals}"
+            if result.converged:
+                footer += f"\nRaiz encontrada: x = {result.root}"
+            else:
+                footer += f"\nMáximo de iterações atingido."
+            return result, footer
+
+        def show(output):
+            result, footer = output
+            c = result.root
+            self.bi_trace_view.show(result.iterations, footer=footer)
+
+            self.plot.begin()
+            x_plot = np.linspace(min(a, b) - 1, max(a, b) + 1, 400)
+            self.plot.line("f", x_plot, f(x_plot), label=f'f(x) = {func_str}', color="#007ACC")
+            self.plot.hline("zero", 0, color='gray', linewidth=0.5)
+            trace = result.iterations
+            self.plot.spans("brackets", zip(trace["a"], trace["b"]), alpha=0.1, color='yellow')
+            self.plot.points("root", [c], [f(c)], label=f'Raiz ≈ {c:.4f}', color='r')
+            self.plot.finish()
+
+        run_for_textbox("zeros.bisection", self.bi_results_box, compute, show)
 
     def run_newton(self):
         try:
             func_str = self.nw_func_entry.get()
-            x_sym = sympy.symbols('x')
-            expr = sympy.sympify(func_str, locals={'e': sympy.E, 'pi': sympy.pi})
-            f = sympy.lambdify(x_sym, expr, 'numpy')
-            f_prime_expr = sympy.diff(expr, x_sym)
-            f_prime = sympy.lambdify(x_sym, f_prime_expr, 'numpy')
-
             x0 = float(self.nw_x0_entry.get())
             tol = float(self.nw_tol_entry.get())
-            max_iter = 50
+        except Exception as e:
+            self._show_error(self.nw_results_box, e)
+            return
 
-            results = " n  |      x_n      |    f(x_n)    |   f'(x_n)   |   |x_n+1 - x_n|\n"
-            results += "-"*70 + "\n"
-            
-            x_n = x0
-            
-            self.ax.clear()
-            x_plot = np.linspace(x0 - 5, x0 + 5, 400)
-            self.ax.plot(x_plot, f(x_plot), label=f'f(x) = {func_str}', color="#007ACC")
-            self.ax.axhline(0, color='gray', linewidth=0.5)
-
-            for n in range(max_iter):
-                f_xn = f(x_n)
-                f_prime_xn = f_prime(x_n)
-                
-                if abs(f_prime_xn) < 1e-12:
-                    results += "Derivada próxima de zero. O método falhou."
-                    break
-
-                x_n1 = x_n - f_xn / f_prime_xn
-                error = abs(x_n1 - x_n)
-                
-                results += f"{n:2d}  | {x_n:13.8f} | {f_xn:12.8f} | {f_prime_xn:11.8f} | {error:15.8f}\n"
-
-                # Plot tangent line
-                tangent_x = np.array([x_n - 1, x_n + 1])
-                tangent_y = f_prime_xn * (tangent_x - x_n) + f_xn
-                self.ax.plot(tangent_x, tangent_y, '--', color='orange', alpha=0.6)
-                self.ax.plot(x_n, f_xn, 'go') # Point on curve
-                self.ax.plot(x_n1, 0, 'rx') # Next approximation on x-axis
-
-                if error < tol:
-                    results += f"\nRaiz encontrada: x = {x_n1}"
-                    x_n = x_n1
-                    break
-                
-                x_n = x_n1
+        def compute():
+            compiled = get_compiled(func_str)
+            f = compiled.func
+            f_prime, _ = compiled.derivative(1)
+
+            result = newton(f, f_prime, x0, tol)
+            if result.zero_derivative:
+                footer = "Derivada próxima de zero. O método falhou."
+            elif result.converged:
+                footer = f"\nRaiz encontrada: x = {result.root}"
             else:
-                results += f"\nMáximo de iterações atingido."
+                footer = f"\nMáximo de iterações atingido."
+            return f, result, footer
+
+        def show(output):
+            f, result, footer = output
+            x_n = result.root
+            self.nw_trace_view.show(result.iterations, footer=footer)
+
+            self.plot.begin()
+            x_plot = np.linspace(x0 - 5, x0 + 5, 400)
+            self.plot.line("f", x_plot, f(x_plot), label=f'f(x) = {func_str}', color="#007ACC")
+            self.plot.hline("zero", 0, color='gray', linewidth=0.5)
+
+            # One artist per kind of overlay, whatever the number of iterations
+            trace = result.iterations
+            if len(trace):
+                x_k, f_xk, f_prime_xk = trace["x"], trace["f_x"], trace["df_x"]
+                tangents = np.stack([np.column_stack([x_k - 1, f_xk - f_prime_xk]),
+                                     np.column_stack([x_k + 1, f_xk + f_prime_xk])], axis=1)
+                self.plot.segments("tangents", tangents, linestyle='--', color='orange', alpha=0.6)
+                self.plot.points("iterates", x_k, f_xk, color='g') # Points on curve
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    # Next approximations on x-axis
+                    self.plot.points("next", x_k - f_xk / f_prime_xk, np.zeros_like(x_k), marker='x', color='r')
 
-            self.nw_results_box.delete("1.0", "end")
-            self.nw_results_box.insert("1.0", results)
-            
-            self.ax.plot(x_n, f(x_n), 'ro', label=f'Raiz ≈ {x_n:.4f}')
-            self.ax.legend(facecolor="#2B2B2B", edgecolor="white", labelcolor="white")
-            self._setup_plot_style()
+            self.plot.points("root", [x_n], [f(x_n)], label=f'Raiz ≈ {x_n:.4f}', color='r')
+            self.plot.finish()
 
+        run_for_textbox("zeros.newton", self.nw_results_box, compute, show)
+
+    def run_all_roots(self):
+        try:
+            func_str = self.ar_func_entry.get()
+            f = self._safe_eval_func(func_str)
+            if f is None:
+                raise ValueError("Função inválida")
+            a, b = float(self.ar_a_entry.get()), float(self.ar_b_entry.get())
+            if a >= b:
+                raise ValueError("O intervalo deve satisfazer a < b.")
+            tol = float(self.ar_tol_entry.get())
+            samples = int(self.ar_samples_entry.get() or 100000)
         except Exception as e:
-            self.nw_results_box.delete("1.0", "end")
-            self.nw_results_box.insert("1.0", f"Erro: {e}")
\ No newline at end of file
+            self._show_error(self.ar_results_box, e)
+            return
+
+        def compute():
+            result = find_all_roots(f, a, b, tol, samples=samples)
+            roots = result.roots
+
+            results = f"Amostras: {result.samples} | Trocas de sinal: {result.brackets} | Raízes de contato: {result.touching}\n"
+            results += "-"*70 + "\n"
+            for i, r in enumerate(roots[:1000]):
+                results += f"{i:4d}  | x = {r:.12f}\n"
+            if len(roots) > 1000:
+                results += f"... ({len(roots) - 1000} raízes omitidas)\n"
+            results += f"\nRaízes encontradas: {len(roots)}"
+            return roots, results
+
+        def show(output):
+            roots, results = output
+            self.ar_results_box.delete("1.0", "end")
+            self.ar_results_box.insert("1.0", results)
+
+            self.plot.begin()
+            x_plot = np.linspace(a, b, 2000)
+            self.plot.line("f", x_plot, f(x_plot) * np.ones_like(x_plot), label=f'f(x) = {func_str}', color="#007ACC")
+            self.plot.hline("zero", 0, color='gray', linewidth=0.5)
+            self.plot.points("roots", roots, np.zeros_like(roots), label=f'{len(roots)} raízes', color='r')
+            self.plot.finish()
+
+        run_for_textbox("zeros.all_roots", self.ar_results_box, compute, show)
+
+    def run_newton_system(self):
+        try:
+            equations = tuple(line.strip() for line in self.sys_equations_box.get("1.0", "end").splitlines()
+                              if line.strip())
+            x0 = np.array([float(v) for v in self.sys_x0_entry.get().replace(";", ",").split(",")])
+            tol = float(self.sys_tol_entry.get() or 1e-10)
+            broyden = self.sys_method_menu.get() == "Broyden"
+            symbolic = self.sys_jacobian_menu.get() == "Simbólica"
+            sparse = self.sys_sparse_var.get()
+        except Exception as e:
+            self._show_error(self.sys_results_box, e)
+            return
+
+        def compute():
+            # Parsed, differentiated and lambdified once per system, then cached
+            system = get_compiled_system(equations)
+            if len(x0) != len(system.symbols):
+                raise ValueError(f"x₀ deve ter {len(system.symbols)} valores ({', '.join(map(str, system.symbols))}).")
+            if symbolic:
+                jacobian, sparsity = system.jacobian(sparse=sparse), None
+            else:
+                jacobian, sparsity = None, system.sparsity if sparse else None
+            result = newton_system(system.func, x0, jacobian, tol, broyden=broyden, sparsity=sparsity)
+
+            intro = f"Incógnitas: {', '.join(map(str, system.symbols))}\n\n"
+            footer = f"\nMétodo: {result.method} | Avaliações de F: {result.function_evals} | Jacobianas: {result.jacobian_evals}\n"
+            if result.singular:
+                footer += "Jacobiana singular. O método falhou."
+            elif result.converged:
+                footer += "\nSolução encontrada:\n" + "\n".join(f"{s} = {v}" for s, v in zip(system.symbols, result.x))
+            else:
+                footer += "\nMáximo de iterações atingido."
+            return result, intro, footer
+
+        def show(output):
+            result, intro, footer = output
+            self.sys_trace_view.show(result.iterations, intro=intro, footer=footer)
+
+            # Convergence history: the residual falls quadratically for Newton, superlinearly for Broyden
+            trace = result.iterations
+            self.plot.begin()
+            with np.errstate(divide='ignore'):
+                self.plot.line("history", trace["n"], np.log10(trace["residual"]), label='log10 ||F(x_n)||',
+                               color="#007ACC", marker='o')
+            self.plot.finish(f"Convergência: {result.method}")
+
+        run_for_textbox("zeros.system", self.sys_results_box, compute, show)
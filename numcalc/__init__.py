@@ -0,0 +1 @@
+"""Numerical core of the app: pure functions and result objects, free of any GUI dependency."""
@@ -0,0 +1,167 @@
+"""Accuracy and throughput benchmark of the Gaussian elimination solver.
+
+Run with ``python -m numcalc.benchmark``; results are written as JSON and can
+be compared against a previous run with ``--compare baseline.json``.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from numcalc.linear_systems import gauss_elimination
+
+FAMILIES = ("hilbert", "random", "diagonally_dominant", "tridiagonal")
+DEFAULT_SIZES = (10, 50, 100, 200, 400)
+
+
+def make_matrix(family, n, rng):
+    """n x n matrix of the given family."""
+    if family == "hilbert":
+        from scipy.linalg import hilbert
+        return hilbert(n)
+    if family == "random":
+        return rng.standard_normal((n, n))
+    if family == "diagonally_dominant":
+        A = rng.standard_normal((n, n))
+        A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+        return A
+    if family == "tridiagonal":
+        return 4.0 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    raise ValueError(f"Família de matrizes desconhecida: {family}")
+
+
+def elimination_flops(n):
+    """Floating-point operations of elimination plus back substitution."""
+    return 2 * n**3 / 3 + 2 * n**2
+
+
+def run_case(family, n, pivoting, repeat=3, seed=0):
+    """Solves A x = b with known x = (1, ..., 1) and returns the measurements as a dict.
+
+    The time is the best of repeat runs. Failures (e.g. a null pivot without
+    pivoting, or a solution with inf/NaN entries) are recorded in "error"
+    instead of raised.
+    """
+    rng = np.random.default_rng(seed)
+    A = make_matrix(family, n, rng)
+    x_true = np.ones(n)
+    b = A @ x_true
+    record = {"family": family, "n": n, "pivoting": pivoting, "condition": float(np.linalg.cond(A))}
+
+    best = np.inf
+    try:
+        with np.errstate(all="ignore"):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                x = gauss_elimination(A, b, pivoting=pivoting, trace=False).x
+                best = min(best, time.perf_counter() - start)
+    except (ValueError, ZeroDivisionError, np.linalg.LinAlgError) as e:
+        record["error"] = str(e)
+        return record
+    if not np.all(np.isfinite(x)):
+        # Overflow (e.g. a tiny pivot without pivoting), silenced above: no meaningful timing or residual
+        record["error"] = "Solução com valores não finitos."
+        return record
+
+    residual = float(np.linalg.norm(A @ x - b))
+    record.update({
+        "time": best,
+        "gflops": elimination_flops(n) / best / 1e9,
+        "residual": residual,
+        "relative_residual": residual / (np.linalg.norm(A) * np.linalg.norm(x) or 1.0),
+        "forward_error": float(np.linalg.norm(x - x_true) / np.linalg.norm(x_true)),
+    })
+    return record
+
+
+def run_suite(sizes=DEFAULT_SIZES, families=FAMILIES, repeat=3, seed=0, log=None):
+    """Runs every (family, size, pivoting) case and returns the report dict."""
+    results = []
+    for family in families:
+        for n in sizes:
+            for pivoting in (True, False):
+                record = run_case(family, n, pivoting, repeat, seed)
+                results.append(record)
+                if log is not None:
+                    log(format_record(record))
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def format_record(record):
+    head = f"{record['family']:<20} n={record['n']:<5} {'pivô' if record['pivoting'] else 'sem pivô':<8}"
+    if "error" in record:
+        return f"{head} erro: {record['error']}"
+    return (f"{head} {record['time']*1000:9.2f} ms {record['gflops']:7.3f} GFLOP/s "
+            f"cond={record['condition']:9.2e} resíduo={record['residual']:9.2e} "
+            f"erro progressivo={record['forward_error']:9.2e}")
+
+
+def compare(baseline, current, time_factor=1.5, error_factor=10.0):
+    """Lists the cases of current that are slower or less accurate than in baseline.
+
+    A case regresses when its time grows by more than time_factor, its
+    forward error grows by more than error_factor (ignoring errors near
+    machine precision) or it fails where the baseline did not.
+    """
+    def key(record):
+        return record["family"], record["n"], record["pivoting"]
+
+    previous = {key(r): r for r in baseline["results"]}
+    regressions = []
+    for record in current["results"]:
+        old = previous.get(key(record))
+        if old is None or "error" in old:
+            continue
+        name = f"{record['family']} n={record['n']} pivoting={record['pivoting']}"
+        if "error" in record:
+            regressions.append(f"{name}: falhou ({record['error']})")
+            continue
+        if record["time"] > time_factor * old["time"]:
+            regressions.append(f"{name}: tempo {old['time']*1000:.2f} -> {record['time']*1000:.2f} ms")
+        floor = 1e3 * np.finfo(float).eps
+        if record["forward_error"] > error_factor * max(old["forward_error"], floor):
+            regressions.append(f"{name}: erro {old['forward_error']:.2e} -> {record['forward_error']:.2e}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark da eliminação de Gauss.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--families", nargs="+", choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_linear.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON de uma execução anterior")
+    parser.add_argument("--time-factor", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.families, args.repeat, args.seed, log=print)
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"Resultados salvos em {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(baseline, report, time_factor=args.time_factor)
+        for line in regressions:
+            print(f"REGRESSÃO {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
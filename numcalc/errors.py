@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from utils.ieee754_converter import FORMATS, fields, from_bits, get_float_details, to_bits
+
+# Classification codes of FloatArrayAnalysis.classes
+CLASSES = ("zero", "subnormal", "normal", "infinito", "NaN")
+ZERO, SUBNORMAL, NORMAL, INF, NAN = range(len(CLASSES))
+
+
+def analyze_float(num_str):
+    """IEEE 754 details of num_str in every supported format, each with its representation error.
+
+    Returns None if num_str is not a number.
+    """
+    details = get_float_details(num_str)
+    if details is None:
+        return None
+    value = float(num_str)
+    for precision in details.values():
+        precision["error"] = value - precision["reconstructed"]
+    return details
+
+
+@dataclass
+class FloatArrayAnalysis:
+    """Element-wise IEEE 754 analysis of an array stored in one format.
+
+    error is value - stored, and ulp_error the same in units in the last
+    place of the stored value (at most 0.5 when rounding to nearest; inf
+    for values that overflowed, NaN for NaN inputs).
+    """
+    precision: str
+    bits: np.ndarray
+    sign: np.ndarray
+    exponent: np.ndarray
+    mantissa: np.ndarray
+    stored: np.ndarray
+    error: np.ndarray
+    ulp_error: np.ndarray
+    classes: np.ndarray
+    overflow: np.ndarray
+
+    def histograms(self, bins=10):
+        """Aggregate counts: per class, per biased exponent, and of the ULP and relative errors.
+
+        ULP statistics cover the finite stored values only.
+        """
+        finite = np.isfinite(self.ulp_error)
+        ulp_counts, ulp_edges = np.histogram(self.ulp_error[finite], bins=bins, range=(0.0, 0.5))
+
+        nonzero = finite & (self.stored != 0)
+        with np.errstate(divide="ignore"):
+            rel = np.log10(np.abs(self.error[nonzero] / self.stored[nonzero]))
+        rel = np.maximum(rel, -20.0) # exact values land in the first bin
+        rel_counts, rel_edges = np.histogram(rel, bins=20, range=(-20.0, 0.0))
+
+        return {
+            "classes": dict(zip(CLASSES, np.bincount(self.classes, minlength=len(CLASSES)).tolist())),
+            "overflow": int(self.overflow.sum()),
+            "exponent": np.bincount(self.exponent.astype(np.int64),
+                                    minlength=1 << FORMATS[self.precision].exponent_bits),
+            "ulp_error": (ulp_counts, ulp_edges),
+            "max_ulp_error": float(self.ulp_error[finite].max()) if finite.any() else 0.0,
+            "mean_ulp_error": float(self.ulp_error[finite].mean()) if finite.any() else 0.0,
+            "log10_relative_error": (rel_counts, rel_edges),
+        }
+
+
+def analyze_array(values, precisions=tuple(FORMATS)):
+    """Analyzes how every element of values is stored in each of the given formats.
+
+    values are taken as exact (converted to float64); returns a dict
+    precision -> FloatArrayAnalysis. Fully vectorized: fields come from
+    shifts and masks on the bit patterns.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind != "f":
+        values = values.astype(np.float64)
+    values = values.ravel()
+    exact = values.astype(np.float64)
+
+    analyses = {}
+    for precision in precisions:
+        fmt = FORMATS[precision]
+        bits = to_bits(values, precision)
+        sign, exponent, mantissa = fields(bits, precision)
+        stored = from_bits(bits, precision)
+
+        max_exponent = (1 << fmt.exponent_bits) - 1
+        classes = np.full(len(values), NORMAL, dtype=np.uint8)
+        classes[(exponent == 0) & (mantissa == 0)] = ZERO
+        classes[(exponent == 0) & (mantissa != 0)] = SUBNORMAL
+        classes[(exponent == max_exponent) & (mantissa == 0)] = INF
+        classes[(exponent == max_exponent) & (mantissa != 0)] = NAN
+        overflow = np.isfinite(exact) & np.isinf(stored)
+
+        bias = (1 << (fmt.exponent_bits - 1)) - 1
+        ulp = np.ldexp(1.0, np.maximum(exponent.astype(np.int64), 1) - bias - fmt.mantissa_bits)
+        with np.errstate(invalid="ignore"):
+            error = np.where(np.isfinite(stored), exact - stored, np.where(overflow, exact, np.nan))
+        ulp_error = np.where(overflow, np.inf, np.abs(error) / ulp)
+
+        analyses[precision] = FloatArrayAnalysis(precision, bits, sign, exponent, mantissa, stored,
+                                                 error, ulp_error, classes, overflow)
+    return analyses
+
+
+def analyze_file(path, precisions=tuple(FORMATS)):
+    """analyze_array over all values of a CSV/TXT, .npy or .npz file."""
+    from numcalc.matrix_io import load_matrix
+
+    values = load_matrix(path)
+    if hasattr(values, "toarray"):
+        values = values.toarray()
+    return analyze_array(values, precisions)
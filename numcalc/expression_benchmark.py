@@ -0,0 +1,76 @@
+"""Per-call cost of the expression backends.
+
+Run with ``python -m numcalc.expression_benchmark``; every expression is
+timed on a scalar and on arrays of several sizes with each backend, with
+plain sympy.lambdify (no CSE) as the baseline and "auto" being the
+dispatching function that the application uses.
+"""
+import argparse
+import sys
+import timeit
+
+import numpy as np
+import sympy
+
+from numcalc.expressions import X, available_backends, compile_backend, lambdify, parse_expression
+
+DEFAULT_EXPRESSIONS = (
+    "x**3 - x - 2",
+    "exp(x)*sin(x) + exp(x)/(1 + exp(x))",
+    "sqrt(1 + x**2)*log(1 + x**2) - cos(sqrt(1 + x**2))",
+)
+# Size 1 stands for a Python float
+DEFAULT_SIZES = (1, 1000, 100_000, 1_000_000)
+
+
+def time_call(f, x, repeat=3):
+    """Seconds per call of f(x), best of repeat runs of at least 0.2 s each."""
+    timer = timeit.Timer(lambda: f(x))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_case(func_str, sizes, repeat=3):
+    """One record per (size, backend) for func_str."""
+    expr = parse_expression(func_str)
+    functions = {"sympy (sem CSE)": sympy.lambdify(X, expr, "numpy")}
+    functions.update((name, compile_backend(expr, name)) for name in available_backends())
+    functions["auto"] = lambdify(expr)
+
+    records = []
+    for size in sizes:
+        x = 0.7 if size == 1 else np.linspace(0.1, 2.0, size)
+        for name, f in functions.items():
+            if name == "math" and size != 1:
+                continue
+            with np.errstate(all="ignore"):
+                seconds = time_call(f, x, repeat)
+            records.append({"expression": func_str, "size": size, "backend": name, "time": seconds})
+    return records
+
+
+def format_record(record):
+    size = "escalar" if record["size"] == 1 else f"n={record['size']}"
+    line = f"  {size:>10}  {record['backend']:<16} {record['time']*1e6:12.3f} µs/chamada"
+    if record["size"] > 1:
+        line += f"  {record['time']*1e9/record['size']:8.3f} ns/elemento"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Custo por chamada dos backends de expressões.")
+    parser.add_argument("--expressions", nargs="+", default=list(DEFAULT_EXPRESSIONS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"Backends disponíveis: {', '.join(available_backends())}")
+    for func_str in args.expressions:
+        print(f"\nf(x) = {func_str}")
+        for record in run_case(func_str, args.sizes, args.repeat):
+            print(format_record(record))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+import functools
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import sympy
+
+X = sympy.symbols('x')
+
+DEFAULT_LOCALS = {'e': sympy.E, 'pi': sympy.pi}
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+def parse_expression(func_str, local_dict=None):
+    """Parses func_str into a sympy expression in x. Raises ValueError on invalid input."""
+    if local_dict is None:
+        local_dict = DEFAULT_LOCALS
+    try:
+        return sympy.sympify(func_str, locals=local_dict)
+    except (sympy.SympifyError, SyntaxError, TypeError) as e:
+        raise ValueError("Função inválida") from e
+
+
+BACKENDS = ("numpy", "math", "numexpr")
+# Arrays with at least this many elements are evaluated by numexpr, when it is installed
+NUMEXPR_MIN_SIZE = 20_000
+
+
+@functools.lru_cache(maxsize=None)
+def _numexpr():
+    """The numexpr module, or None if it is not installed."""
+    try:
+        import numexpr
+    except ImportError:
+        return None
+    return numexpr
+
+
+def available_backends():
+    """The BACKENDS usable here: numexpr only when it is installed."""
+    return tuple(b for b in BACKENDS if b != "numexpr" or _numexpr() is not None)
+
+
+def _numexpr_function(expr, symbol):
+    """expr as a chain of numexpr evaluations, one per common subexpression."""
+    from sympy.printing.lambdarepr import NumExprPrinter
+    numexpr = _numexpr()
+    printer = NumExprPrinter()
+
+    def source(e):
+        # numexpr knows no named constants
+        code = printer._print(e.xreplace({c: sympy.Float(c) for c in e.atoms(sympy.NumberSymbol)}))
+        # Functions numexpr lacks are printed as Python or math-module code
+        if "math." in code or " if " in code:
+            raise ValueError("Expressão não suportada pelo numexpr.")
+        return code
+
+    replacements, (reduced,) = sympy.cse(expr, symbols=sympy.numbered_symbols("cse"))
+    steps = [(str(s), source(sub)) for s, sub in replacements]
+    final = source(reduced)
+    name = str(symbol)
+
+    def f(x):
+        local = {name: x}
+        for target, code in steps:
+            local[target] = numexpr.evaluate(code, local_dict=local)
+        return numexpr.evaluate(final, local_dict=local)
+    return f
+
+
+def compile_backend(expr, backend, symbol=X):
+    """Callable of expr for one of BACKENDS, each common subexpression computed once.
+
+    "numpy" suits arrays, "math" single Python floats (no NumPy dispatch
+    per operation) and "numexpr" large arrays (multithreaded, evaluated
+    in cache-sized blocks without full-size temporaries).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {backend}")
+    if backend == "numexpr":
+        if _numexpr() is None:
+            raise ValueError("numexpr não está instalado.")
+        return _numexpr_function(expr, symbol)
+    return sympy.lambdify(symbol, expr, backend, cse=True)
+
+
+_SCALAR_TYPES = (float, int, np.floating, np.integer)
+
+
+class MultiBackendFunction:
+    """expr compiled for several backends, chosen by the type of the argument.
+
+    Scalars run the math-module code. Where it raises (domain errors,
+    overflow, division by zero, functions math lacks) or returns a complex
+    number, the NumPy code is used instead, so results are NumPy's nan and inf.
+    Arrays run the NumPy code, or numexpr from NUMEXPR_MIN_SIZE elements
+    if every function of expr is available there.
+    """
+
+    def __init__(self, expr, symbol=X):
+        self.expr = expr
+        self.numpy = compile_backend(expr, "numpy", symbol)
+        self.math = compile_backend(expr, "math", symbol)
+        self.numexpr = None
+        if _numexpr() is not None and symbol in expr.free_symbols:
+            try:
+                self.numexpr = compile_backend(expr, "numexpr", symbol)
+            except ValueError:
+                pass
+
+    def __call__(self, x):
+        # Exact float first: the isinstance check against NumPy types costs as much as the math code
+        if type(x) is float or isinstance(x, _SCALAR_TYPES):
+            try:
+                y = self.math(float(x))
+                if type(y) is not complex:
+                    return y
+            except (ArithmeticError, ValueError, TypeError, NameError):
+                pass
+            return self.numpy(np.float64(x))
+        if (self.numexpr is not None and isinstance(x, np.ndarray) and x.dtype.kind == "f"
+                and x.size >= NUMEXPR_MIN_SIZE):
+            return self.numexpr(x)
+        return self.numpy(x)
+
+
+def lambdify(expr):
+    """Turns a sympy expression in x into a callable for scalars and NumPy arrays."""
+    return MultiBackendFunction(expr)
+
+
+class CompiledExpression:
+    """A parsed expression with its callable; derivatives are derived on first use."""
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.func = lambdify(expr)
+        self._derivatives = {0: (self.func, expr)}
+        self._lock = threading.Lock()
+
+    def __call__(self, x):
+        return self.func(x)
+
+    def derivative(self, order=1):
+        """Returns (f^(order), its sympy expression), computing it only once."""
+        with self._lock:
+            if order not in self._derivatives:
+                # Differentiate the highest known order instead of starting from f
+                known = max(k for k in self._derivatives if k < order)
+                d_expr = sympy.diff(self._derivatives[known][1], X, order - known)
+                self._derivatives[order] = (lambdify(d_expr), d_expr)
+            return self._derivatives[order]
+
+
+class ExpressionCache:
+    """Bounded LRU cache of CompiledExpression keyed by expression string and locals table."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def make_key(func_str, local_dict):
+        normalized = " ".join(str(func_str).split())
+        return normalized, tuple(sorted((k, sympy.srepr(v)) for k, v in local_dict.items()))
+
+    def get(self, func_str, local_dict=None):
+        if local_dict is None:
+            local_dict = DEFAULT_LOCALS
+        key = self.make_key(func_str, local_dict)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        # Parse outside the lock; a concurrent miss on the same key just compiles twice
+        compiled = CompiledExpression(parse_expression(key[0], local_dict))
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+expression_cache = ExpressionCache()
+
+
+def get_compiled(func_str, local_dict=None):
+    """Returns the cached CompiledExpression for func_str, compiling it on a miss."""
+    return expression_cache.get(func_str, local_dict)
+
+
+def compile_function(func_str, local_dict=None):
+    """Returns (f, expr) for func_str, where f is the NumPy callable of expr."""
+    compiled = get_compiled(func_str, local_dict)
+    return compiled.func, compiled.expr
+
+
+class CompiledSystem:
+    """A system F(x) = 0 of equations in several unknowns, compiled for NumPy.
+
+    func takes the vector of unknowns and returns the vector of residuals.
+    The Jacobian is differentiated symbolically on first use and lambdified
+    once into a single callable for all its nonzero entries, which then fill
+    either a dense array or a CSR matrix.
+    """
+
+    def __init__(self, exprs, symbols):
+        self.exprs = exprs
+        self.symbols = symbols
+        values = sympy.lambdify(symbols, exprs, 'numpy', cse=True)
+        self.func = lambda x: np.array(values(*x), dtype=float)
+        self.shape = (len(exprs), len(symbols))
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def __call__(self, x):
+        return self.func(x)
+
+    def _jacobian_entries(self):
+        """(rows, cols, values) of the nonzero Jacobian entries; values(*x) evaluates them all."""
+        with self._lock:
+            if self._entries is None:
+                # Each equation is differentiated only by the unknowns it contains
+                rows, cols, derivatives = [], [], []
+                for i, j in zip(*self._pattern()):
+                    d = sympy.diff(self.exprs[i], self.symbols[j])
+                    if d != 0:
+                        rows.append(i)
+                        cols.append(j)
+                        derivatives.append(d)
+                values = sympy.lambdify(self.symbols, derivatives, 'numpy', cse=True)
+                self._entries = (np.array(rows, dtype=int), np.array(cols, dtype=int), values)
+            return self._entries
+
+    def _pattern(self):
+        """(rows, cols) of the unknowns appearing in each equation, row by row."""
+        index = {s: j for j, s in enumerate(self.symbols)}
+        rows, cols = [], []
+        for i, expr in enumerate(self.exprs):
+            present = sorted(index[s] for s in expr.free_symbols if s in index)
+            rows.extend([i] * len(present))
+            cols.extend(present)
+        return np.array(rows, dtype=int), np.array(cols, dtype=int)
+
+    @property
+    def sparsity(self):
+        """Nonzero pattern of the Jacobian, read from the unknowns in each equation, as a boolean CSR matrix."""
+        import scipy.sparse as sp
+        rows, cols = self._pattern()
+        return sp.csr_matrix((np.ones(len(rows), dtype=bool), (rows, cols)), shape=self.shape)
+
+    def jacobian(self, sparse=False):
+        """Callable x -> J(x), a dense array or (sparse=True) a CSR matrix."""
+        import scipy.sparse as sp
+        rows, cols, values = self._jacobian_entries()
+
+        def J(x):
+            v = np.array(values(*x), dtype=float)
+            if sparse:
+                return sp.csr_matrix((v, (rows, cols)), shape=self.shape)
+            M = np.zeros(self.shape)
+            M[rows, cols] = v
+            return M
+        return J
+
+
+def _natural_key(symbol):
+    """Sort key that puts x2 before x10."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", symbol.name)]
+
+
+def compile_system(equations, variables=None, local_dict=None):
+    """Compiles equations into a CompiledSystem. Raises ValueError on invalid input.
+
+    Each equation is an expression equal to zero or "lhs = rhs". The
+    unknowns are the given variable names, by default every free symbol in
+    natural order (x1, x2, ..., x10).
+    """
+    exprs = []
+    for eq in equations:
+        lhs, sep, rhs = eq.partition("=")
+        if sep and not rhs.startswith("="):
+            exprs.append(parse_expression(lhs, local_dict) - parse_expression(rhs, local_dict))
+        else:
+            exprs.append(parse_expression(eq, local_dict))
+    if variables is None:
+        symbols = sorted(set().union(*(e.free_symbols for e in exprs)), key=_natural_key)
+    else:
+        symbols = [sympy.Symbol(v) for v in variables]
+    if not symbols:
+        raise ValueError("O sistema não tem incógnitas.")
+    return CompiledSystem(exprs, symbols)
+
+
+@functools.lru_cache(maxsize=32)
+def get_compiled_system(equations, variables=None):
+    """Cached compile_system for a tuple of equations (and of variable names)."""
+    return compile_system(equations, variables)
@@ -0,0 +1,356 @@
+import multiprocessing
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import sympy
+
+from numcalc.expressions import X, lambdify
+
+NEWTON_COTES_FORMULAS = {
+    "Trapézio": "I ≈ (h/2) * [f(x0) + 2∑f(xi) + f(xn)]",
+    "Simpson 1/3": "I ≈ (h/3) * [f(x0) + 4∑ímpar + 2∑par + f(xn)]",
+    "Simpson 3/8": "I ≈ (3h/8) * [f(x0) + 3*f(x1) + 3*f(x2) + 2*f(x3) + ...]",
+}
+
+# Time budget in seconds for the symbolic reference integral
+REFERENCE_TIMEOUT = 3.0
+# Fresh interpreters for sympy.integrate: forking a process that runs Tk and worker threads is unsafe
+_PROCESS_CONTEXT = multiprocessing.get_context("spawn")
+# Most subintervals (accepted plus pending) an adaptive rule may hold, like QUADPACK's limit
+MAX_SUBINTERVALS = 100_000
+
+INTEGRATION_LOCALS = {'e': sympy.E, 'pi': sympy.pi, 'sin': sympy.sin, 'cos': sympy.cos,
+                      'exp': sympy.exp, 'log': sympy.log}
+
+
+@dataclass
+class NewtonCotesResult:
+    """Composite Newton-Cotes estimate together with the grid it was computed on."""
+    value: float
+    rule: str
+    h: float
+    x: np.ndarray
+    y: np.ndarray
+
+    @property
+    def formula(self):
+        return NEWTON_COTES_FORMULAS[self.rule]
+
+
+@dataclass
+class GaussResult:
+    """Gauss-Legendre estimate with the reference nodes t, weights w and mapped nodes x.
+
+    x and fx hold the nodes of every panel, panel by panel.
+    """
+    value: float
+    t: np.ndarray
+    w: np.ndarray
+    x: np.ndarray
+    fx: np.ndarray
+
+
+@dataclass
+class AdaptiveResult:
+    """Adaptive quadrature estimate.
+
+    intervals holds the accepted subintervals as an (m, 2) array and
+    evaluations the number of points at which f was evaluated.
+    """
+    value: float
+    error: float
+    evaluations: int
+    intervals: np.ndarray
+    converged: bool
+    rule: str
+
+
+@dataclass
+class ReferenceIntegral:
+    """Reference value of an integral: symbolic when sympy finishes in time, numerical otherwise."""
+    value: float
+    method: str
+    error: float = 0.0
+
+
+# Gauss-Kronrod 7-15 on [-1, 1] (QUADPACK): Kronrod nodes in decreasing order, the
+# Gauss nodes are the odd-indexed ones
+GK15_NODES = np.array([0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+                       0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+                       0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+                       0.207784955007898467600689403773245, 0.0])
+GK15_KRONROD_WEIGHTS = np.array([0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                                 0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                                 0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                                 0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+GK15_GAUSS_WEIGHTS = np.array([0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+                               0.381830050505118944950369775488975, 0.417959183673469387755102040816327])
+
+# Full symmetric 15-point tables
+_GK15_T = np.concatenate([-GK15_NODES[:-1], GK15_NODES[::-1]])
+_GK15_WK = np.concatenate([GK15_KRONROD_WEIGHTS[:-1], GK15_KRONROD_WEIGHTS[::-1]])
+_GK15_WG = np.zeros(15)
+_GK15_WG[1:7:2] = GK15_GAUSS_WEIGHTS[:3]
+_GK15_WG[7] = GK15_GAUSS_WEIGHTS[3]
+_GK15_WG[9:15:2] = GK15_GAUSS_WEIGHTS[2::-1]
+
+
+def _evaluate(f, x):
+    """Evaluates f on the array x, broadcasting constant functions to x's shape."""
+    return np.asarray(f(x), dtype=float) * np.ones_like(x)
+
+
+def newton_cotes(f, a, b, N, rule):
+    """Integrates f over [a, b] with the composite rule on N subintervals."""
+    if rule not in NEWTON_COTES_FORMULAS:
+        raise ValueError(f"Regra desconhecida: {rule}")
+
+    h = (b - a) / N
+    x_vals = np.linspace(a, b, N + 1)
+    y_vals = f(x_vals) * np.ones_like(x_vals)
+
+    if rule == "Trapézio":
+        result = (h/2) * (y_vals[0] + 2*np.sum(y_vals[1:-1]) + y_vals[-1])
+
+    elif rule == "Simpson 1/3":
+        if N % 2 != 0: raise ValueError("Para Simpson 1/3, N deve ser par.")
+        result = (h/3) * (y_vals[0] + 4*np.sum(y_vals[1:-1:2]) + 2*np.sum(y_vals[2:-1:2]) + y_vals[-1])
+
+    else:
+        if N % 3 != 0: raise ValueError("Para Simpson 3/8, N deve ser múltiplo de 3.")
+        # Weights 1, 3, 3, 2, 3, 3, 2, ..., 3, 3, 1
+        weights = np.full(N + 1, 3.0)
+        weights[::3] = 2.0
+        weights[0] = weights[-1] = 1.0
+        result = (3 * h / 8) * np.dot(weights, y_vals)
+
+    return NewtonCotesResult(float(result), rule, h, x_vals, y_vals)
+
+
+@lru_cache(maxsize=None)
+def gauss_nodes(n):
+    """Nodes and weights of the n-point Gauss-Legendre rule on [-1, 1], memoized per n.
+
+    The roots of P_n are found by Newton's method on the three-term
+    recurrence, iterating all of them at once from Tricomi's estimate.
+    """
+    if n < 1:
+        raise ValueError("O número de pontos de Gauss deve ser >= 1.")
+    i = np.arange(1, n + 1)
+    t = np.cos(np.pi * (i - 0.25) / (n + 0.5))
+    for _ in range(100):
+        # P_n(t) and P_{n-1}(t) by (k+1) P_{k+1} = (2k+1) t P_k - k P_{k-1}
+        p_prev, p = np.ones_like(t), t.copy()
+        for k in range(1, n):
+            p_prev, p = p, ((2*k + 1) * t * p - k * p_prev) / (k + 1)
+        dp = n * (t * p - p_prev) / (t**2 - 1)
+        step = p / dp
+        t -= step
+        if np.max(np.abs(step)) < 1e-15:
+            break
+    # Recompute P'_n at the converged roots for the weights
+    p_prev, p = np.ones_like(t), t.copy()
+    for k in range(1, n):
+        p_prev, p = p, ((2*k + 1) * t * p - k * p_prev) / (k + 1)
+    dp = n * (t * p - p_prev) / (t**2 - 1)
+    w = 2 / ((1 - t**2) * dp**2)
+
+    # Increasing order; read-only since the arrays are shared through the cache
+    t, w = t[::-1].copy(), w[::-1].copy()
+    t.flags.writeable = False
+    w.flags.writeable = False
+    return t, w
+
+
+def gauss_legendre(f, a, b, n, panels=1):
+    """Integrates f over [a, b] with the n-point Gauss-Legendre rule on each of panels equal panels.
+
+    All panels*n mapped nodes are evaluated in a single call to f.
+    """
+    t, w = gauss_nodes(n)
+
+    # Change of variables on each panel [lo, hi]
+    # x = ((hi-lo)*t + (hi+lo))/2
+    # dx = ((hi-lo)/2) dt
+    edges = np.linspace(a, b, panels + 1)
+    factor = (edges[1:] - edges[:-1]) / 2
+    x_mapped = ((edges[1:] + edges[:-1]) / 2)[:, None] + factor[:, None] * t
+    fx = _evaluate(f, x_mapped)
+
+    result = np.sum(factor * (fx @ w))
+    return GaussResult(float(result), t, w, x_mapped.ravel(), fx.ravel())
+
+
+def adaptive_simpson(f, a, b, abs_tol=1e-8, rel_tol=1e-8, max_levels=50, limit=MAX_SUBINTERVALS):
+    """Adaptive Simpson quadrature of f over [a, b].
+
+    All subintervals of a level are refined together: each one costs two
+    new evaluations of f, done in a single vectorized call. A subinterval
+    is accepted once |S_left + S_right - S| / 15 is within its share of
+    max(abs_tol, rel_tol*|I|), proportional to its width. Refinement stops,
+    not converged, after max_levels or once there would be more than limit
+    subintervals.
+    """
+    if max_levels < 1 or limit < 1:
+        raise ValueError("max_levels e limit devem ser pelo menos 1.")
+    if a == b:
+        return AdaptiveResult(0.0, 0.0, 0, np.array([[a, b]], dtype=float), True, "Simpson adaptativo")
+    lo, hi = np.array([a], dtype=float), np.array([b], dtype=float)
+    mid = (lo + hi) / 2
+    f_lo, f_mid, f_hi = np.split(_evaluate(f, np.concatenate([lo, mid, hi])), 3)
+    S = (hi - lo) / 6 * (f_lo + 4*f_mid + f_hi)
+    evaluations = 3
+    value = error = 0.0
+    accepted = []
+    n_accepted = 0
+
+    for _ in range(max_levels):
+        if lo.size == 0 or n_accepted + lo.size > limit:
+            break
+        mid = (lo + hi) / 2
+        q = _evaluate(f, np.concatenate([(lo + mid) / 2, (mid + hi) / 2]))
+        f_lq, f_rq = q[:lo.size], q[lo.size:]
+        evaluations += q.size
+        S_l = (mid - lo) / 6 * (f_lo + 4*f_lq + f_mid)
+        S_r = (hi - mid) / 6 * (f_mid + 4*f_rq + f_hi)
+        delta = S_l + S_r - S
+        err = np.abs(delta) / 15
+
+        tol = max(abs_tol, rel_tol * abs(value + np.sum(S_l + S_r)))
+        ok = err <= tol * (hi - lo) / (b - a)
+        value += np.sum((S_l + S_r + delta / 15)[ok])
+        error += np.sum(err[ok])
+        accepted.append(np.column_stack([lo[ok], hi[ok]]))
+        n_accepted += np.count_nonzero(ok)
+
+        keep = ~ok
+        lo, mid, hi = lo[keep], mid[keep], hi[keep]
+        f_lo, f_lq, f_mid, f_rq, f_hi = f_lo[keep], f_lq[keep], f_mid[keep], f_rq[keep], f_hi[keep]
+        S_l, S_r = S_l[keep], S_r[keep]
+        # Children [lo, mid] and [mid, hi]
+        lo, hi = np.concatenate([lo, mid]), np.concatenate([mid, hi])
+        f_lo, f_mid, f_hi = np.concatenate([f_lo, f_mid]), np.concatenate([f_lq, f_rq]), np.concatenate([f_mid, f_hi])
+        S = np.concatenate([S_l, S_r])
+
+    converged = lo.size == 0
+    if not converged:
+        # Out of levels: take what is left at face value
+        value += np.sum(S)
+        accepted.append(np.column_stack([lo, hi]))
+    intervals = np.concatenate(accepted)
+    return AdaptiveResult(float(value), float(error), evaluations, intervals[np.argsort(intervals[:, 0])],
+                          converged, "Simpson adaptativo")
+
+
+def gauss_kronrod(f, a, b, abs_tol=1e-10, rel_tol=1e-10, max_levels=50, limit=MAX_SUBINTERVALS):
+    """Adaptive Gauss-Kronrod (G7K15) quadrature of f over [a, b].
+
+    The 7-point Gauss estimate is embedded in the 15-point Kronrod one and
+    |K15 - G7| is the local error estimate. Subintervals failing their
+    share of the tolerance are halved; each level evaluates all of their
+    15-point rules in one vectorized call. Refinement stops, not converged,
+    after max_levels or once there would be more than limit subintervals.
+    """
+    if max_levels < 1 or limit < 1:
+        raise ValueError("max_levels e limit devem ser pelo menos 1.")
+    if a == b:
+        return AdaptiveResult(0.0, 0.0, 0, np.array([[a, b]], dtype=float), True, "Gauss-Kronrod G7K15")
+    lo, hi = np.array([a], dtype=float), np.array([b], dtype=float)
+    evaluations = 0
+    value = error = 0.0
+    accepted = []
+    n_accepted = 0
+
+    for _ in range(max_levels):
+        if lo.size == 0 or n_accepted + lo.size > limit:
+            break
+        center, half = (lo + hi) / 2, (hi - lo) / 2
+        fx = _evaluate(f, center[:, None] + half[:, None] * _GK15_T)
+        evaluations += fx.size
+        K = half * (fx @ _GK15_WK)
+        G = half * (fx @ _GK15_WG)
+        err = np.abs(K - G)
+
+        tol = max(abs_tol, rel_tol * abs(value + np.sum(K)))
+        ok = err <= tol * (hi - lo) / (b - a)
+        value += np.sum(K[ok])
+        error += np.sum(err[ok])
+        accepted.append(np.column_stack([lo[ok], hi[ok]]))
+        n_accepted += np.count_nonzero(ok)
+
+        lo, center, hi = lo[~ok], center[~ok], hi[~ok]
+        K_left = K[~ok]
+        lo, hi = np.concatenate([lo, center]), np.concatenate([center, hi])
+
+    converged = lo.size == 0
+    if not converged:
+        value += np.sum(K_left)
+        error += np.sum(err[~ok])
+        accepted.append(np.column_stack([lo[:lo.size // 2], hi[hi.size // 2:]]))
+    intervals = np.concatenate(accepted)
+    return AdaptiveResult(float(value), float(error), evaluations, intervals[np.argsort(intervals[:, 0])],
+                          converged, "Gauss-Kronrod G7K15")
+
+
+def _integrate_worker(expr, a, b, conn):
+    """Runs in a child process so that a runaway sympy.integrate can be terminated."""
+    try:
+        conn.send(("ok", float(sympy.integrate(expr, (X, a, b)))))
+    except Exception as e:
+        conn.send(("error", str(e)))
+    finally:
+        conn.close()
+
+
+def symbolic_integral(expr, a, b, timeout=REFERENCE_TIMEOUT):
+    """Symbolic integral of expr over [a, b], or None if it fails or takes longer than timeout seconds."""
+    receiver, sender = _PROCESS_CONTEXT.Pipe(duplex=False)
+    proc = _PROCESS_CONTEXT.Process(target=_integrate_worker, args=(expr, a, b, sender), daemon=True)
+    proc.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            status, value = receiver.recv()
+            if status == "ok" and np.isfinite(value):
+                return value
+        return None
+    except EOFError:
+        return None
+    finally:
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+        receiver.close()
+
+
+_reference_cache = OrderedDict()
+_reference_lock = threading.Lock()
+
+
+def reference_integral(expr, a, b, timeout=REFERENCE_TIMEOUT):
+    """Reference value of the integral of expr over [a, b], memoized per (expr, a, b).
+
+    sympy.integrate gets timeout seconds in a separate process; on timeout
+    or when there is no closed form, falls back to G7K15 at 1e-13.
+    """
+    key = (sympy.srepr(expr), float(a), float(b))
+    with _reference_lock:
+        if key in _reference_cache:
+            _reference_cache.move_to_end(key)
+            return _reference_cache[key]
+
+    value = symbolic_integral(expr, a, b, timeout)
+    if value is not None:
+        ref = ReferenceIntegral(value, "simbólico")
+    else:
+        res = gauss_kronrod(lambdify(expr), a, b, 1e-13, 1e-13)
+        ref = ReferenceIntegral(res.value, "numérico", res.error)
+
+    with _reference_lock:
+        _reference_cache[key] = ref
+        while len(_reference_cache) > 256:
+            _reference_cache.popitem(last=False)
+    return ref
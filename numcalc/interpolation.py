@@ -0,0 +1,289 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# Above this many nodes the monomial coefficients are too ill-conditioned to be worth showing
+MAX_FORMAT_NODES = 20
+# Query points times nodes evaluated at once, to bound the temporary arrays
+_EVAL_CHUNK = 1 << 20
+
+
+def _log_weights(x, nodes):
+    """log|1 / prod(x - nodes)| and its sign, ignoring the node equal to x."""
+    diff = x - nodes
+    diff = diff[diff != 0]
+    return -np.sum(np.log(np.abs(diff))), np.prod(np.sign(diff))
+
+
+def barycentric_weights(x):
+    """Barycentric weights w_j = 1 / prod_{k != j} (x_j - x_k), up to a common factor.
+
+    Computed in the log domain and scaled so that max |w_j| = 1, which keeps
+    them finite for thousands of nodes; the common factor cancels out in the
+    barycentric formula. O(n^2) time, O(n) memory.
+    """
+    x = np.asarray(x, dtype=float)
+    logs = np.empty(len(x))
+    signs = np.empty(len(x))
+    for j in range(len(x)):
+        logs[j], signs[j] = _log_weights(x[j], x)
+    return signs * np.exp(logs - logs.max())
+
+
+def chebyshev_nodes(n, a=-1.0, b=1.0, kind=2):
+    """n + 1 Chebyshev nodes in [a, b], in decreasing order.
+
+    kind=1: roots of T_{n+1}; kind=2: extrema of T_n, endpoints included.
+    """
+    j = np.arange(n + 1)
+    if kind == 1:
+        t = np.cos((2 * j + 1) * np.pi / (2 * n + 2))
+    elif kind == 2:
+        t = np.cos(j * np.pi / n) if n > 0 else np.zeros(1)
+    else:
+        raise ValueError("Tipo de nós de Chebyshev deve ser 1 ou 2.")
+    return (a + b) / 2 + (b - a) / 2 * t
+
+
+def chebyshev_weights(n, kind=2):
+    """Closed-form barycentric weights of chebyshev_nodes(n, kind=kind), O(n)."""
+    j = np.arange(n + 1)
+    signs = np.where(j % 2 == 0, 1.0, -1.0)
+    if kind == 1:
+        return signs * np.sin((2 * j + 1) * np.pi / (2 * n + 2))
+    if kind == 2:
+        w = signs.copy()
+        w[0] *= 0.5
+        w[-1] *= 0.5
+        return w
+    raise ValueError("Tipo de nós de Chebyshev deve ser 1 ou 2.")
+
+
+@dataclass
+class LagrangeResult:
+    """Lagrange interpolating polynomial through the nodes (x, y), in barycentric form.
+
+    x is kept sorted; w holds the barycentric weights, up to a common factor.
+    Evaluation costs O(n) per point.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    w: np.ndarray
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        flat = t.ravel()
+        out = np.empty(flat.shape)
+        chunk = max(1, _EVAL_CHUNK // len(self.x))
+        for start in range(0, len(flat), chunk):
+            out[start:start + chunk] = self._evaluate(flat[start:start + chunk])
+        return out.reshape(t.shape) if t.ndim else out[0]
+
+    def _evaluate(self, t):
+        diff = t[:, None] - self.x[None, :]
+        exact_row, exact_col = np.nonzero(diff == 0)
+        diff[exact_row, exact_col] = 1.0 # replaced below
+        terms = self.w / diff
+        values = (terms @ self.y) / terms.sum(axis=1)
+        values[exact_row] = self.y[exact_col]
+        return values
+
+    def add_point(self, x_new, y_new):
+        """Inserts the node (x_new, y_new), updating the weights in O(n)."""
+        x_new = float(x_new)
+        pos = np.searchsorted(self.x, x_new)
+        if pos < len(self.x) and self.x[pos] == x_new:
+            raise ValueError("Pontos com x repetido.")
+
+        # Common factor of the stored weights, measured on node 0
+        log_true, _ = _log_weights(self.x[0], self.x)
+        log_scale = np.log(abs(self.w[0])) - log_true
+
+        log_new, sign_new = _log_weights(x_new, self.x)
+        w = self.w / (self.x - x_new)
+        w_new = sign_new * np.exp(log_new + log_scale)
+
+        self.x = np.insert(self.x, pos, x_new)
+        self.y = np.insert(self.y, pos, float(y_new))
+        w = np.insert(w, pos, w_new)
+        self.w = w / np.abs(w).max()
+
+    @property
+    def poly(self):
+        """Monomial form as np.poly1d; O(n^2) and unstable for many nodes."""
+        from scipy.interpolate import lagrange
+        return lagrange(self.x, self.y)
+
+    def format(self):
+        """Returns the polynomial as 'Pn(x) = ...', ignoring coefficients close to zero."""
+        if len(self.x) > MAX_FORMAT_NODES:
+            return f"Pn(x) de grau {len(self.x) - 1} (forma baricêntrica, coeficientes omitidos)"
+        coeffs = self.poly.coef
+        degree = len(coeffs) - 1
+        poly_str = "Pn(x) = "
+        for i, c in enumerate(coeffs):
+            power = degree - i
+            if abs(c) > 1e-10: # Ignore close to zero
+                sign = "+ " if c >= 0 and i > 0 else "- " if c < 0 else ""
+                poly_str += f"{sign}{abs(c):.4f}*x^{power} "
+        return poly_str
+
+
+def lagrange_interpolation(x, y, weights=None):
+    """Builds the Lagrange polynomial through the points (x, y), sorted by x.
+
+    weights, if given, are barycentric weights matching x (e.g. from
+    chebyshev_weights); otherwise they are computed in O(n^2).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) != len(y) or len(x) == 0:
+        raise ValueError("x e y devem ter o mesmo tamanho, não nulo.")
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[order]
+    if np.any(np.diff(x) == 0):
+        raise ValueError("Pontos com x repetido.")
+    if weights is None:
+        w = barycentric_weights(x)
+    else:
+        w = np.asarray(weights, dtype=float)[order]
+        w = w / np.abs(w).max()
+    return LagrangeResult(x, y, w)
+
+
+SPLINE_KINDS = ("natural", "clamped", "not-a-knot", "pchip")
+
+
+@dataclass
+class SplineResult:
+    """Piecewise cubic through sorted knots x.
+
+    On [x_i, x_{i+1}] the value is sum(coeffs[i, k] * (t - x_i)**k, k=0..3);
+    points outside [x_0, x_{n-1}] use the first or last piece.
+    """
+    x: np.ndarray
+    coeffs: np.ndarray
+    kind: str
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        # Binary search over the knots, all query points in one pass
+        idx = np.clip(np.searchsorted(self.x, t, side="right") - 1, 0, len(self.x) - 2)
+        s = t - self.x[idx]
+        c = self.coeffs[idx]
+        return c[..., 0] + s * (c[..., 1] + s * (c[..., 2] + s * c[..., 3]))
+
+
+def _solve_tridiagonal(lower, diag, upper, rhs):
+    """O(n) banded LAPACK solve; lower and upper have n-1 elements."""
+    from scipy.linalg import solve_banded
+
+    ab = np.zeros((3, len(diag)))
+    ab[0, 1:] = upper
+    ab[1] = diag
+    ab[2, :-1] = lower
+    return solve_banded((1, 1), ab, rhs)
+
+
+def _second_derivatives(h, delta, kind, fprime):
+    """Second derivatives M at the knots of a cubic spline with the given end conditions."""
+    n = len(h) + 1
+    if n == 2 and kind != "clamped":
+        return np.zeros(2)
+    if n == 3 and kind == "not-a-knot":
+        # A single parabola through the three points
+        return np.full(3, 2 * (delta[1] - delta[0]) / (h[0] + h[1]))
+
+    lower = np.zeros(n - 1)
+    diag = np.ones(n)
+    upper = np.zeros(n - 1)
+    rhs = np.zeros(n)
+    # Interior rows: h_{i-1} M_{i-1} + 2 (h_{i-1} + h_i) M_i + h_i M_{i+1} = 6 (delta_i - delta_{i-1})
+    lower[:-1] = h[:-1]
+    diag[1:-1] = 2 * (h[:-1] + h[1:])
+    upper[1:] = h[1:]
+    rhs[1:-1] = 6 * (delta[1:] - delta[:-1])
+
+    if kind == "clamped":
+        da, db = fprime
+        diag[0], upper[0], rhs[0] = 2 * h[0], h[0], 6 * (delta[0] - da)
+        lower[-1], diag[-1], rhs[-1] = h[-1], 2 * h[-1], 6 * (db - delta[-1])
+    elif kind == "not-a-knot":
+        # Third derivative continuous at x_1 and x_{n-2}; M_0 and M_{n-1} are
+        # eliminated from the rows next to them so the system stays tridiagonal
+        h0, h1 = h[0], h[1]
+        diag[1] = (h0 + h1) * (h0 / h1 + 2)
+        upper[1] = h1 - h0**2 / h1
+        hl, hm = h[-1], h[-2]
+        diag[-2] = (hl + hm) * (hl / hm + 2)
+        lower[-2] = hm - hl**2 / hm
+        M = np.zeros(n)
+        M[1:-1] = _solve_tridiagonal(lower[1:-1], diag[1:-1], upper[1:-1], rhs[1:-1])
+        M[0] = ((h0 + h1) * M[1] - h0 * M[2]) / h1
+        M[-1] = ((hl + hm) * M[-2] - hl * M[-3]) / hm
+        return M
+    # natural: the first and last rows stay M_0 = M_{n-1} = 0
+    return _solve_tridiagonal(lower, diag, upper, rhs)
+
+
+def _pchip_slopes(h, delta):
+    """Fritsch-Carlson monotone slopes at the knots."""
+    n = len(h) + 1
+    d = np.zeros(n)
+    if n == 2:
+        return np.full(2, delta[0])
+
+    # Interior: weighted harmonic mean where the secants agree in sign, 0 otherwise
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    same_sign = delta[:-1] * delta[1:] > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        harmonic = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+    d[1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    def edge(h0, h1, m0, m1):
+        # Non-centered three-point formula, limited to keep the shape
+        s = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+        if np.sign(s) != np.sign(m0):
+            return 0.0
+        if np.sign(m0) != np.sign(m1) and abs(s) > 3 * abs(m0):
+            return 3 * m0
+        return s
+
+    d[0] = edge(h[0], h[1], delta[0], delta[1])
+    d[-1] = edge(h[-1], h[-2], delta[-1], delta[-2])
+    return d
+
+
+def spline_interpolation(x, y, kind="natural", fprime=(0.0, 0.0)):
+    """Piecewise cubic interpolation of (x, y), sorted by x.
+
+    kind is "natural", "clamped" (end slopes fprime = (f'(a), f'(b))),
+    "not-a-knot" or "pchip" (monotone, C1). Building costs O(n).
+    """
+    if kind not in SPLINE_KINDS:
+        raise ValueError(f"Tipo de spline desconhecido: {kind}")
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) != len(y) or len(x) < 2:
+        raise ValueError("x e y devem ter o mesmo tamanho, com pelo menos 2 pontos.")
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[order]
+    h = np.diff(x)
+    if np.any(h == 0):
+        raise ValueError("Pontos com x repetido.")
+    delta = np.diff(y) / h
+
+    coeffs = np.empty((len(h), 4))
+    coeffs[:, 0] = y[:-1]
+    if kind == "pchip":
+        d = _pchip_slopes(h, delta)
+        coeffs[:, 1] = d[:-1]
+        coeffs[:, 2] = (3 * delta - 2 * d[:-1] - d[1:]) / h
+        coeffs[:, 3] = (d[:-1] + d[1:] - 2 * delta) / h**2
+    else:
+        M = _second_derivatives(h, delta, kind, fprime)
+        coeffs[:, 1] = delta - h * (2 * M[:-1] + M[1:]) / 6
+        coeffs[:, 2] = M[:-1] / 2
+        coeffs[:, 3] = (M[1:] - M[:-1]) / (6 * h)
+    return SplineResult(x, coeffs, kind)
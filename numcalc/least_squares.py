@@ -0,0 +1,224 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+METHODS = ("linear", "polynomial", "exponential", "fourier")
+# Default Fourier period: harmonics cos(kx), sin(kx)
+TWO_PI = 2 * np.pi
+
+
+@dataclass
+class LeastSquaresResult:
+    """Least squares fit obtained from the normal equations (A^T A) c = A^T y.
+
+    A is None for streamed fits and for Fourier fits taken from the FFT,
+    which never build the design matrix.
+    """
+    method: str
+    coeffs: np.ndarray
+    A: np.ndarray
+    AtA: np.ndarray
+    Aty: np.ndarray
+    param: int = 0
+    period: float = TWO_PI
+
+    def __call__(self, x):
+        """Evaluates the fitted model at x."""
+        x = np.asarray(x, dtype=float)
+        if self.method == "exponential":
+            a, b = np.exp(self.coeffs[0]), self.coeffs[1]
+            return a * np.exp(b * x)
+        if self.method == "fourier":
+            return _fourier_eval(x, self.coeffs, self.period)
+        return design_matrix(x, self.method, self.param) @ self.coeffs
+
+    def total_squared_error(self, x, y):
+        """Sum of squared residuals on the original scale of y."""
+        return float(np.sum((np.asarray(y) - self(x))**2))
+
+    def model_string(self):
+        c = self.coeffs
+        if self.method == "exponential":
+            return f"y = {np.exp(c[0]):.4f} * e^({c[1]:.4f}x)"
+        if self.method == "fourier":
+            model_str = f"y = {c[0]:.3f}"
+            w = "" if self.period == TWO_PI else f"*{TWO_PI / self.period:.4f}"
+            for k in range(1, self.param + 1):
+                model_str += f" + {c[2*k-1]:.3f}cos({k}{w}x) + {c[2*k]:.3f}sin({k}{w}x)"
+            return model_str
+        return "y = " + " + ".join([f"{ci:.3f}x^{i}" for i, ci in enumerate(c)])
+
+
+def design_matrix(x, method, param=0, period=TWO_PI):
+    """Design matrix A of the given model evaluated at x."""
+    x = np.asarray(x, dtype=float)
+    if method in ("linear", "exponential"):
+        # y = b + ax (Matriz [1, x])
+        return np.vstack([np.ones(len(x)), x]).T
+    if method == "polynomial":
+        # y = a0 + a1x + ... + anx^n
+        return np.vander(x, param + 1, increasing=True)
+    if method == "fourier":
+        # f(x) = a0 + a1 cos(wx) + b1 sin(wx) ..., w = 2*pi / period
+        kx = np.outer(x, np.arange(1, param + 1) * (TWO_PI / period))
+        A = np.empty((len(x), 2 * param + 1))
+        A[:, 0] = 1.0
+        A[:, 1::2] = np.cos(kx)
+        A[:, 2::2] = np.sin(kx)
+        return A
+    raise ValueError(f"Método desconhecido: {method}")
+
+
+def _fourier_eval(x, coeffs, period):
+    """Fourier series at x by Horner's rule in z = e^(iwx): O(len(x)) memory for any number of harmonics."""
+    c = coeffs[1::2] - 1j * coeffs[2::2] # a_k - i b_k
+    z = np.exp(1j * (TWO_PI / period) * x)
+    acc = np.zeros(x.shape, dtype=complex)
+    for ck in c[::-1]:
+        acc = (acc + ck) * z
+    return coeffs[0] + acc.real
+
+
+def uniform_periods(x, period, rtol=1e-6):
+    """m if x, once sorted, is a uniform grid spanning exactly m whole periods, else None.
+
+    Spanning means n * h == m * period, with spacing h: the grid has one
+    sample per step and excludes the endpoint of the last period. Every
+    sample must lie within rtol * h of its grid point, whatever n is.
+    """
+    n = len(x)
+    if n < 3:
+        return None
+    x = np.sort(x)
+    h = (x[-1] - x[0]) / (n - 1)
+    if h <= 0 or np.max(np.abs(x - (x[0] + h * np.arange(n)))) > rtol * h:
+        return None
+    m = n * h / period
+    if round(m) < 1 or abs(m - round(m)) > rtol * round(m):
+        return None
+    return int(round(m))
+
+
+def fourier_fit_fft(x, y, harmonics, period=TWO_PI):
+    """Fourier least squares fit from one real FFT, O(n log n), or None if not applicable.
+
+    On a uniform grid over m whole periods the cos/sin columns are
+    orthogonal, so harmonic k is just FFT bin k*m, scaled. Requires
+    harmonics * m < n / 2.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    m = uniform_periods(x, period)
+    n = len(x)
+    if m is None or 2 * harmonics * m >= n:
+        return None
+    order = np.argsort(x, kind="stable")
+    x0 = x[order[0]]
+    spectrum = np.fft.rfft(y[order])
+    k = np.arange(1, harmonics + 1)
+    # Shift the grid origin from x0 back to 0
+    ck = spectrum[k * m] * np.exp(-1j * k * (TWO_PI / period) * x0)
+
+    coeffs = np.empty(2 * harmonics + 1)
+    coeffs[0] = spectrum[0].real / n
+    coeffs[1::2] = 2 * ck.real / n
+    coeffs[2::2] = -2 * ck.imag / n
+    # A^T A is diagonal on this grid
+    AtA = np.diag(np.r_[n, np.full(2 * harmonics, n / 2)])
+    return LeastSquaresResult("fourier", coeffs, None, AtA, AtA @ coeffs, harmonics, period)
+
+
+def fit(x, y, method, param=0, period=TWO_PI):
+    """Fits y ≈ model(x) in the least squares sense.
+
+    param is the polynomial degree or the number of Fourier harmonics, of
+    the given period. The exponential model y = a*e^(bx) is linearized as
+    ln(y) = ln(a) + bx. Fourier fits on a uniform grid over whole periods
+    are taken from the FFT instead of the normal equations.
+    """
+    x = np.asarray(x, dtype=float)
+    y_vec = np.asarray(y, dtype=float)
+    if method == "exponential":
+        if np.any(y_vec <= 0):
+            raise ValueError("Para ajuste exponencial, y deve ser > 0.")
+        y_vec = np.log(y_vec)
+    if method == "fourier":
+        result = fourier_fit_fft(x, y_vec, param, period)
+        if result is not None:
+            return result
+
+    A = design_matrix(x, method, param, period)
+    At = A.T
+    AtA = At @ A
+    Aty = At @ y_vec
+    coeffs = np.linalg.solve(AtA, Aty)
+    return LeastSquaresResult(method, coeffs, A, AtA, Aty, param, period)
+
+
+class StreamingLeastSquares:
+    """Least squares fit accumulated chunk by chunk in O(p^2) memory.
+
+    Keeps the triangular factor R of the QR decomposition of the augmented
+    matrix [A | y] seen so far: each update stacks the new rows under R and
+    re-triangularizes, so the full design matrix is never stored. Solving R
+    is better conditioned than forming A^T A, and the last diagonal entry of
+    R gives the residual norm for free.
+    """
+
+    def __init__(self, method, param=0, period=TWO_PI):
+        if method not in METHODS:
+            raise ValueError(f"Método desconhecido: {method}")
+        self.method = method
+        self.param = param
+        self.period = period
+        self.n = 0
+        self.x_min = np.inf
+        self.x_max = -np.inf
+        p = design_matrix(np.zeros(1), method, param, period).shape[1]
+        self._R = np.zeros((0, p + 1))
+
+    def update(self, x, y):
+        """Adds the points (x, y) to the fit."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(x) == 0:
+            return
+        if self.method == "exponential":
+            if np.any(y <= 0):
+                raise ValueError("Para ajuste exponencial, y deve ser > 0.")
+            y = np.log(y)
+        rows = np.column_stack([design_matrix(x, self.method, self.param, self.period), y])
+        self._R = np.linalg.qr(np.vstack([self._R, rows]), mode="r")
+        self.n += len(x)
+        self.x_min = min(self.x_min, float(x.min()))
+        self.x_max = max(self.x_max, float(x.max()))
+
+    @property
+    def residual_sum_of_squares(self):
+        """Sum of squared residuals of the linear problem (of ln(y) for the exponential model)."""
+        p = self._R.shape[1] - 1
+        return float(self._R[p, p]**2) if self._R.shape[0] > p else 0.0
+
+    def result(self):
+        """The fit of all points seen so far."""
+        p = self._R.shape[1] - 1
+        if self._R.shape[0] < p or np.any(np.abs(np.diag(self._R[:p, :p])) == 0):
+            raise ValueError("Pontos insuficientes para o modelo escolhido.")
+        R, z = self._R[:p, :p], self._R[:p, p]
+        from scipy.linalg import solve_triangular
+        coeffs = solve_triangular(R, z)
+        return LeastSquaresResult(self.method, coeffs, None, R.T @ R, R.T @ z, self.param, self.period)
+
+
+def fit_stream(chunks, method, param=0, progress=None, period=TWO_PI):
+    """Fits the model to an iterable of (x, y, fraction_done) chunks.
+
+    Returns the StreamingLeastSquares accumulator; progress(fraction), if
+    given, is called after each chunk.
+    """
+    stream = StreamingLeastSquares(method, param, period)
+    for x, y, fraction in chunks:
+        stream.update(x, y)
+        if progress is not None:
+            progress(fraction)
+    return stream
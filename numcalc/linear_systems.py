@@ -0,0 +1,231 @@
+import copy
+from dataclasses import dataclass
+
+import numpy as np
+
+from numcalc.trace import IterationTrace
+
+SWAP, ELIMINATE = 0, 1
+ELIMINATION_COLUMNS = [("op", "op", "d"), ("k", "k", "d"), ("row", "row", "d"), ("factor", "factor", ".6g")]
+# Row operations kept by an EliminationLog; a full log of order n has about n^2/2
+MAX_LOGGED_OPERATIONS = 100_000
+
+
+class EliminationLog:
+    """Compact record of a Gaussian elimination: the initial augmented matrix plus its row operations.
+
+    Operations are rows (op, k, row, factor) of an IterationTrace: op SWAP
+    exchanges rows k and row, op ELIMINATE subtracts factor times row k from
+    row. Storage is O(n^2) numbers instead of one matrix snapshot per row
+    operation; the didactic text is rebuilt on demand by replaying them.
+    Only the first limit operations are kept, truncated tells whether
+    later ones were dropped.
+    """
+
+    def __init__(self, M, limit=MAX_LOGGED_OPERATIONS):
+        self.initial = M.copy()
+        n = len(M)
+        self.limit = limit
+        self.truncated = False
+        self.trace = IterationTrace(ELIMINATION_COLUMNS, capacity=min((n - 1) * (n + 2) // 2, limit))
+
+    def swap(self, k, row):
+        if len(self.trace) >= self.limit:
+            self.truncated = True
+            return
+        self.trace.append(SWAP, k, row, np.nan)
+
+    def eliminate(self, k, factors):
+        room = self.limit - len(self.trace)
+        if room < len(factors):
+            self.truncated = True
+            factors = factors[:max(room, 0)]
+        if len(factors):
+            self.trace.extend(ELIMINATE, k, np.arange(k + 1, k + 1 + len(factors)), factors)
+
+    def with_rhs(self, b):
+        """The same row operations, replayed on [A | b] for another right-hand side b."""
+        log = copy.copy(self)
+        log.initial = self.initial.copy()
+        log.initial[:, -1] = b
+        return log
+
+    def __len__(self):
+        """Number of row operations recorded."""
+        return len(self.trace)
+
+    def save(self, path):
+        self.trace.save(path)
+
+    def _fast_forward(self, start):
+        """Matrix after the first start operations, applying whole pivot columns at once."""
+        M = self.initial.copy()
+        data = self.trace.data
+        i = 0
+        while i < start:
+            op, k = data["op"][i], data["k"][i]
+            if op == SWAP:
+                row = data["row"][i]
+                M[[k, row]] = M[[row, k]]
+                i += 1
+            else:
+                # The eliminations of column k are contiguous and leave pivot row k untouched
+                j = min(i + len(M) - 1 - k, start)
+                M[data["row"][i:j], k:] -= np.outer(data["factor"][i:j], M[k, k:])
+                i = j
+        return M
+
+    def steps(self, start=0, stop=None):
+        """Yields (description, matrix) after each of the operations start to stop.
+
+        Starting from 0 the initial matrix comes first.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        M = self._fast_forward(start)
+        if start == 0:
+            yield "Matriz Aumentada Inicial:", M.copy()
+        for op, k, row, factor in self.trace.data[start:stop].tolist():
+            if op == SWAP:
+                M[[k, row]] = M[[row, k]]
+                yield f"--- Pivotamento: Troca L{k+1} <-> L{row+1} ---", M.copy()
+            else:
+                M[row, k:] = M[row, k:] - factor * M[k, k:]
+                yield f"--- L{row+1} = L{row+1} - ({factor:.3f})*L{k+1} ---", M.copy()
+
+    def format(self, start=0, stop=None, show_matrices=True):
+        """Text of the row operations start to stop."""
+        text = ""
+        for description, M in self.steps(start, stop):
+            text += f"{description}\n{M}\n\n" if show_matrices else f"{description}\n"
+        return text
+
+
+def back_substitution(U, c):
+    """Solves the upper triangular system Ux = c, for a vector c or every column of a matrix c.
+
+    Only U on and above the diagonal is read.
+    """
+    n = len(c)
+    x = np.zeros(np.shape(c))
+    for i in range(n - 1, -1, -1):
+        x[i] = (c[i] - U[i, i+1:n] @ x[i+1:n]) / U[i, i]
+    return x
+
+
+@dataclass
+class LUFactorization:
+    """PA = LU with partial pivoting, stored compactly.
+
+    LU holds U on and above the diagonal and the multipliers of L (unit
+    diagonal) below it; perm is the row order, so PA = A[perm].
+    """
+    LU: np.ndarray
+    perm: np.ndarray
+
+    @property
+    def L(self):
+        return np.tril(self.LU, -1) + np.eye(len(self.LU))
+
+    @property
+    def U(self):
+        return np.triu(self.LU)
+
+    def solve(self, B):
+        """Solves AX = B for a vector b or for every column of a matrix B."""
+        B = np.asarray(B, dtype=float)
+        Y = B[self.perm].astype(float)
+        n = len(self.LU)
+        # Forward substitution with unit lower L, all columns at once
+        for i in range(1, n):
+            Y[i] -= self.LU[i, :i] @ Y[:i]
+        return back_substitution(self.LU, Y)
+
+
+def lu_factor(A, pivoting=True, log=None, progress=None):
+    """Factors A once so that any number of right-hand sides can be solved with .solve().
+
+    Each pivot column is eliminated with a single vectorized update of the
+    rows below it. The pivot swaps and multipliers are recorded in log, an
+    EliminationLog, when given. progress, if given, is called with the
+    fraction of pivot columns done, each time it reaches a new whole percent.
+    """
+    LU = np.array(A, dtype=float)
+    n = len(LU)
+    perm = np.arange(n)
+    reported = 0
+    for k in range(n - 1):
+        if pivoting:
+            max_row = k + np.argmax(np.abs(LU[k:, k]))
+            if max_row != k:
+                LU[[k, max_row]] = LU[[max_row, k]]
+                perm[[k, max_row]] = perm[[max_row, k]]
+                if log is not None:
+                    log.swap(k, max_row)
+        if LU[k, k] == 0:
+            raise ValueError("Matriz singular: pivô nulo.")
+        # Multipliers below the pivot and rank-1 update of the trailing block
+        LU[k+1:, k] /= LU[k, k]
+        LU[k+1:, k+1:] -= np.outer(LU[k+1:, k], LU[k, k+1:])
+        if log is not None:
+            log.eliminate(k, LU[k+1:, k])
+
+        if progress is not None and (k + 1) * 100 // (n - 1) > reported:
+            reported = (k + 1) * 100 // (n - 1)
+            progress((k + 1) / (n - 1))
+    if LU[-1, -1] == 0:
+        raise ValueError("Matriz singular: pivô nulo.")
+    return LUFactorization(LU, perm)
+
+
+@dataclass
+class GaussEliminationResult:
+    """Solution of Ax = b with its LU factorization and the log of the elimination (None when not traced)."""
+    x: np.ndarray
+    log: EliminationLog = None
+    lu: LUFactorization = None
+
+
+def gauss_elimination(A, b, pivoting=True, progress=None, trace=True):
+    """Solves Ax = b by Gaussian elimination on the augmented matrix [A | b].
+
+    The elimination is lu_factor's; the factorization is returned so other
+    right-hand sides can be solved without eliminating again. With
+    trace=True the pivot swaps and factors are kept in an EliminationLog.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    log = EliminationLog(np.hstack([A, b.reshape(-1, 1)])) if trace else None
+    lu = lu_factor(A, pivoting, log, progress)
+    return GaussEliminationResult(lu.solve(b), log, lu)
+
+
+def solve_batched(A, B, pivoting=True):
+    """Solves a stack of independent systems A[i] X[i] = B[i] in one vectorized pass.
+
+    A has shape (k, n, n) and B shape (k, n) or (k, n, m). Meant for many
+    small systems: the loops run over n, every operation spans all k
+    systems. Singular systems come out as inf/NaN instead of raising.
+    """
+    A = np.array(A, dtype=float)
+    B = np.array(B, dtype=float)
+    vector_rhs = B.ndim == 2
+    if vector_rhs:
+        B = B[:, :, None]
+    k, n, _ = A.shape
+    batch = np.arange(k)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for j in range(n - 1):
+            if pivoting:
+                p = j + np.argmax(np.abs(A[:, j:, j]), axis=1)
+                A[batch, j], A[batch, p] = A[batch, p], A[batch, j].copy()
+                B[batch, j], B[batch, p] = B[batch, p], B[batch, j].copy()
+            factors = A[:, j+1:, j] / A[:, j, j][:, None]
+            A[:, j+1:, j:] -= factors[:, :, None] * A[:, None, j, j:]
+            B[:, j+1:] -= factors[:, :, None] * B[:, None, j]
+
+        X = np.zeros_like(B)
+        for i in range(n - 1, -1, -1):
+            rhs = B[:, i] - np.einsum("kj,kjm->km", A[:, i, i+1:], X[:, i+1:])
+            X[:, i] = rhs / A[:, i, i][:, None]
+    return X[:, :, 0] if vector_rhs else X
@@ -0,0 +1,133 @@
+import itertools
+import os
+
+import numpy as np
+
+SUPPORTED_EXTENSIONS = (".csv", ".txt", ".npy", ".npz", ".mtx")
+# Rows per chunk when streaming (x, y) data
+DEFAULT_CHUNK_ROWS = 250_000
+
+
+def load_matrix(path, mmap=True):
+    """Loads a dense or sparse array from CSV/TXT, .npy, .npz or Matrix Market in one bulk read.
+
+    .npy files are memory-mapped read-only when mmap is True; .npz files
+    return the first array they contain; Matrix Market files come back as
+    scipy CSR matrices.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".csv", ".txt"):
+        return np.loadtxt(path, delimiter="," if ext == ".csv" else None, ndmin=1)
+    if ext == ".npy":
+        return np.load(path, mmap_mode="r" if mmap else None)
+    if ext == ".npz":
+        with np.load(path) as data:
+            return data[data.files[0]]
+    if ext == ".mtx":
+        from scipy.io import mmread
+        from scipy.sparse import csr_matrix
+        return csr_matrix(mmread(path))
+    raise ValueError(f"Formato não suportado: {ext or path}")
+
+
+def load_system(path, b_path=None, mmap=True):
+    """Loads (A, b, x0) for Ax = b; b and x0 are None when the file does not provide them.
+
+    b comes from b_path when given, otherwise from the last column of an
+    augmented n x (n+1) matrix, or from the 'b' array of an .npz file that
+    stores 'A', 'b' and optionally 'x0'.
+    """
+    A = b = x0 = None
+    if path.lower().endswith(".npz"):
+        with np.load(path) as data:
+            if "A" in data.files:
+                A = data["A"]
+                b = data["b"] if "b" in data.files else None
+                x0 = data["x0"] if "x0" in data.files else None
+    if A is None:
+        A = load_matrix(path, mmap)
+
+    if A.ndim != 2:
+        raise ValueError(f"A deve ser bidimensional, recebido shape {A.shape}.")
+    n, m = A.shape
+    if m == n + 1 and b is None and b_path is None:
+        # Augmented [A | b]; a sparse column is densified into a 1-D vector
+        A, b = A[:, :n], A[:, [n]]
+        b = b.toarray().ravel() if hasattr(b, "toarray") else np.asarray(b).ravel()
+    elif m != n:
+        raise ValueError(f"A deve ser quadrada ou aumentada [A | b], recebido shape {A.shape}.")
+
+    if b_path is not None:
+        b = load_vector(b_path, n)
+    if b is not None and len(b) != n:
+        raise ValueError(f"b tem {len(b)} elementos, mas A tem {n} linhas.")
+    return A, b, x0
+
+
+def load_vector(path, n=None):
+    """Loads a 1-D float vector, checking that it has n elements when n is given."""
+    v = np.asarray(load_matrix(path, mmap=False), dtype=float).ravel()
+    if n is not None and len(v) != n:
+        raise ValueError(f"O vetor tem {len(v)} elementos, esperado {n}.")
+    return v
+
+
+def save_system(path, A, b, x0=None):
+    """Saves a system in a form load_system reads back.
+
+    .mtx files hold the augmented matrix [A | b] in Matrix Market format,
+    which keeps a sparse A sparse (x0 is not stored); anything else is an
+    .npz with arrays 'A', 'b' and optionally 'x0', for dense A only.
+    """
+    b = np.asarray(b, dtype=float).reshape(-1, 1)
+    if path.lower().endswith(".mtx"):
+        from scipy.io import mmwrite
+        from scipy.sparse import csr_matrix, hstack
+        augmented = hstack([csr_matrix(A), csr_matrix(b)]) if hasattr(A, "toarray") else np.hstack([A, b])
+        mmwrite(path, augmented)
+        return
+    if hasattr(A, "toarray"):
+        raise ValueError("Matrizes esparsas devem ser salvas em .mtx.")
+    arrays = {"A": np.asarray(A), "b": b.ravel()}
+    if x0 is not None:
+        arrays["x0"] = np.asarray(x0)
+    np.savez(path, **arrays)
+
+
+def iter_xy_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yields (x, y, fraction_done) from the first two columns of a CSV/TXT or .npy file.
+
+    Only one chunk of chunk_rows rows is in memory at a time: .npy files are
+    memory-mapped and sliced, text files are parsed chunk by chunk. Lines
+    starting with '#' are skipped, as is a non-numeric header line.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        data = np.load(path, mmap_mode="r")
+        if data.ndim != 2 or data.shape[1] < 2:
+            raise ValueError(f"Esperadas as colunas x e y, recebido shape {data.shape}.")
+        n = data.shape[0]
+        for start in range(0, n, chunk_rows):
+            chunk = np.asarray(data[start:start + chunk_rows, :2], dtype=float)
+            yield chunk[:, 0], chunk[:, 1], min(1.0, (start + chunk_rows) / n)
+        return
+    if ext not in (".csv", ".txt"):
+        raise ValueError(f"Formato não suportado para leitura em blocos: {ext or path}")
+
+    delimiter = "," if ext == ".csv" else None
+    size = os.path.getsize(path) or 1
+    with open(path, "rb") as fh:
+        first = True
+        while True:
+            lines = list(itertools.islice(fh, chunk_rows))
+            if not lines:
+                break
+            if first:
+                first = False
+                try:
+                    float(lines[0].split(b"," if delimiter else None)[0])
+                except (ValueError, IndexError):
+                    lines = lines[1:] # header
+            chunk = np.loadtxt(lines, delimiter=delimiter, ndmin=2, usecols=(0, 1))
+            if len(chunk):
+                yield chunk[:, 0], chunk[:, 1], fh.tell() / size
@@ -0,0 +1,185 @@
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from numcalc.trace import IterationTrace
+
+NEWTON_SYSTEM_COLUMNS = [("n", "n", "3d"), ("residual", "||F(x_n)||", "12.4e"),
+                         ("step", "||x_n+1 - x_n||", "12.4e"), ("jacobian_evals", "Jacobianas", "d")]
+
+
+@dataclass
+class NonlinearSystemResult:
+    """Outcome of newton_system.
+
+    Each iteration is (n, ||F(x_n)||, ||x_n+1 - x_n||, Jacobians evaluated
+    so far), in the infinity norm. function_evals includes the evaluations
+    spent on finite-difference Jacobians.
+    """
+    x: np.ndarray
+    converged: bool
+    iterations: IterationTrace
+    method: str
+    function_evals: int
+    jacobian_evals: int
+    singular: bool = False
+
+
+def color_columns(sparsity):
+    """Greedy grouping of the columns of a sparsity pattern into structurally orthogonal sets.
+
+    Columns with the same color share no nonzero row, so they can be
+    perturbed together in a finite-difference Jacobian. A banded pattern
+    needs as many colors as its bandwidth, whatever its size.
+    """
+    by_col = sp.csc_matrix(sparsity, dtype=bool)
+    by_row = by_col.tocsr()
+    colors = np.full(by_col.shape[1], -1)
+    for j in range(by_col.shape[1]):
+        rows = by_col.indices[by_col.indptr[j]:by_col.indptr[j + 1]]
+        neighbours = [by_row.indices[by_row.indptr[r]:by_row.indptr[r + 1]] for r in rows]
+        used = set(colors[np.concatenate(neighbours)].tolist()) if neighbours else set()
+        color = 0
+        while color in used:
+            color += 1
+        colors[j] = color
+    return colors
+
+
+def finite_difference_jacobian(F, x, f_x=None, sparsity=None, colors=None):
+    """Forward-difference approximation of the Jacobian of F at x.
+
+    Without a sparsity pattern it costs n evaluations of F and returns a
+    dense array. With one, each group of colors (see color_columns) is
+    perturbed in a single evaluation and the result is a CSR matrix.
+    """
+    x = np.asarray(x, dtype=float)
+    if f_x is None:
+        f_x = F(x)
+    # Steps rounded to representable increments of x
+    h = ((x + np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)) - x)
+
+    if sparsity is None:
+        J = np.empty((len(f_x), len(x)))
+        for j in range(len(x)):
+            x_j = x.copy()
+            x_j[j] += h[j]
+            J[:, j] = (F(x_j) - f_x) / h[j]
+        return J
+
+    pattern = sp.coo_matrix(sparsity)
+    rows, cols = pattern.row, pattern.col
+    if colors is None:
+        colors = color_columns(sparsity)
+    values = np.empty(len(rows))
+    entry_colors = colors[cols]
+    for color in range(colors.max() + 1 if len(colors) else 0):
+        df = F(x + np.where(colors == color, h, 0.0)) - f_x
+        entries = entry_colors == color
+        values[entries] = df[rows[entries]] / h[cols[entries]]
+    return sp.csr_matrix((values, (rows, cols)), shape=(len(f_x), len(x)))
+
+
+class _InverseJacobian:
+    """J^-1 applied through an LU factorization of J, plus Broyden rank-one updates.
+
+    After k updates the inverse is H0 + sum(u_i w_i^T), applied in O(nk)
+    on top of the triangular solves, so J is never refactored.
+    """
+
+    def __init__(self, J):
+        if sp.issparse(J):
+            lu = splu(sp.csc_matrix(J, dtype=float))
+            self._solve = lambda y, trans: lu.solve(y, trans="T" if trans else "N")
+        else:
+            with warnings.catch_warnings():
+                # Singular matrices surface as non-finite steps
+                warnings.simplefilter("ignore", scipy.linalg.LinAlgWarning)
+                factors = scipy.linalg.lu_factor(np.asarray(J, dtype=float))
+            self._solve = lambda y, trans: scipy.linalg.lu_solve(factors, y, trans=int(trans))
+        self.u, self.w = [], []
+
+    def solve(self, y, trans=False):
+        """J^-1 y, or J^-T y with trans=True."""
+        result = self._solve(y, trans)
+        for u, w in zip(self.u, self.w):
+            result = result + (w * (u @ y) if trans else u * (w @ y))
+        return result
+
+    def update(self, dx, df):
+        """Broyden's ("good") update so that the new inverse maps df to dx; False if degenerate."""
+        H_df = self.solve(df)
+        denom = dx @ H_df
+        if not np.isfinite(denom) or denom == 0:
+            return False
+        w = self.solve(dx, trans=True)
+        self.u.append((dx - H_df) / denom)
+        self.w.append(w)
+        return True
+
+
+def newton_system(F, x0, jacobian=None, tol=1e-8, max_iter=50, broyden=False, sparsity=None):
+    """Solves F(x) = 0, F: R^n -> R^n, by Newton's method starting from x0.
+
+    jacobian(x) returns J(x) as an array or a sparse matrix (factored with
+    SuperLU); without it J is approximated by finite differences, grouping
+    columns when the nonzero pattern sparsity is given. With broyden=True J
+    is evaluated and factored only at the start and again when a step fails
+    to reduce ||F||; the steps in between use Broyden updates of the
+    inverse. Stops when ||x_n+1 - x_n|| or ||F(x_n+1)|| drops below tol.
+    """
+    x = np.array(x0, dtype=float)
+    function_evals = jacobian_evals = 0
+
+    def evaluate(v):
+        nonlocal function_evals
+        function_evals += 1
+        return np.asarray(F(v), dtype=float)
+
+    colors = color_columns(sparsity) if sparsity is not None and jacobian is None else None
+
+    def factor(v, f_v):
+        nonlocal jacobian_evals
+        jacobian_evals += 1
+        if jacobian is not None:
+            J = jacobian(v)
+        else:
+            J = finite_difference_jacobian(evaluate, v, f_v, sparsity, colors)
+        return _InverseJacobian(J)
+
+    method = "Broyden" if broyden else "Newton"
+    iterations = IterationTrace(NEWTON_SYSTEM_COLUMNS, capacity=max_iter)
+    f_x = evaluate(x)
+    if f_x.shape != x.shape:
+        raise ValueError("O sistema deve ter tantas equações quanto incógnitas.")
+
+    def result(converged, singular=False):
+        return NonlinearSystemResult(x, converged, iterations, method, function_evals, jacobian_evals, singular)
+
+    inverse = None
+    for n in range(max_iter):
+        try:
+            if inverse is None or not broyden:
+                inverse = factor(x, f_x)
+            dx = -inverse.solve(f_x)
+        except RuntimeError:
+            # SuperLU: exactly singular
+            return result(False, singular=True)
+        if not np.all(np.isfinite(dx)):
+            return result(False, singular=True)
+
+        x_new = x + dx
+        f_new = evaluate(x_new)
+        residual, step = np.max(np.abs(f_x)), np.max(np.abs(dx))
+        iterations.append(n, residual, step, jacobian_evals)
+
+        if broyden and not (np.max(np.abs(f_new)) < residual and inverse.update(dx, f_new - f_x)):
+            inverse = None # Re-evaluate J at the next iterate
+        x, f_x = x_new, f_new
+        if step < tol or np.max(np.abs(f_x)) < tol:
+            return result(True)
+    return result(False)
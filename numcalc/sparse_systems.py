@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve_triangular
+
+
+@dataclass
+class IterativeResult:
+    """Outcome of an iterative solver.
+
+    residuals[k] is the relative residual ||b - A x_k|| / ||b|| after k
+    iterations, residuals[0] being the one of x0.
+    """
+    x: np.ndarray
+    converged: bool
+    iterations: int
+    residuals: np.ndarray
+    method: str
+
+
+def to_csr(A):
+    """A as a float CSR matrix, without copying if it already is one."""
+    if sp.issparse(A):
+        return sp.csr_matrix(A, dtype=float)
+    return sp.csr_matrix(np.asarray(A, dtype=float))
+
+
+def bandwidth(A):
+    """(lower, upper) number of nonzero diagonals below and above the main one."""
+    coo = to_csr(A).tocoo()
+    offsets = coo.col - coo.row
+    nonzero = offsets[coo.data != 0]
+    if nonzero.size == 0:
+        return 0, 0
+    return int(max(0, -nonzero.min())), int(max(0, nonzero.max()))
+
+
+def tridiagonal_diagonals(A):
+    """(lower, diag, upper) diagonals of a tridiagonal A; raises ValueError otherwise."""
+    lower, upper = bandwidth(A)
+    if lower > 1 or upper > 1:
+        raise ValueError("A matriz não é tridiagonal.")
+    A = to_csr(A)
+    return A.diagonal(-1), A.diagonal(0), A.diagonal(1)
+
+
+def thomas(lower, diag, upper, d):
+    """Solves a tridiagonal system in O(n) by the Thomas algorithm (no pivoting).
+
+    lower and upper have n-1 elements, diag and d have n.
+    """
+    n = len(diag)
+    c = np.zeros(n)
+    g = np.zeros(n)
+    c_prev = g_prev = 0.0
+    for i in range(n):
+        a_i = lower[i - 1] if i > 0 else 0.0
+        denom = diag[i] - a_i * c_prev
+        if denom == 0:
+            raise ValueError("Pivô nulo no algoritmo de Thomas.")
+        c_prev = upper[i] / denom if i < n - 1 else 0.0
+        g_prev = (d[i] - a_i * g_prev) / denom
+        c[i], g[i] = c_prev, g_prev
+
+    x = np.zeros(n)
+    x[-1] = g[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = g[i] - c[i] * x[i + 1]
+    return x
+
+
+def solve_banded(A, b):
+    """Direct solve of a banded A through LAPACK, in O(n * bandwidth^2)."""
+    from scipy.linalg import solve_banded as lapack_solve_banded
+
+    A = to_csr(A)
+    n = A.shape[0]
+    lower, upper = bandwidth(A)
+    # LAPACK band storage: ab[upper + i - j, j] = A[i, j]
+    ab = np.zeros((lower + upper + 1, n))
+    for offset in range(-lower, upper + 1):
+        diagonal = A.diagonal(offset)
+        if offset >= 0:
+            ab[upper - offset, offset:] = diagonal
+        else:
+            ab[upper - offset, :n + offset] = diagonal
+    return lapack_solve_banded((lower, upper), ab, np.asarray(b, dtype=float))
+
+
+def _iterate(A, b, x0, tol, max_iter, step, method):
+    """Runs x <- step(x, r) until ||r|| / ||b|| < tol, where r = b - A x."""
+    A = to_csr(A)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    norm_b = np.linalg.norm(b) or 1.0
+
+    residuals = np.empty(max_iter + 1)
+    r = b - A @ x
+    residuals[0] = np.linalg.norm(r) / norm_b
+    k = 0
+    while residuals[k] >= tol and k < max_iter:
+        x = step(x, r)
+        r = b - A @ x
+        k += 1
+        residuals[k] = np.linalg.norm(r) / norm_b
+        if not np.isfinite(residuals[k]):
+            break
+    return IterativeResult(x, bool(residuals[k] < tol), k, residuals[:k + 1], method)
+
+
+def jacobi(A, b, x0=None, tol=1e-8, max_iter=1000):
+    """Jacobi iteration x <- x + D^-1 (b - A x), O(nnz) per iteration."""
+    A = to_csr(A)
+    d = A.diagonal()
+    if np.any(d == 0):
+        raise ValueError("Jacobi requer diagonal sem zeros.")
+    return _iterate(A, b, x0, tol, max_iter, lambda x, r: x + r / d, "Jacobi")
+
+
+def sor(A, b, omega=1.0, x0=None, tol=1e-8, max_iter=1000):
+    """Successive over-relaxation x <- x + (D/omega + L)^-1 (b - A x); omega = 1 is Gauss-Seidel.
+
+    Each iteration is one sparse triangular solve, O(nnz).
+    """
+    if not 0 < omega < 2:
+        raise ValueError("O fator de relaxação deve estar em (0, 2).")
+    A = to_csr(A)
+    d = A.diagonal()
+    if np.any(d == 0):
+        raise ValueError("SOR requer diagonal sem zeros.")
+    M = (sp.tril(A, k=-1) + sp.diags(d / omega)).tocsr()
+    method = "Gauss-Seidel" if omega == 1.0 else f"SOR (ω={omega})"
+    return _iterate(A, b, x0, tol, max_iter, lambda x, r: x + spsolve_triangular(M, r, lower=True), method)
+
+
+def gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=1000):
+    """Gauss-Seidel iteration, i.e. SOR with omega = 1."""
+    return sor(A, b, 1.0, x0, tol, max_iter)
+
+
+def conjugate_gradient(A, b, x0=None, tol=1e-8, max_iter=None):
+    """Conjugate gradient for symmetric positive definite A, one product A p per iteration."""
+    A = to_csr(A)
+    b = np.asarray(b, dtype=float)
+    if max_iter is None:
+        max_iter = len(b)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    norm_b = np.linalg.norm(b) or 1.0
+
+    residuals = np.empty(max_iter + 1)
+    r = b - A @ x
+    p = r.copy()
+    rr = r @ r
+    residuals[0] = np.sqrt(rr) / norm_b
+    k = 0
+    while residuals[k] >= tol and k < max_iter:
+        Ap = A @ p
+        pAp = p @ Ap
+        if pAp <= 0:
+            raise ValueError("Gradientes conjugados requer matriz simétrica positiva definida.")
+        alpha = rr / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        rr_new = r @ r
+        p = r + (rr_new / rr) * p
+        rr = rr_new
+        k += 1
+        residuals[k] = np.sqrt(rr) / norm_b
+    return IterativeResult(x, bool(residuals[k] < tol), k, residuals[:k + 1], "Gradientes Conjugados")
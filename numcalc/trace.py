@@ -0,0 +1,96 @@
+from collections import namedtuple
+import os
+
+import numpy as np
+
+# A column of an iteration table: field name, title in the text table and format spec.
+# Specs ending in "d" are stored as integers, all others as floats.
+Column = namedtuple("Column", "name title spec")
+
+
+class IterationTrace:
+    """Iteration table of a numerical method, recorded in a NumPy structured array.
+
+    Rows are written into a preallocated array (grown by doubling if the
+    capacity runs out), so recording costs no formatting and no Python
+    objects per value. Text is produced only for the rows asked for by
+    format(); the whole table exports to CSV or NPZ with save().
+    """
+
+    def __init__(self, columns, capacity=64):
+        self.columns = [Column(*c) for c in columns]
+        self.dtype = np.dtype([(c.name, np.int64 if c.spec.endswith("d") else np.float64)
+                               for c in self.columns])
+        self._rows = np.empty(max(int(capacity), 1), dtype=self.dtype)
+        self._len = 0
+
+    def _reserve(self, extra):
+        needed = self._len + extra
+        if needed > len(self._rows):
+            grown = np.empty(max(needed, 2 * len(self._rows)), dtype=self.dtype)
+            grown[:self._len] = self._rows[:self._len]
+            self._rows = grown
+
+    def append(self, *values):
+        """Records one row, values in column order."""
+        self._reserve(1)
+        self._rows[self._len] = values
+        self._len += 1
+
+    def extend(self, *columns):
+        """Records a block of rows given column by column (arrays or scalars)."""
+        columns = np.broadcast_arrays(*columns)
+        count = len(columns[0])
+        self._reserve(count)
+        block = self._rows[self._len:self._len + count]
+        for c, values in zip(self.columns, columns):
+            block[c.name] = values
+        self._len += count
+
+    @property
+    def data(self):
+        """The recorded rows, as a view of the structured array."""
+        return self._rows[:self._len]
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, name):
+        return self.data[name]
+
+    def __iter__(self):
+        return iter(self.data.tolist())
+
+    def _widths(self):
+        return [max(_width(c.spec), len(c.title)) for c in self.columns]
+
+    def header(self):
+        titles = " | ".join(c.title.center(w) for c, w in zip(self.columns, self._widths()))
+        return f"{titles}\n{'-' * len(titles)}\n"
+
+    def format(self, start=0, stop=None, header=True):
+        """Text table of rows start to stop, formatted only now."""
+        cells = [(c.spec, w) for c, w in zip(self.columns, self._widths())]
+        text = self.header() if header else ""
+        for row in self.data[start:stop].tolist():
+            text += " | ".join(format(v, s).rjust(w) for v, (s, w) in zip(row, cells)) + "\n"
+        return text
+
+    def save(self, path):
+        """Writes the table to path: .npz stores one array per column, anything else CSV."""
+        if os.path.splitext(path)[1].lower() == ".npz":
+            np.savez(path, **{c.name: self.data[c.name] for c in self.columns})
+        else:
+            fmt = ["%d" if c.spec.endswith("d") else "%.17g" for c in self.columns]
+            np.savetxt(path, self.data, fmt=fmt, delimiter=",",
+                       header=",".join(c.name for c in self.columns), comments="")
+
+
+def _width(spec):
+    """Field width of a format spec such as "11.6f" (0 if it has none)."""
+    digits = ""
+    for ch in spec.lstrip("<>^=+- #0"):
+        if not ch.isdigit():
+            break
+        digits += ch
+    return int(digits or 0)
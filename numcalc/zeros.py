@@ -0,0 +1,413 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from numcalc.trace import IterationTrace
+
+BISECTION_COLUMNS = [("n", "n", "2d"), ("a", "a", "11.6f"), ("b", "b", "11.6f"), ("c", "c", "11.6f"),
+                     ("f_c", "f(c)", "11.6f"), ("width", "b-a", "11.6f")]
+BRACKETING_COLUMNS = [("n", "n", "2d"), ("a", "a", "11.6f"), ("b", "b", "11.6f"), ("x", "x_n", "13.8f"),
+                      ("f_x", "f(x_n)", "11.6f"), ("width", "b-a", "11.6f")]
+NEWTON_COLUMNS = [("n", "n", "2d"), ("x", "x_n", "13.8f"), ("f_x", "f(x_n)", "12.8f"),
+                  ("df_x", "f'(x_n)", "11.8f"), ("error", "|x_n+1 - x_n|", "15.8f")]
+
+
+@dataclass
+class BisectionResult:
+    """Outcome of the bisection method. Each iteration is (n, a, b, c, f(c), b-a)."""
+    root: float
+    converged: bool
+    iterations: IterationTrace
+    function_evals: int = 0
+
+
+@dataclass
+class NewtonResult:
+    """Outcome of Newton-Raphson. Each iteration is (n, x_n, f(x_n), f'(x_n), |x_n+1 - x_n|)."""
+    root: float
+    converged: bool
+    iterations: IterationTrace
+    zero_derivative: bool = False
+
+
+@dataclass
+class BatchBisectionResult:
+    """Per-bracket outcome of bisection_batch.
+
+    iterations counts midpoint evaluations; brackets without a sign change
+    have root NaN and converged False.
+    """
+    roots: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+def _evaluate(f, x):
+    """Evaluates f on the array x, broadcasting constant functions to x's shape."""
+    return np.asarray(f(x), dtype=float) * np.ones_like(x)
+
+
+class _Counted:
+    """Wraps a function to count its evaluations."""
+
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.f(x)
+
+
+@dataclass
+class BracketingResult:
+    """Outcome of a bracketing hybrid (brent, illinois, ridders, safeguarded_newton).
+
+    Each iteration is (n, a, b, x_n, f(x_n), b-a) with [a, b] the bracket
+    after the step. function_evals counts calls of f and derivative_evals
+    those of f'.
+    """
+    root: float
+    converged: bool
+    iterations: IterationTrace
+    method: str
+    function_evals: int
+    derivative_evals: int = 0
+
+
+def _bracket(f, a, b):
+    """(a, b, f(a), f(b)) with a < b, raising ValueError unless f changes sign on [a, b]."""
+    if a > b:
+        a, b = b, a
+    f_a, f_b = f(a), f(b)
+    if f_a * f_b > 0 or np.isnan(f_a * f_b):
+        raise ValueError("Função inválida ou f(a)*f(b) >= 0.")
+    return a, b, f_a, f_b
+
+
+def bisection(f, a, b, tol, max_iter=100):
+    """Finds a root of f in [a, b], which must satisfy f(a)*f(b) < 0."""
+    f = _Counted(f)
+    f_a = f(a)
+    if f_a * f(b) >= 0:
+        raise ValueError("Função inválida ou f(a)*f(b) >= 0.")
+
+    iterations = IterationTrace(BISECTION_COLUMNS, capacity=max_iter)
+    c = a
+    for n in range(max_iter):
+        c = (a + b) / 2
+        f_c = f(c)
+        iterations.append(n, a, b, c, f_c, b - a)
+
+        if abs(f_c) < tol or (b - a) / 2 < tol:
+            return BisectionResult(c, True, iterations, f.calls)
+
+        if f_a * f_c < 0:
+            b = c
+        else:
+            a, f_a = c, f_c
+    return BisectionResult(c, False, iterations, f.calls)
+
+
+def newton(f, f_prime, x0, tol, max_iter=50):
+    """Finds a root of f starting from x0 using the derivative f_prime."""
+    iterations = IterationTrace(NEWTON_COLUMNS, capacity=max_iter)
+    x_n = x0
+    for n in range(max_iter):
+        f_xn = f(x_n)
+        f_prime_xn = f_prime(x_n)
+
+        if abs(f_prime_xn) < 1e-12:
+            return NewtonResult(x_n, False, iterations, zero_derivative=True)
+
+        x_n1 = x_n - f_xn / f_prime_xn
+        error = abs(x_n1 - x_n)
+        iterations.append(n, x_n, f_xn, f_prime_xn, error)
+
+        x_n = x_n1
+        if error < tol:
+            return NewtonResult(x_n, True, iterations)
+    return NewtonResult(x_n, False, iterations)
+
+
+def brent(f, a, b, tol, max_iter=100):
+    """Brent's method: inverse quadratic interpolation or secant steps, bisection when they stall.
+
+    Keeps a bracket like bisection and never needs more than a few
+    bisection steps more, but typically converges superlinearly. Stops
+    when |f(x_n)| < tol or the bracket is narrower than about 2*tol.
+    """
+    f = _Counted(f)
+    a, b, f_a, f_b = _bracket(f, a, b)
+    iterations = IterationTrace(BRACKETING_COLUMNS, capacity=max_iter)
+    eps = np.finfo(float).eps
+    # b is the best estimate, [b, c] the bracket, a the previous b
+    c, f_c = b, f_b
+    d = e = b - a
+    for n in range(max_iter):
+        if (f_b > 0) == (f_c > 0):
+            c, f_c = a, f_a
+            d = e = b - a
+        if abs(f_c) < abs(f_b):
+            a, b, c = b, c, b
+            f_a, f_b, f_c = f_b, f_c, f_b
+        tol1 = 2 * eps * abs(b) + tol
+        xm = (c - b) / 2
+        iterations.append(n, min(b, c), max(b, c), b, f_b, abs(c - b))
+        if abs(f_b) < tol or abs(xm) <= tol1 or f_b == 0:
+            return BracketingResult(b, True, iterations, "Brent", f.calls)
+
+        if abs(e) >= tol1 and abs(f_a) > abs(f_b):
+            s = f_b / f_a
+            if a == c:
+                # Secant
+                p, q = 2 * xm * s, 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q, r = f_a / f_c, f_b / f_c
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+        a, f_a = b, f_b
+        b += d if abs(d) > tol1 else np.copysign(tol1, xm)
+        f_b = f(b)
+    return BracketingResult(b, False, iterations, "Brent", f.calls)
+
+
+def illinois(f, a, b, tol, max_iter=100):
+    """Regula falsi with the Illinois modification.
+
+    When the same endpoint survives two steps in a row its f value is
+    halved, so both ends of the bracket converge instead of one sticking.
+    """
+    f = _Counted(f)
+    a, b, f_a, f_b = _bracket(f, a, b)
+    iterations = IterationTrace(BRACKETING_COLUMNS, capacity=max_iter)
+    x = a if f_a == 0 else b
+    side = 0
+    for n in range(max_iter):
+        if f_a == 0 or f_b == 0:
+            return BracketingResult(x, True, iterations, "Illinois", f.calls)
+        x = (a * f_b - b * f_a) / (f_b - f_a)
+        f_x = f(x)
+        if (f_x > 0) == (f_a > 0):
+            a, f_a = x, f_x
+            if side == -1:
+                f_b /= 2
+            side = -1
+        else:
+            b, f_b = x, f_x
+            if side == 1:
+                f_a /= 2
+            side = 1
+        iterations.append(n, a, b, x, f_x, b - a)
+        if abs(f_x) < tol or (b - a) / 2 < tol:
+            return BracketingResult(x, True, iterations, "Illinois", f.calls)
+    return BracketingResult(x, False, iterations, "Illinois", f.calls)
+
+
+def ridders(f, a, b, tol, max_iter=100):
+    """Ridders' method: exponential interpolation through a, the midpoint and b.
+
+    Two evaluations per iteration, quadratic convergence, and the new point
+    always stays inside the bracket.
+    """
+    f = _Counted(f)
+    a, b, f_a, f_b = _bracket(f, a, b)
+    iterations = IterationTrace(BRACKETING_COLUMNS, capacity=max_iter)
+    x = a if f_a == 0 else b
+    for n in range(max_iter):
+        if f_a == 0 or f_b == 0:
+            return BracketingResult(x, True, iterations, "Ridders", f.calls)
+        m = (a + b) / 2
+        f_m = f(m)
+        s = np.sqrt(f_m * f_m - f_a * f_b)
+        if s == 0:
+            return BracketingResult(m, True, iterations, "Ridders", f.calls)
+        x = m + (m - a) * np.sign(f_a - f_b) * f_m / s
+        f_x = f(x)
+        # Smallest bracket among a, m, x, b
+        if (f_m > 0) != (f_x > 0):
+            (a, f_a), (b, f_b) = sorted([(m, f_m), (x, f_x)])
+        elif (f_a > 0) != (f_x > 0):
+            b, f_b = x, f_x
+        else:
+            a, f_a = x, f_x
+        iterations.append(n, a, b, x, f_x, b - a)
+        if abs(f_x) < tol or (b - a) / 2 < tol:
+            return BracketingResult(x, True, iterations, "Ridders", f.calls)
+    return BracketingResult(x, False, iterations, "Ridders", f.calls)
+
+
+def safeguarded_newton(f, f_prime, a, b, tol, max_iter=100):
+    """Newton-Raphson kept inside the bracket [a, b].
+
+    A Newton step that would leave the bracket, or that does not halve the
+    step of two iterations before, or that would divide by f'(x) = 0, is
+    replaced by a bisection step, so the method cannot diverge.
+    """
+    f, f_prime = _Counted(f), _Counted(f_prime)
+    a, b, f_a, f_b = _bracket(f, a, b)
+    iterations = IterationTrace(BRACKETING_COLUMNS, capacity=max_iter)
+
+    def result(x, converged):
+        return BracketingResult(x, converged, iterations, "Newton protegido", f.calls, f_prime.calls)
+
+    if f_a == 0 or f_b == 0:
+        return result(a if f_a == 0 else b, True)
+    # Orient so that f(low) < 0 < f(high)
+    low, high = (a, b) if f_a < 0 else (b, a)
+    x = (a + b) / 2
+    f_x = f(x)
+    if f_x == 0:
+        return result(x, True)
+    df_x = f_prime(x)
+    step = step_old = b - a
+    for n in range(max_iter):
+        newton_outside = ((x - high) * df_x - f_x) * ((x - low) * df_x - f_x) > 0
+        if df_x == 0 or newton_outside or abs(2 * f_x) > abs(step_old * df_x):
+            step_old, step = step, (high - low) / 2
+            x = low + step
+        else:
+            step_old, step = step, f_x / df_x
+            x -= step
+        f_x = f(x)
+        if f_x == 0:
+            iterations.append(n, min(low, high), max(low, high), x, f_x, abs(high - low))
+            return result(x, True)
+        df_x = f_prime(x)
+        if f_x < 0:
+            low = x
+        else:
+            high = x
+        iterations.append(n, min(low, high), max(low, high), x, f_x, abs(high - low))
+        if abs(step) < tol or abs(f_x) < tol:
+            return result(x, True)
+    return result(x, False)
+
+
+def bisection_batch(f, a, b, tol, max_iter=100):
+    """Runs bisection on every bracket [a[i], b[i]] at once.
+
+    f must accept NumPy arrays. Each iteration evaluates f only at the
+    midpoints of the brackets still active, and the sign of f at the left
+    endpoint is carried along instead of being recomputed.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a, b = a.ravel().copy(), b.ravel().copy()
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), a.shape).ravel()
+
+    f_a = _evaluate(f, a)
+    f_b = _evaluate(f, b)
+    sign_a = np.sign(f_a)
+
+    roots = np.full(a.shape, np.nan)
+    iterations = np.zeros(a.shape, dtype=int)
+    converged = np.zeros(a.shape, dtype=bool)
+
+    # Endpoints that are already roots
+    for f_end, end in ((f_a, a), (f_b, b)):
+        hit = (f_end == 0) & ~converged
+        roots[hit] = end[hit]
+        converged[hit] = True
+
+    active = np.flatnonzero(~converged & (f_a * f_b < 0))
+    c = (a + b) / 2
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        c_act = (a[active] + b[active]) / 2
+        f_c = _evaluate(f, c_act)
+        c[active] = c_act
+        iterations[active] += 1
+
+        done = (np.abs(f_c) < tol[active]) | ((b[active] - a[active]) / 2 < tol[active])
+        finished = active[done]
+        roots[finished] = c_act[done]
+        converged[finished] = True
+
+        same_sign = np.sign(f_c) == sign_a[active]
+        move_a = active[same_sign & ~done]
+        move_b = active[~same_sign & ~done]
+        a[move_a] = c[move_a]
+        b[move_b] = c[move_b]
+        active = active[~done]
+
+    # Brackets that hit max_iter report their last midpoint
+    roots[active] = c[active]
+    return BatchBisectionResult(roots, iterations, converged)
+
+
+@dataclass
+class AllRootsResult:
+    """Roots of f found in [a, b] by scanning a grid of samples points."""
+    roots: np.ndarray
+    samples: int
+    brackets: int
+    touching: int
+
+
+def _minimize_abs_batch(f, lo, hi, tol, max_iter=100):
+    """Golden-section search for the minimum of |f| on every interval [lo[i], hi[i]]."""
+    ratio = (np.sqrt(5) - 1) / 2
+    lo, hi = lo.copy(), hi.copy()
+    for _ in range(max_iter):
+        if np.all(hi - lo < tol):
+            break
+        x1 = hi - ratio * (hi - lo)
+        x2 = lo + ratio * (hi - lo)
+        left = np.abs(_evaluate(f, x1)) < np.abs(_evaluate(f, x2))
+        hi = np.where(left, x2, hi)
+        lo = np.where(left, lo, x1)
+    return (lo + hi) / 2
+
+
+def find_all_roots(f, a, b, tol, samples=100000, max_iter=100):
+    """Finds every root of f in [a, b] that shows up on a uniform grid.
+
+    f is sampled once on samples points. Sign changes between neighbours
+    are refined with bisection_batch; local minima of |f| below tol that do
+    not change sign (even-multiplicity roots) are refined with a
+    golden-section search. Roots closer than 2*tol are merged.
+    """
+    x = np.linspace(a, b, samples)
+    y = _evaluate(f, x)
+
+    roots = [x[y == 0]]
+
+    # Sign changes; NaN samples never form a bracket
+    change = np.flatnonzero(np.sign(y[:-1]) * np.sign(y[1:]) < 0)
+    if change.size:
+        res = bisection_batch(f, x[change], x[change + 1], tol, max_iter)
+        f_root = np.abs(_evaluate(f, res.roots))
+        # Drop poles: at a real root |f| shrinks below both bracket endpoints
+        bound = np.minimum(np.abs(y[change]), np.abs(y[change + 1]))
+        keep = res.converged & ((f_root < tol) | (f_root <= bound))
+        roots.append(res.roots[keep])
+
+    # Near-zero local minima of |f| with no sign change around them
+    abs_y = np.abs(y)
+    interior = np.arange(1, samples - 1)
+    touching = interior[(abs_y[1:-1] < abs_y[:-2]) & (abs_y[1:-1] <= abs_y[2:])
+                        & (np.sign(y[:-2]) == np.sign(y[2:])) & (y[1:-1] != 0)]
+    n_touching = 0
+    if touching.size:
+        candidates = _minimize_abs_batch(f, x[touching - 1], x[touching + 1], tol, max_iter)
+        found = candidates[np.abs(_evaluate(f, candidates)) < tol]
+        n_touching = found.size
+        roots.append(found)
+
+    roots = np.sort(np.concatenate(roots))
+    if roots.size > 1:
+        # Merge duplicates: start a new group at every gap wider than 2*tol
+        group = np.concatenate([[0], np.cumsum(np.diff(roots) > 2 * tol)])
+        roots = np.bincount(group, weights=roots) / np.bincount(group)
+    return AllRootsResult(roots, samples, int(change.size), n_touching)
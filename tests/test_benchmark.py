@@ -0,0 +1,32 @@
+import numpy as np
+
+from numcalc import benchmark
+from numcalc.benchmark import compare, run_case
+
+
+def test_run_case_measures_accuracy():
+    record = run_case("diagonally_dominant", 20, True, repeat=1)
+    assert "error" not in record
+    assert record["forward_error"] < 1e-10
+
+
+def test_non_finite_solution_is_an_error(monkeypatch):
+    # Without pivoting a pivot of 1e-320 overflows to inf instead of raising
+    def make_matrix(family, n, rng):
+        A = np.eye(n) + 1.0
+        A[0, 0] = 1e-320
+        return A
+
+    monkeypatch.setattr(benchmark, "make_matrix", make_matrix)
+    record = run_case("random", 4, False, repeat=1)
+    assert "error" in record
+    assert "time" not in record
+
+
+def test_compare_flags_new_failures():
+    baseline = {"results": [run_case("tridiagonal", 10, False, repeat=1)]}
+    current = {"results": [dict(baseline["results"][0], error="Solução com valores não finitos.")]}
+    for r in current["results"]:
+        for k in ("time", "residual", "forward_error"):
+            r.pop(k, None)
+    assert compare(baseline, current)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from utils.decimation import decimate_line, decimate_points, lttb
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.linspace(0.0, 1.0, 100_000)
+    y = np.sin(20 * x)
+    y[31_337] = 50.0
+    y[77_777] = -40.0
+    picks = lttb(x, y, 500)
+    assert len(picks) == 500
+    assert picks[0] == 0 and picks[-1] == len(x) - 1
+    assert np.all(np.diff(picks) > 0)
+    assert 31_337 in picks and 77_777 in picks
+
+
+def test_lttb_small_inputs_are_kept():
+    x = np.arange(10.0)
+    assert np.array_equal(lttb(x, x**2, 10), np.arange(10))
+    assert np.array_equal(lttb(x, x**2, 2), np.arange(10))
+
+
+def test_decimate_line_reaches_view_edges():
+    x = np.linspace(0.0, 100.0, 100_001)
+    xd, yd = decimate_line(x, np.cos(x), xlim=(10.0, 20.0), n_out=300)
+    assert len(xd) == 300
+    assert xd[0] < 10.0 <= xd[1] and xd[-2] <= 20.0 < xd[-1]
+
+
+def test_decimate_points_one_per_pixel_keeps_outliers():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(200_000)
+    y = rng.standard_normal(200_000)
+    x[123], y[123] = 30.0, 0.0
+    y[456] = np.nan
+    xd, yd = decimate_points(x, y, width=100, height=80)
+    assert len(xd) <= 100 * 80 + 4
+    assert 30.0 in xd
+    assert np.isfinite(yd).all()
+    assert xd.min() == np.nanmin(x[np.isfinite(y)]) and yd.max() == np.nanmax(y)
+    # No two points in the same pixel
+    col = np.minimum(((xd - xd.min()) / np.ptp(xd) * 100).astype(int), 99)
+    row = np.minimum(((yd - yd.min()) / np.ptp(yd) * 80).astype(int), 79)
+    _, counts = np.unique(row * 100 + col, return_counts=True)
+    assert counts.max() <= 2 # the four extremes may share a pixel with a binned point
+
+
+def test_decimate_points_sparse_view_is_unchanged():
+    x = np.arange(50.0)
+    xd, yd = decimate_points(x, x, xlim=(10.0, 19.0), ylim=(0.0, 100.0))
+    assert np.array_equal(xd, np.arange(10.0, 20.0))
@@ -0,0 +1,103 @@
+import math
+import time
+
+import numpy as np
+import pytest
+import sympy
+
+from numcalc import expressions
+from numcalc.expressions import (NUMEXPR_MIN_SIZE, X, ExpressionCache, MultiBackendFunction, available_backends,
+                                 compile_backend, compile_system, parse_expression)
+
+
+def _tridiagonal(n):
+    return [f"2*x{i} - x{i - 1} - x{i + 1} + x{i}**3 - 1".replace(" - x0", "").replace(f" - x{n + 1}", "")
+            for i in range(1, n + 1)]
+
+
+def test_jacobian_and_sparsity():
+    system = compile_system(_tridiagonal(5))
+    x = np.linspace(0.1, 0.5, 5)
+    J = system.jacobian()(x)
+    expected = np.diag(2 + 3 * x**2) - np.eye(5, k=1) - np.eye(5, k=-1)
+    assert np.allclose(J, expected)
+    assert np.array_equal(system.sparsity.toarray(), expected != 0)
+    assert np.allclose(system.jacobian(sparse=True)(x).toarray(), expected)
+
+
+def test_large_sparse_jacobian_is_fast():
+    system = compile_system(_tridiagonal(400))
+    start = time.perf_counter()
+    assert system.sparsity.nnz == 3 * 400 - 2
+    J = system.jacobian(sparse=True)(np.ones(400))
+    assert J.nnz == 3 * 400 - 2
+    assert time.perf_counter() - start < 30
+
+
+EXPRESSIONS = ["x**3 - x - 2", "exp(x)*sin(x) + exp(x)/(1 + exp(x))",
+               "sqrt(1 + x**2)*log(1 + x**2) - cos(sqrt(1 + x**2))"]
+
+
+@pytest.mark.parametrize("text", EXPRESSIONS)
+def test_backends_agree(text):
+    expr = parse_expression(text)
+    reference = sympy.lambdify(X, expr, "numpy")
+    x = np.linspace(-2.0, 2.0, 101)
+    assert np.allclose(compile_backend(expr, "numpy")(x), reference(x))
+    math_f = compile_backend(expr, "math")
+    assert np.allclose([math_f(v) for v in x.tolist()], reference(x))
+
+
+def test_multi_backend_scalars_and_arrays():
+    f = MultiBackendFunction(parse_expression("log(x) + 1/x"))
+    assert type(f(2.0)) is float
+    assert f(2.0) == pytest.approx(math.log(2.0) + 0.5)
+    assert f(np.float32(2.0)) == pytest.approx(math.log(2.0) + 0.5)
+    # Domain errors and division by zero fall back to NumPy's nan and inf
+    with np.errstate(all="ignore"):
+        assert np.isnan(f(-1.0))
+        assert np.isinf(MultiBackendFunction(parse_expression("1/x"))(0.0))
+    x = np.array([0.5, 1.0, 4.0])
+    assert isinstance(f(x), np.ndarray)
+    assert np.allclose(f(x), np.log(x) + 1 / x)
+
+
+def test_constant_expression():
+    f = MultiBackendFunction(parse_expression("pi"))
+    assert f(1.0) == pytest.approx(math.pi)
+    assert np.allclose(f(np.zeros(3)) * np.ones(3), math.pi)
+
+
+def test_unknown_or_missing_backend():
+    expr = parse_expression("x + 1")
+    with pytest.raises(ValueError):
+        compile_backend(expr, "fortran")
+    if expressions._numexpr() is None:
+        assert "numexpr" not in available_backends()
+        with pytest.raises(ValueError):
+            compile_backend(expr, "numexpr")
+
+
+def test_numexpr_backend_on_large_arrays():
+    pytest.importorskip("numexpr")
+    expr = parse_expression(EXPRESSIONS[2])
+    x = np.linspace(-3.0, 3.0, NUMEXPR_MIN_SIZE + 1)
+    f = MultiBackendFunction(expr)
+    assert f.numexpr is not None
+    assert np.allclose(f(x), sympy.lambdify(X, expr, "numpy")(x))
+    # Functions numexpr lacks keep the NumPy code
+    assert MultiBackendFunction(parse_expression("gamma(x)")).numexpr is None
+
+
+def test_expression_cache_reuses_compiled_expressions():
+    cache = ExpressionCache(maxsize=2)
+    first = cache.get("x**2  + 1")
+    assert cache.get("x**2 + 1") is first
+    cache.get("x + 2")
+    cache.get("x + 3")
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 3, 1, 2)
+    d1, d1_expr = first.derivative(1)
+    assert first.derivative(1)[0] is d1
+    assert first.derivative(2)[1] == 2
+    assert d1(3.0) == pytest.approx(6.0)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from numcalc.integration import adaptive_simpson, gauss_kronrod, gauss_nodes
+
+
+@pytest.mark.parametrize("integrate", [adaptive_simpson, gauss_kronrod])
+def test_adaptive_empty_interval(integrate):
+    result = integrate(np.sin, 1.0, 1.0)
+    assert result.value == 0.0
+    assert result.converged
+    assert result.evaluations == 0
+
+
+@pytest.mark.parametrize("integrate", [adaptive_simpson, gauss_kronrod])
+def test_adaptive_tolerance_below_roundoff_stops_at_limit(integrate):
+    result = integrate(lambda x: np.sqrt(np.abs(x - 0.3)), 0.0, 1.0, 1e-300, 1e-300, limit=1000)
+    assert not result.converged
+    assert len(result.intervals) <= 2000
+    exact = (0.3**1.5 + 0.7**1.5) * 2 / 3
+    assert abs(result.value - exact) < 1e-5
+
+
+@pytest.mark.parametrize("integrate", [adaptive_simpson, gauss_kronrod])
+def test_adaptive_converges(integrate):
+    result = integrate(np.exp, 0.0, 1.0, 1e-10, 1e-10)
+    assert result.converged
+    assert abs(result.value - (np.e - 1)) < 1e-9
+
+
+@pytest.mark.parametrize("integrate", [adaptive_simpson, gauss_kronrod])
+@pytest.mark.parametrize("options", [{"max_levels": 0}, {"limit": 0}])
+def test_adaptive_rejects_empty_budgets(integrate, options):
+    with pytest.raises(ValueError):
+        integrate(np.exp, 0.0, 1.0, **options)
+
+
+@pytest.mark.parametrize("integrate", [adaptive_simpson, gauss_kronrod])
+def test_adaptive_single_level_is_not_converged(integrate):
+    result = integrate(lambda x: np.sqrt(np.abs(x - 0.3)), 0.0, 1.0, 1e-14, 1e-14, max_levels=1)
+    assert not result.converged
+    assert np.isfinite(result.value)
+
+
+def test_symbolic_integral_in_spawned_process():
+    import sympy
+    from numcalc.expressions import X
+    from numcalc.integration import symbolic_integral
+    assert symbolic_integral(X**2, 0, 3, timeout=30) == pytest.approx(9.0)
+    assert symbolic_integral(sympy.exp(-X**2) * sympy.sin(X**3), 0, 1, timeout=0.01) is None
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 10, 20, 64])
+def test_gauss_nodes_match_leggauss(n):
+    t, w = gauss_nodes(n)
+    t_ref, w_ref = np.polynomial.legendre.leggauss(n)
+    assert np.allclose(t, t_ref, rtol=0, atol=1e-14)
+    assert np.allclose(w, w_ref, rtol=1e-11, atol=0)
+    assert not t.flags.writeable
+    # Exact for polynomials up to degree 2n - 1
+    degree = 2 * n - 2
+    assert np.sum(w * t**degree) == pytest.approx(2 / (degree + 1), rel=1e-12)
+
+
+def test_gauss_nodes_rejects_empty_rule():
+    with pytest.raises(ValueError):
+        gauss_nodes(0)
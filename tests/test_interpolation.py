@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from scipy.interpolate import BarycentricInterpolator, CubicSpline, PchipInterpolator
+
+from numcalc.interpolation import (barycentric_weights, chebyshev_nodes, chebyshev_weights,
+                                   lagrange_interpolation, spline_interpolation)
+
+
+def test_lagrange_reproduces_nodes_and_polynomials():
+    x = np.array([3.0, -1.0, 0.5, 2.0, 1.0])
+    y = x**4 - 2 * x + 1
+    p = lagrange_interpolation(x, y)
+    assert np.array_equal(p(x), y)
+    t = np.linspace(-1.5, 3.5, 41)
+    assert np.allclose(p(t), t**4 - 2 * t + 1)
+    assert np.ndim(p(0.25)) == 0
+
+
+def test_lagrange_matches_scipy_barycentric():
+    x = np.linspace(-1.0, 1.0, 15)
+    y = np.exp(x) * np.sin(3 * x)
+    t = np.linspace(-1.0, 1.0, 101)
+    assert np.allclose(lagrange_interpolation(x, y)(t), BarycentricInterpolator(x, y)(t))
+
+
+def test_chebyshev_weights_match_general_weights():
+    for kind in (1, 2):
+        x = chebyshev_nodes(12, kind=kind)
+        w = chebyshev_weights(12, kind=kind)
+        w_general = barycentric_weights(x)
+        assert np.allclose(w / w[0], w_general / w_general[0])
+
+
+def test_many_chebyshev_nodes_stay_accurate():
+    n = 2000
+    x = chebyshev_nodes(n)
+    p = lagrange_interpolation(x, 1 / (1 + 25 * x**2), chebyshev_weights(n))
+    t = np.linspace(-1.0, 1.0, 1001)
+    assert np.max(np.abs(p(t) - 1 / (1 + 25 * t**2))) < 1e-12
+
+
+def test_add_point_matches_rebuild():
+    x = np.array([0.0, 1.0, 2.5, 4.0])
+    p = lagrange_interpolation(x, np.cos(x))
+    p.add_point(3.0, np.cos(3.0))
+    rebuilt = lagrange_interpolation(np.append(x, 3.0), np.cos(np.append(x, 3.0)))
+    t = np.linspace(0.0, 4.0, 33)
+    assert np.allclose(p(t), rebuilt(t))
+    with pytest.raises(ValueError):
+        p.add_point(1.0, 0.0)
+
+
+def test_lagrange_rejects_repeated_nodes():
+    with pytest.raises(ValueError):
+        lagrange_interpolation([0.0, 1.0, 0.0], [1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize("kind, bc_type", [("natural", "natural"), ("not-a-knot", "not-a-knot"),
+                                           ("clamped", ((1, 0.5), (1, -2.0)))])
+def test_cubic_splines_match_scipy(kind, bc_type):
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0.0, 10.0, 12))
+    y = np.sin(x)
+    s = spline_interpolation(x, y, kind, fprime=(0.5, -2.0))
+    t = np.linspace(x[0], x[-1], 200)
+    assert np.allclose(s(t), CubicSpline(x, y, bc_type=bc_type)(t))
+
+
+def test_pchip_matches_scipy_and_keeps_monotonicity():
+    x = np.array([0.0, 1.0, 2.0, 3.5, 4.0, 6.0, 7.0])
+    y = np.array([0.0, 0.1, 0.1, 2.0, 2.1, 5.0, 5.0])
+    s = spline_interpolation(x, y, "pchip")
+    t = np.linspace(0.0, 7.0, 500)
+    assert np.allclose(s(t), PchipInterpolator(x, y)(t))
+    assert np.all(np.diff(s(t)) >= -1e-12)
+
+
+def test_small_splines():
+    # Two points: a line; three with not-a-knot: the parabola through them
+    assert spline_interpolation([0.0, 2.0], [1.0, 5.0])(1.0) == pytest.approx(3.0)
+    s = spline_interpolation([0.0, 1.0, 3.0], [0.0, 1.0, 9.0], "not-a-knot")
+    assert s(2.0) == pytest.approx(4.0)
+
+
+def test_spline_rejects_bad_input():
+    with pytest.raises(ValueError):
+        spline_interpolation([0.0, 1.0], [0.0, 1.0], "quintic")
+    with pytest.raises(ValueError):
+        spline_interpolation([0.0, 1.0, 1.0], [0.0, 1.0, 2.0])
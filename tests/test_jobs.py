@@ -0,0 +1,59 @@
+import threading
+import time
+
+from utils.jobs import JobExecutor
+
+
+class FakeWidget:
+    """Stands in for a Tk widget: after() only records the scheduled call."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, interval, func):
+        self.scheduled.append(func)
+
+
+def _wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_raising_callback_does_not_stop_delivery():
+    executor = JobExecutor(max_threads=1)
+    widget = FakeWidget()
+    executor.attach(widget, interval=1)
+    delivered = []
+
+    def fail(_):
+        raise RuntimeError("falha na interface")
+
+    executor.submit("a", lambda: 1, on_done=fail)
+    executor.submit("b", lambda: 2, on_done=delivered.append)
+    _wait_until(lambda: executor._callbacks.qsize() == 2)
+    widget.scheduled.pop()()
+    assert delivered == [2]
+    # Polling goes on after the failure
+    assert len(widget.scheduled) == 1
+
+    executor.submit("c", lambda: 3, on_done=delivered.append)
+    _wait_until(lambda: executor._callbacks.qsize() == 1)
+    widget.scheduled.pop()()
+    assert delivered == [2, 3]
+    executor.shutdown()
+
+
+def test_latest_job_per_key_wins():
+    executor = JobExecutor(max_threads=1)
+    gate = threading.Event()
+    results = []
+    first = executor.submit("k", gate.wait, 5, on_done=results.append)
+    executor.submit("k", lambda: "novo", on_done=results.append)
+    gate.set()
+    _wait_until(lambda: results)
+    time.sleep(0.05)
+    assert first.cancelled
+    assert results == ["novo"]
+    executor.shutdown()
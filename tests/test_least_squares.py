@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from numcalc.least_squares import (TWO_PI, StreamingLeastSquares, design_matrix, fit, fit_stream, fourier_fit_fft,
+                                   uniform_periods)
+from numcalc.matrix_io import iter_xy_chunks
+
+
+def test_uniform_periods_accepts_linspace_grids():
+    for n in (16, 1000, 1_000_000):
+        x = np.linspace(0, 3 * 2 * np.pi, n, endpoint=False)
+        assert uniform_periods(x, 2 * np.pi) == 3
+
+
+def test_uniform_periods_tolerance_does_not_grow_with_n():
+    n = 100_000
+    x = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    h = x[1] - x[0]
+    x[n // 2] += 1e-3 * h
+    assert uniform_periods(x, 2 * np.pi) is None
+
+
+def test_uniform_periods_rejects_partial_periods():
+    x = np.linspace(0, 2.5 * 2 * np.pi, 500, endpoint=False)
+    assert uniform_periods(x, 2 * np.pi) is None
+
+
+@pytest.mark.parametrize("method, param", [("linear", 0), ("polynomial", 3), ("exponential", 0),
+                                           ("fourier", 2)])
+def test_streaming_fit_matches_batch_fit(method, param):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0.0, 3.0, 1000)
+    y = np.exp(0.4 * x) + 0.3 * np.sin(2 * x) + 0.01 * rng.standard_normal(1000)
+    stream = StreamingLeastSquares(method, param)
+    for start in range(0, 1000, 128):
+        stream.update(x[start:start + 128], y[start:start + 128])
+    batch = fit(x, y, method, param)
+    streamed = stream.result()
+    assert np.allclose(streamed.coeffs, batch.coeffs)
+    y_lin = np.log(y) if method == "exponential" else y
+    A = design_matrix(x, method, param)
+    assert stream.residual_sum_of_squares == pytest.approx(np.sum((A @ batch.coeffs - y_lin)**2))
+    assert stream.n == 1000
+
+
+def test_streaming_fit_needs_enough_points():
+    stream = StreamingLeastSquares("polynomial", 3)
+    stream.update([0.0, 1.0], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        stream.result()
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".npy"])
+def test_fit_stream_reads_file_in_chunks(tmp_path, suffix):
+    x = np.linspace(0.0, 1.0, 1001)
+    data = np.column_stack([x, 2.0 - 3.0 * x])
+    path = str(tmp_path / f"data{suffix}")
+    if suffix == ".csv":
+        np.savetxt(path, data, delimiter=",", header="x,y", comments="")
+    else:
+        np.save(path, data)
+    fractions = []
+    stream = fit_stream(iter_xy_chunks(path, chunk_rows=100), "linear", progress=fractions.append)
+    assert stream.n == 1001
+    assert np.allclose(stream.result().coeffs, [2.0, -3.0])
+    assert len(fractions) == 11
+    assert fractions[-1] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("period, x0", [(TWO_PI, 0.0), (TWO_PI, -1.3), (2.5, 0.7)])
+def test_fourier_fft_fit_matches_normal_equations(period, x0):
+    n, harmonics = 600, 4
+    x = x0 + np.linspace(0.0, 3 * period, n, endpoint=False)
+    w = TWO_PI / period
+    y = 1.5 + np.cos(w * x) - 0.5 * np.sin(3 * w * x) + 0.2 * np.cos(7 * w * x)
+    result = fourier_fit_fft(x, y, harmonics, period)
+    assert result is not None and result.A is None
+    A = design_matrix(x, "fourier", harmonics, period)
+    assert np.allclose(result.coeffs, np.linalg.lstsq(A, y, rcond=None)[0])
+    assert np.allclose(result.AtA, A.T @ A)
+    # fit() takes the FFT path on this grid, and the order of the samples does not matter
+    order = np.random.default_rng(0).permutation(n)
+    assert np.allclose(fit(x[order], y[order], "fourier", harmonics, period).coeffs, result.coeffs)
+
+
+def test_fourier_fft_fit_not_applicable():
+    x = np.linspace(0.0, TWO_PI, 50, endpoint=False)
+    # Too many harmonics for the samples, and a non-uniform grid
+    assert fourier_fit_fft(x, np.sin(x), 25) is None
+    assert fourier_fit_fft(x**1.1, np.sin(x), 3) is None
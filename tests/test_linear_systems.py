@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from numcalc.linear_systems import (EliminationLog, back_substitution, gauss_elimination, lu_factor,
+                                    solve_batched)
+
+
+def _system(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n, n)) + n * np.eye(n), rng.standard_normal(n)
+
+
+def test_gauss_elimination_matches_numpy():
+    A, b = _system(12)
+    for pivoting in (True, False):
+        result = gauss_elimination(A, b, pivoting=pivoting)
+        assert np.allclose(result.x, np.linalg.solve(A, b))
+
+
+def test_log_replay_reaches_upper_triangular_matrix():
+    A, b = _system(6)
+    log = gauss_elimination(A, b).log
+    *_, (_, M) = log.steps()
+    assert np.allclose(np.tril(M[:, :6], -1), 0)
+    assert np.allclose(log._fast_forward(len(log)), M)
+    assert not log.truncated
+
+
+def test_log_is_capped():
+    A, b = _system(60)
+    log = EliminationLog(np.hstack([A, b[:, None]]), limit=100)
+    result = gauss_elimination(A, b)
+    for op, k, row, factor in result.log.trace:
+        if op == 0:
+            log.swap(k, row)
+        else:
+            log.eliminate(k, np.array([factor]))
+    assert len(log) == 100
+    assert log.truncated
+    # The kept operations still replay page by page
+    assert len(list(log.steps(90))) == 10
+
+
+def test_progress_is_reported_once_per_percent():
+    A, b = _system(500)
+    reports = []
+    gauss_elimination(A, b, progress=reports.append, trace=False)
+    assert len(reports) == 100
+    assert reports[-1] == 1.0
+
+
+def test_lu_factor_solves_several_right_hand_sides():
+    A, _ = _system(8)
+    B = np.random.default_rng(1).standard_normal((8, 4))
+    lu = lu_factor(A)
+    assert np.allclose(lu.solve(B), np.linalg.solve(A, B))
+    for j in range(4):
+        assert np.allclose(lu.solve(B[:, j]), np.linalg.solve(A, B[:, j]))
+
+
+def test_lu_factor_pivots_zero_leading_entry():
+    A = np.array([[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [3.0, 0.0, 1.0]])
+    b = np.array([1.0, 2.0, 3.0])
+    lu = lu_factor(A)
+    assert np.allclose(lu.L @ lu.U, A[lu.perm])
+    assert np.allclose(lu.solve(b), np.linalg.solve(A, b))
+    with pytest.raises(ValueError):
+        lu_factor(A, pivoting=False)
+
+
+def test_gauss_elimination_returns_reusable_factorization():
+    A, b = _system(7)
+    result = gauss_elimination(A, b)
+    b2 = np.arange(7.0)
+    assert np.allclose(result.lu.solve(b2), np.linalg.solve(A, b2))
+    *_, (_, M) = result.log.with_rhs(b2).steps()
+    assert np.allclose(back_substitution(M[:, :7], M[:, -1]), np.linalg.solve(A, b2))
+
+
+def test_solve_batched_matches_numpy():
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((50, 4, 4))
+    A[:, 0, 0] = 0.0
+    B = rng.standard_normal((50, 4))
+    assert np.allclose(solve_batched(A, B), np.linalg.solve(A, B[:, :, None])[:, :, 0])
+    B3 = rng.standard_normal((50, 4, 2))
+    assert np.allclose(solve_batched(A, B3), np.linalg.solve(A, B3))
+
+
+def test_log_pages_concatenate_to_whole_text():
+    A, b = _system(9)
+    A[0, 0] = 0.0 # forces a pivot swap
+    log = gauss_elimination(A, b).log
+    whole = log.format()
+    assert "Troca" in whole
+    assert "".join(log.format(start, start + 7) for start in range(0, len(log), 7)) == whole
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+import scipy.io
+import scipy.sparse as sp
+
+from numcalc.matrix_io import load_system, save_system
+
+
+def test_load_sparse_augmented_matrix_market(tmp_path):
+    A = sp.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(5, 5))
+    b = np.arange(1.0, 6.0)
+    path = tmp_path / "system.mtx"
+    scipy.io.mmwrite(str(path), sp.hstack([A, sp.csr_matrix(b[:, None])]))
+
+    A_loaded, b_loaded, x0 = load_system(str(path))
+    assert sp.issparse(A_loaded)
+    assert np.allclose(A_loaded.toarray(), A.toarray())
+    assert b_loaded.shape == (5,)
+    assert np.allclose(b_loaded, b)
+    assert x0 is None
+
+
+def test_load_dense_augmented_csv(tmp_path):
+    path = tmp_path / "system.csv"
+    np.savetxt(path, [[2.0, 1.0, 3.0], [1.0, 3.0, 5.0]], delimiter=",")
+    A, b, _ = load_system(str(path))
+    assert np.allclose(A, [[2.0, 1.0], [1.0, 3.0]])
+    assert np.allclose(b, [3.0, 5.0])
+
+
+def test_save_system_round_trips_npz(tmp_path):
+    A = np.array([[4.0, 1.0], [1.0, 3.0]])
+    b = np.array([1.0, 2.0])
+    x0 = np.array([0.5, 0.5])
+    path = str(tmp_path / "system.npz")
+    save_system(path, A, b, x0)
+    A_loaded, b_loaded, x0_loaded = load_system(path)
+    assert np.array_equal(A_loaded, A)
+    assert np.array_equal(b_loaded, b)
+    assert np.array_equal(x0_loaded, x0)
+
+
+def test_save_system_round_trips_sparse_mtx(tmp_path):
+    A = sp.random(30, 30, density=0.1, random_state=0, format="csr") + sp.eye(30)
+    b = np.linspace(-1.0, 1.0, 30)
+    path = str(tmp_path / "system.mtx")
+    save_system(path, A, b)
+    A_loaded, b_loaded, x0 = load_system(path)
+    assert sp.issparse(A_loaded)
+    assert np.allclose(A_loaded.toarray(), A.toarray())
+    assert np.allclose(b_loaded, b)
+    assert x0 is None
+    with pytest.raises(ValueError):
+        save_system(str(tmp_path / "system.npz"), A, b)
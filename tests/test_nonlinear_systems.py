@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from numcalc.expressions import compile_system
+from numcalc.nonlinear_systems import color_columns, finite_difference_jacobian, newton_system
+
+
+def _bratu(x):
+    """Discretized 1-D Bratu-like problem: tridiagonal Jacobian."""
+    n = len(x)
+    h2 = 1.0 / (n + 1)**2
+    padded = np.concatenate([[0.0], x, [0.0]])
+    return 2 * x - padded[:-2] - padded[2:] - h2 * np.exp(x)
+
+
+def _bratu_sparsity(n):
+    return sp.diags([1, 1, 1], [-1, 0, 1], shape=(n, n), format="csr", dtype=bool)
+
+
+def test_color_columns_of_banded_pattern():
+    colors = color_columns(_bratu_sparsity(200))
+    assert colors.max() + 1 == 3
+    # Columns sharing a row never share a color
+    pattern = _bratu_sparsity(200).tocoo()
+    for i in range(200):
+        cols = pattern.col[pattern.row == i]
+        assert len(set(colors[cols])) == len(cols)
+
+
+def test_colored_jacobian_matches_dense():
+    x = np.linspace(0.1, 0.9, 50)
+    dense = finite_difference_jacobian(_bratu, x)
+    sparse = finite_difference_jacobian(_bratu, x, sparsity=_bratu_sparsity(50))
+    assert sp.issparse(sparse)
+    assert np.allclose(sparse.toarray(), dense, atol=1e-6)
+
+
+@pytest.mark.parametrize("broyden", [False, True])
+def test_newton_system_with_sparse_finite_differences(broyden):
+    n = 100
+    result = newton_system(_bratu, np.zeros(n), tol=1e-12, sparsity=_bratu_sparsity(n), broyden=broyden)
+    assert result.converged
+    assert np.max(np.abs(_bratu(result.x))) < 1e-10
+    # Three evaluations per colored Jacobian instead of n
+    assert result.function_evals <= len(result.iterations) + 1 + 3 * result.jacobian_evals
+
+
+def test_broyden_evaluates_fewer_jacobians():
+    system = compile_system(["x**2 + y**2 - 4", "exp(x) + y - 1"])
+    x0 = [1.0, -1.5]
+    newton = newton_system(system, x0, system.jacobian())
+    broyden = newton_system(system, x0, system.jacobian(), broyden=True)
+    assert newton.converged and broyden.converged
+    assert np.allclose(newton.x, broyden.x, atol=1e-7)
+    assert broyden.jacobian_evals < newton.jacobian_evals
+    assert np.max(np.abs(system(broyden.x))) < 1e-7
+
+
+def test_newton_system_with_sparse_symbolic_jacobian():
+    n = 30
+    equations = [f"3*x{i} - x{i}**3/10 - 1" + (f" - x{i - 1}" if i > 1 else "") + (f" - x{i + 1}" if i < n else "")
+                 for i in range(1, n + 1)]
+    system = compile_system(equations)
+    result = newton_system(system, np.zeros(n), system.jacobian(sparse=True), tol=1e-12)
+    assert result.converged
+    assert np.max(np.abs(system(result.x))) < 1e-10
+
+
+def test_newton_system_reports_singular_jacobian():
+    result = newton_system(lambda v: np.array([v[0] + v[1] - 1, 2 * v[0] + 2 * v[1] - 3]), [0.0, 0.0],
+                           lambda v: np.array([[1.0, 1.0], [2.0, 2.0]]))
+    assert not result.converged and result.singular
+
+
+def test_newton_system_rejects_non_square_system():
+    with pytest.raises(ValueError):
+        newton_system(lambda v: np.array([v[0] - 1]), [0.0, 0.0])
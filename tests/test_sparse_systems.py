@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from numcalc.sparse_systems import (bandwidth, conjugate_gradient, gauss_seidel, jacobi, solve_banded, sor,
+                                    thomas, tridiagonal_diagonals)
+
+
+def _poisson(n):
+    """SPD, diagonally dominant tridiagonal matrix of the 1-D Poisson problem (plus a shift)."""
+    return sp.diags([-1.0, 2.5, -1.0], [-1, 0, 1], shape=(n, n), format="csr")
+
+
+def test_bandwidth():
+    A = sp.diags([1.0, 1.0, 1.0, 1.0], [-2, 0, 1, 3], shape=(8, 8))
+    assert bandwidth(A) == (2, 3)
+    assert bandwidth(np.eye(4)) == (0, 0)
+
+
+def test_thomas_matches_numpy():
+    A = _poisson(50)
+    b = np.linspace(1.0, 2.0, 50)
+    x = thomas(*tridiagonal_diagonals(A), b)
+    assert np.allclose(x, np.linalg.solve(A.toarray(), b))
+
+
+def test_tridiagonal_diagonals_rejects_wider_band():
+    with pytest.raises(ValueError):
+        tridiagonal_diagonals(sp.diags([1.0, 4.0, 1.0], [-2, 0, 1], shape=(5, 5)))
+
+
+def test_solve_banded_matches_numpy():
+    rng = np.random.default_rng(0)
+    A = sp.diags([rng.standard_normal(38), rng.standard_normal(40) + 6.0, rng.standard_normal(39),
+                  rng.standard_normal(37)], [-2, 0, 1, 3], shape=(40, 40)).toarray()
+    b = rng.standard_normal(40)
+    assert np.allclose(solve_banded(A, b), np.linalg.solve(A, b))
+
+
+@pytest.mark.parametrize("solve", [jacobi, gauss_seidel, lambda A, b, **kw: sor(A, b, 1.3, **kw),
+                                   conjugate_gradient])
+def test_iterative_solvers_converge(solve):
+    A = _poisson(30)
+    b = np.ones(30)
+    result = solve(A, b, tol=1e-10, max_iter=2000)
+    assert result.converged
+    assert np.allclose(result.x, np.linalg.solve(A.toarray(), b), atol=1e-8)
+    assert result.residuals[-1] < 1e-10
+    assert len(result.residuals) == result.iterations + 1
+
+
+def test_gauss_seidel_needs_fewer_iterations_than_jacobi():
+    A, b = _poisson(30), np.ones(30)
+    assert gauss_seidel(A, b, tol=1e-8).iterations < jacobi(A, b, tol=1e-8).iterations
+
+
+def test_iterative_solvers_reject_bad_input():
+    with pytest.raises(ValueError):
+        jacobi(np.array([[0.0, 1.0], [1.0, 2.0]]), np.ones(2))
+    with pytest.raises(ValueError):
+        sor(np.eye(2), np.ones(2), omega=2.0)
+    with pytest.raises(ValueError):
+        conjugate_gradient(np.array([[1.0, 0.0], [0.0, -1.0]]), np.ones(2))
@@ -0,0 +1,52 @@
+import numpy as np
+
+from numcalc.trace import IterationTrace
+
+COLUMNS = [("n", "n", "3d"), ("x", "x_n", "12.6f"), ("error", "Erro", ".2e")]
+
+
+def _trace(rows):
+    trace = IterationTrace(COLUMNS, capacity=2)
+    for n in range(rows):
+        trace.append(n, n / 3, 10.0**-n)
+    return trace
+
+
+def test_append_grows_past_capacity():
+    trace = _trace(100)
+    assert len(trace) == 100
+    assert trace.data.dtype["n"] == np.int64
+    assert np.array_equal(trace["n"], np.arange(100))
+    assert list(trace)[3] == (3, 1.0, 1e-3)
+
+
+def test_extend_broadcasts_scalars():
+    trace = _trace(2)
+    trace.extend(7, np.array([0.5, 0.25, 0.125]), 0.0)
+    assert len(trace) == 5
+    assert list(trace["n"][2:]) == [7, 7, 7]
+    assert list(trace["x"][2:]) == [0.5, 0.25, 0.125]
+
+
+def test_format_pages_match_whole_table():
+    trace = _trace(25)
+    whole = trace.format().splitlines()
+    header, rows = whole[:2], whole[2:]
+    assert len(rows) == 25
+    pages = [trace.format(start, start + 10).splitlines() for start in range(0, 25, 10)]
+    assert all(page[:2] == header for page in pages)
+    assert sum((page[2:] for page in pages), []) == rows
+    assert trace.format(10, 20, header=False).splitlines() == rows[10:20]
+    assert rows[1].split("|")[1].strip() == "0.333333"
+
+
+def test_save_csv_and_npz(tmp_path):
+    trace = _trace(12)
+    trace.save(str(tmp_path / "trace.csv"))
+    csv = np.genfromtxt(tmp_path / "trace.csv", delimiter=",", names=True)
+    assert csv.dtype.names == ("n", "x", "error")
+    assert np.array_equal(csv["x"], trace["x"])
+    trace.save(str(tmp_path / "trace.npz"))
+    with np.load(tmp_path / "trace.npz") as data:
+        assert np.array_equal(data["error"], trace["error"])
+        assert data["n"].dtype == np.int64
@@ -0,0 +1,77 @@
+import numpy as np
+
+from numcalc.zeros import (bisection, bisection_batch, brent, find_all_roots, illinois, ridders,
+                           safeguarded_newton)
+
+
+def test_safeguarded_newton_multiple_root_at_midpoint():
+    # x = 0 is the first midpoint, where f and f' both vanish
+    result = safeguarded_newton(lambda x: x**3, lambda x: 3 * x**2, -1.0, 1.0, 1e-10)
+    assert result.converged
+    assert result.root == 0.0
+
+
+def test_safeguarded_newton_zero_derivative_takes_bisection_step():
+    # f'(0) = 0 at the first midpoint of [-1, 2], which is not a root
+    result = safeguarded_newton(lambda x: x**3 - 1, lambda x: 3 * x**2, -1.0, 2.0, 1e-12)
+    assert result.converged
+    assert abs(result.root - 1.0) < 1e-8
+
+
+def test_bracketing_methods_beat_bisection_count():
+    f = lambda x: x**3 - x - 2
+    for method in (brent, illinois, ridders):
+        result = method(f, 1.0, 2.0, 1e-10)
+        assert result.converged
+        assert abs(f(result.root)) < 1e-8
+        assert result.function_evals < 20
+
+
+def test_bisection_batch_solves_several_brackets():
+    result = bisection_batch(np.sin, [-1.0, 3.0, 6.0, 9.0], [0.5, 4.0, 7.0, 10.0], 1e-12)
+    assert result.converged.all()
+    assert np.allclose(result.roots, [0.0, np.pi, 2 * np.pi, 3 * np.pi], atol=1e-11)
+
+
+def test_bisection_batch_without_sign_change():
+    result = bisection_batch(np.cos, [0.0, 2.0, 1.0], [1.0, 3.0, 2.0], 1e-10)
+    assert list(result.converged) == [False, False, True]
+    assert np.isnan(result.roots[:2]).all()
+    assert result.iterations[0] == 0
+    assert abs(result.roots[2] - np.pi / 2) < 1e-9
+
+
+def test_bisection_batch_matches_scalar_bisection():
+    f = lambda x: x**3 - 2 * x - 5
+    a, b = np.array([2.0, 1.5, 0.0]), np.array([3.0, 2.5, 4.0])
+    result = bisection_batch(f, a, b, 1e-6)
+    for i in range(3):
+        scalar = bisection(f, a[i], b[i], 1e-6)
+        assert result.roots[i] == scalar.root
+        assert result.iterations[i] == len(scalar.iterations)
+
+
+def test_bisection_batch_endpoint_roots():
+    result = bisection_batch(lambda x: x * (x - 2), [0.0, 1.0], [1.0, 2.0], 1e-10)
+    assert result.converged.all()
+    assert list(result.roots) == [0.0, 2.0]
+    assert list(result.iterations) == [0, 0]
+
+
+def test_find_all_roots_of_sin():
+    result = find_all_roots(np.sin, -10.0, 10.0, 1e-10, samples=2001)
+    assert np.allclose(result.roots, np.pi * np.arange(-3, 4), atol=1e-9)
+
+
+def test_find_all_roots_of_polynomial_with_double_root():
+    # (x + 2)(x - 1)^2 (x - 3): the double root at 1 does not change sign
+    f = lambda x: (x + 2) * (x - 1)**2 * (x - 3)
+    result = find_all_roots(f, -5.0, 5.0, 1e-8, samples=1000)
+    assert np.allclose(result.roots, [-2.0, 1.0, 3.0], atol=1e-6)
+    assert result.brackets == 2
+    assert result.touching == 1
+
+
+def test_find_all_roots_skips_poles():
+    result = find_all_roots(lambda x: 1 / x, -1.0, 1.0, 1e-10, samples=1000)
+    assert result.roots.size == 0
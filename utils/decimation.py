@@ -0,0 +1,85 @@
+import numpy as np
+
+
+def lttb(x, y, n_out):
+    """Indices of n_out points of the polyline (x, y) chosen by Largest-Triangle-Three-Buckets.
+
+    x must be sorted. The first and last points are always kept; from each
+    bucket in between, the point forming the largest triangle with the
+    previous pick and the mean of the next bucket, which preserves peaks.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    picks = np.empty(n_out, dtype=np.int64)
+    picks[0], picks[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+        bx, by = x[start:end], y[start:end]
+        # Twice the triangle areas, up to sign
+        area = np.abs((x[prev] - next_x) * (by - y[prev]) - (x[prev] - bx) * (next_y - y[prev]))
+        prev = start + int(np.argmax(area)) if len(area) else start
+        picks[i + 1] = prev
+    return picks
+
+
+def decimate_line(x, y, xlim=None, n_out=2000):
+    """(x, y) reduced for drawing as a line within xlim (sorted x).
+
+    Points outside xlim are dropped except one on each side, so the line
+    still reaches the edges of the view.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if xlim is not None:
+        lo = max(np.searchsorted(x, xlim[0], side="left") - 1, 0)
+        hi = min(np.searchsorted(x, xlim[1], side="right") + 1, len(x))
+        x, y = x[lo:hi], y[lo:hi]
+    keep = lttb(x, y, n_out)
+    return x[keep], y[keep]
+
+
+def decimate_points(x, y, xlim=None, ylim=None, width=800, height=600):
+    """(x, y) reduced to at most one point per screen pixel of the view.
+
+    Points are binned on a width x height grid over xlim x ylim (default:
+    the data bounds) and the first point of each occupied cell is kept, so
+    isolated outliers survive; the extremes in x and y are always kept.
+    Runs in O(n) with no sort.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if len(x) == 0:
+        return x, y
+    if xlim is None:
+        xlim = (x.min(), x.max())
+    if ylim is None:
+        ylim = (y.min(), y.max())
+    width, height = max(int(width), 1), max(int(height), 1)
+
+    inside = (x >= xlim[0]) & (x <= xlim[1]) & (y >= ylim[0]) & (y <= ylim[1])
+    idx = np.flatnonzero(inside)
+    if len(idx) <= width * height // 4:
+        # Already sparse on screen
+        return x[idx], y[idx]
+
+    span_x = (xlim[1] - xlim[0]) or 1.0
+    span_y = (ylim[1] - ylim[0]) or 1.0
+    col = np.minimum(((x[idx] - xlim[0]) / span_x * width).astype(np.int64), width - 1)
+    row = np.minimum(((y[idx] - ylim[0]) / span_y * height).astype(np.int64), height - 1)
+    first = np.full(width * height, -1, dtype=np.int64)
+    # Reversed so that the earliest point of each cell is the one written last
+    first[(row * width + col)[::-1]] = idx[::-1]
+    keep = first[first >= 0]
+    extremes = idx[[np.argmin(x[idx]), np.argmax(x[idx]), np.argmin(y[idx]), np.argmax(y[idx])]]
+    keep = np.union1d(keep, extremes)
+    return x[keep], y[keep]
@@ -1,58 +1,97 @@
-import struct
+from collections import namedtuple
+
+import numpy as np
+
+FloatFormat = namedtuple("FloatFormat", "bits exponent_bits mantissa_bits")
+
+FORMATS = {
+    "half": FloatFormat(16, 5, 10),
+    "bfloat16": FloatFormat(16, 8, 7),
+    "single": FloatFormat(32, 8, 23),
+    "double": FloatFormat(64, 11, 52),
+}
+
+_UINT = {16: np.uint16, 32: np.uint32, 64: np.uint64}
+
+
+def _bfloat16_bits(values):
+    """bfloat16 bit patterns of values, rounded to nearest even."""
+    values = np.asarray(values)
+    if values.dtype != np.float32:
+        # Round to 7 mantissa bits in double first, so float32 sees no extra rounding
+        v = np.array(values, dtype=np.float64)
+        u = v.view(np.uint64)
+        u = (u + ((u >> np.uint64(45)) & np.uint64(1)) + np.uint64((1 << 44) - 1)) & ~np.uint64((1 << 45) - 1)
+        rounded = np.where(np.isnan(v), v, u.view(np.float64))
+        # Below 2^-126 bfloat16 is subnormal: round to its fixed spacing 2^-133 instead
+        tiny = np.abs(v) < 2.0**-126
+        rounded[tiny] = np.round(v[tiny] * 2.0**133) * 2.0**-133
+        with np.errstate(over="ignore"):
+            values = rounded.astype(np.float32)
+    u = values.view(np.uint32)
+    rounded = (u + ((u >> np.uint32(16)) & np.uint32(1)) + np.uint32(0x7FFF)) >> np.uint32(16)
+    nan_bits = (u >> np.uint32(16)) | np.uint32(0x0040) # quiet NaN, sign kept
+    return np.where(np.isnan(values), nan_bits, rounded).astype(np.uint16)
+
+
+def to_bits(values, precision="double"):
+    """Bit patterns of values rounded to the given format, as unsigned integers.
+
+    Arrays already in the format's dtype are viewed without copying.
+    """
+    values = np.asarray(values)
+    if precision == "bfloat16":
+        return _bfloat16_bits(values)
+    dtype = {"half": np.float16, "single": np.float32, "double": np.float64}[precision]
+    with np.errstate(over="ignore"):
+        stored = values if values.dtype == dtype else values.astype(dtype)
+    return stored.view(_UINT[FORMATS[precision].bits])
+
+
+def from_bits(bits, precision="double"):
+    """Values of the given bit patterns, as float64."""
+    bits = np.asarray(bits)
+    if precision == "bfloat16":
+        return (bits.astype(np.uint32) << np.uint32(16)).view(np.float32).astype(np.float64)
+    dtype = {"half": np.float16, "single": np.float32, "double": np.float64}[precision]
+    return bits.astype(_UINT[FORMATS[precision].bits]).view(dtype).astype(np.float64)
+
+
+def fields(bits, precision="double"):
+    """(sign, biased exponent, mantissa) fields of bit patterns, by shifts and masks."""
+    fmt = FORMATS[precision]
+    uint = _UINT[fmt.bits]
+    bits = np.asarray(bits, dtype=uint)
+    mantissa = bits & uint((1 << fmt.mantissa_bits) - 1)
+    exponent = (bits >> uint(fmt.mantissa_bits)) & uint((1 << fmt.exponent_bits) - 1)
+    sign = bits >> uint(fmt.bits - 1)
+    return sign, exponent, mantissa
+
 
 def get_binary(num, precision='single'):
     """Converts a float to its IEEE 754 binary representation."""
-    if precision == 'single':
-        # Pack as 32-bit float (big-endian)
-        packed = struct.pack('>f', num)
-        # Unpack as an integer to easily convert to binary
-        integer_val = struct.unpack('>I', packed)[0]
-        # Format as a 32-bit binary string, zero-padded
-        return format(integer_val, '032b')
-    elif precision == 'double':
-        # Pack as 64-bit float (big-endian)
-        packed = struct.pack('>d', num)
-        # Unpack as a long long
-        integer_val = struct.unpack('>Q', packed)[0]
-        # Format as a 64-bit binary string, zero-padded
-        return format(integer_val, '064b')
-    return ""
+    if precision not in FORMATS:
+        return ""
+    return format(int(to_bits(np.float64(num), precision)), f"0{FORMATS[precision].bits}b")
+
 
 def get_float_details(num_str):
     """
-    Analyzes a float string and returns its single and double precision
-    IEEE 754 representations and details.
+    Analyzes a float string and returns its IEEE 754 representation and
+    details in each of FORMATS.
     """
     try:
         num = float(num_str)
     except (ValueError, TypeError):
         return None
 
-    # Single Precision (32-bit)
-    bin32 = get_binary(num, 'single')
-    sign32 = bin32[0]
-    exponent32 = bin32[1:9]
-    mantissa32 = bin32[9:]
-    reconstructed32 = struct.unpack('>f', struct.pack('>I', int(bin32, 2)))[0]
-
-    # Double Precision (64-bit)
-    bin64 = get_binary(num, 'double')
-    sign64 = bin64[0]
-    exponent64 = bin64[1:12]
-    mantissa64 = bin64[12:]
-    reconstructed64 = struct.unpack('>d', struct.pack('>Q', int(bin64, 2)))[0]
-
-    return {
-        "single": {
-            "sign": sign32,
-            "exponent": exponent32,
-            "mantissa": mantissa32,
-            "reconstructed": reconstructed32
-        },
-        "double": {
-            "sign": sign64,
-            "exponent": exponent64,
-            "mantissa": mantissa64,
-            "reconstructed": reconstructed64
+    details = {}
+    for precision, fmt in FORMATS.items():
+        bits = get_binary(num, precision)
+        details[precision] = {
+            "sign": bits[0],
+            "exponent": bits[1:1 + fmt.exponent_bits],
+            "mantissa": bits[1 + fmt.exponent_bits:],
+            "reconstructed": float(from_bits(int(bits, 2), precision)),
         }
-    }
\ No newline at end of file
+    return details
@@ -0,0 +1,184 @@
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when it notices it was cancelled."""
+
+
+class Job:
+    """Handle of a submitted computation.
+
+    Jobs that accept a job argument can call report_progress, which also
+    raises JobCancelled once the job has been cancelled.
+    """
+
+    def __init__(self, key, executor):
+        self.key = key
+        self._executor = executor
+        self._cancelled = threading.Event()
+        self.future = None
+        self.on_progress = None
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled(self.key)
+
+    def report_progress(self, fraction, message=""):
+        """Sends (fraction, message) to the on_progress callback on the UI thread."""
+        self.check_cancelled()
+        if self.on_progress is not None:
+            self._executor.dispatch(self, self.on_progress, fraction, message)
+
+
+class JobExecutor:
+    """Runs computations on a thread pool and hands results back to the UI thread.
+
+    Submitting a job under a key cancels the previous job with that key, so
+    the newest request of each frame wins. Once attached to a Tk widget,
+    callbacks are queued and run from its event loop through after();
+    otherwise they run on the worker thread. Work that must be killable
+    (sympy.integrate) manages its own process, see symbolic_integral.
+    """
+
+    def __init__(self, max_threads=4):
+        self._threads = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="job")
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._callbacks = queue.SimpleQueue()
+        self._widget = None
+        self._interval = 50
+
+    def attach(self, widget, interval=50):
+        """Delivers callbacks on widget's Tk thread, polling every interval ms."""
+        self._widget = widget
+        self._interval = interval
+        widget.after(interval, self._drain)
+
+    def _drain(self):
+        try:
+            while True:
+                try:
+                    callback, args = self._callbacks.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(*args)
+                except Exception:
+                    # One failing callback must not hold back the others
+                    logger.exception("Falha em callback de job")
+        finally:
+            if self._widget is not None:
+                self._widget.after(self._interval, self._drain)
+
+    def dispatch(self, job, callback, *args):
+        """Runs callback(*args) on the UI thread unless job is no longer the latest for its key."""
+        def guarded(*args):
+            if self._latest.get(job.key) is job and not job.cancelled:
+                callback(*args)
+
+        if self._widget is None:
+            guarded(*args)
+        else:
+            self._callbacks.put((guarded, args))
+
+    def submit(self, key, func, *args, on_done=None, on_error=None, on_progress=None,
+               pass_job=False, **kwargs):
+        """Runs func(*args, **kwargs) in the background and returns its Job.
+
+        on_done(result) and on_error(exception) run on the UI thread. With
+        pass_job=True the function also receives job=<Job> for progress and
+        cancellation.
+        """
+        job = Job(key, self)
+        job.on_progress = on_progress
+        with self._lock:
+            previous = self._latest.get(key)
+            if previous is not None:
+                previous.cancel()
+            self._latest[key] = job
+
+        if pass_job:
+            kwargs["job"] = job
+
+        job.future = self._threads.submit(func, *args, **kwargs)
+
+        def finished(future):
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is None:
+                if on_done is not None:
+                    self.dispatch(job, on_done, future.result())
+            elif not isinstance(error, JobCancelled) and on_error is not None:
+                self.dispatch(job, on_error, error)
+
+        job.future.add_done_callback(finished)
+        return job
+
+    def cancel(self, key):
+        """Cancels the latest job submitted under key, if any."""
+        with self._lock:
+            job = self._latest.pop(key, None)
+        if job is not None:
+            job.cancel()
+
+    def shutdown(self):
+        self._widget = None
+        for job in list(self._latest.values()):
+            job.cancel()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """The JobExecutor shared by all frames."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = JobExecutor()
+        return _executor
+
+
+def run_for_textbox(key, textbox, compute, show, busy_text="Calculando...", with_progress=False):
+    """Runs compute() on the shared executor and show(result) on the UI thread.
+
+    textbox displays busy_text meanwhile, and "Erro: ..." if either step fails.
+    With with_progress=True compute receives job=<Job> and its progress
+    reports are shown as a percentage next to busy_text.
+    """
+    def show_error(e):
+        textbox.delete("1.0", "end")
+        textbox.insert("1.0", f"Erro: {e}")
+
+    def show_or_error(result):
+        try:
+            show(result)
+        except Exception as e:
+            show_error(e)
+
+    def show_progress(fraction, message):
+        textbox.delete("1.0", "end")
+        textbox.insert("1.0", f"{busy_text} {fraction:.0%} {message}")
+
+    textbox.delete("1.0", "end")
+    textbox.insert("1.0", busy_text)
+    return get_executor().submit(key, compute, on_done=show_or_error, on_error=show_error,
+                                 on_progress=show_progress if with_progress else None,
+                                 pass_job=with_progress)
@@ -0,0 +1,29 @@
+import os
+import sys
+import time
+
+# Clock starts when this module is first imported, so import it before anything heavy
+_START = time.perf_counter()
+_marks = []
+
+
+def mark(label):
+    """Records the time elapsed since startup under label."""
+    _marks.append((label, time.perf_counter() - _START))
+
+
+def report():
+    """Formats the recorded marks, one per line, with the delta from the previous one."""
+    lines = ["Startup report (ms):"]
+    previous = 0.0
+    for label, elapsed in _marks:
+        lines.append(f"  {label:<32} {elapsed*1000:9.1f}  (+{(elapsed - previous)*1000:.1f})")
+        previous = elapsed
+    heavy = [m for m in ("numpy", "sympy", "scipy", "matplotlib") if m in sys.modules]
+    lines.append(f"  heavy modules loaded: {', '.join(heavy) or 'none'}")
+    return "\n".join(lines)
+
+
+def enabled():
+    """The report is printed only when STARTUP_REPORT is set in the environment."""
+    return bool(os.environ.get("STARTUP_REPORT"))